@@ -7,12 +7,23 @@ import os
 import json
 import uuid
 import asyncio
+import logging
 import aiohttp
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = lambda obj: orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+logger = logging.getLogger(__name__)
+
 
 class AgentRole(Enum):
     """Role of the agent in communication"""
@@ -28,6 +39,12 @@ class MessageStatus(Enum):
     DELIVERED = "delivered"
     READ = "read"
     RESPONDED = "responded"
+    FAILED = "failed"
+
+
+# Value -> member maps for fast enum decoding in from_dict
+_ROLE_BY_VALUE = {r.value: r for r in AgentRole}
+_STATUS_BY_VALUE = {s.value: s for s in MessageStatus}
 
 
 @dataclass
@@ -50,8 +67,10 @@ class AgentCard:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AgentCard":
-        data["role"] = AgentRole(data["role"])
-        return cls(**data)
+        role = _ROLE_BY_VALUE.get(data["role"])
+        if role is None:
+            raise ValueError(f"{data['role']!r} is not a valid AgentRole")
+        return cls(**{**data, "role": role})
 
 
 @dataclass
@@ -74,8 +93,10 @@ class A2AMessage:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "A2AMessage":
-        data["status"] = MessageStatus(data["status"])
-        return cls(**data)
+        status = _STATUS_BY_VALUE.get(data["status"])
+        if status is None:
+            raise ValueError(f"{data['status']!r} is not a valid MessageStatus")
+        return cls(**{**data, "status": status})
 
 
 @dataclass
@@ -184,21 +205,105 @@ class A2AClient:
         self.discovered_agents: Dict[str, AgentCard] = {}
         self.conversations: Dict[str, Conversation] = {}
         self.session: Optional[aiohttp.ClientSession] = None
+        # Per-endpoint outbound buffers used when batching is enabled
+        self._batched: Dict[str, asyncio.Queue] = {}
+        self._batch_limits: Dict[str, int] = {}
+        self._batch_tasks: Dict[str, asyncio.Task] = {}
+        self._batch_stops: Dict[str, asyncio.Event] = {}
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(json_serialize=_json_dumps)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disable_batching()
         if self.session:
             await self.session.close()
+
+    async def enable_batching(self, endpoint: str, interval_ms: int = 20, max_batch: int = 64):
+        """
+        Buffer messages for an endpoint and send them as JSON-RPC batches.
+        The buffer is flushed every interval_ms or as soon as max_batch
+        messages are waiting, whichever comes first.
+        """
+        if endpoint in self._batched:
+            return
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = asyncio.Event()
+        self._batched[endpoint] = queue
+        self._batch_limits[endpoint] = max_batch
+        self._batch_stops[endpoint] = stop
+        self._batch_tasks[endpoint] = asyncio.create_task(
+            self._batch_loop(endpoint, queue, interval_ms / 1000, max_batch, stop)
+        )
+
+    async def disable_batching(self, endpoint: str = None):
+        """Flush pending messages and stop batching (for one or all endpoints)"""
+        endpoints = [endpoint] if endpoint else list(self._batched)
+        for ep in endpoints:
+            # Signal the loop instead of cancelling it, so a batch it has
+            # already dequeued finishes sending
+            stop = self._batch_stops.pop(ep, None)
+            if stop:
+                stop.set()
+            task = self._batch_tasks.pop(ep, None)
+            if task:
+                await task
+            queue = self._batched.pop(ep, None)
+            max_batch = self._batch_limits.pop(ep, 64)
+            if queue:
+                while not queue.empty():
+                    await self._flush_batch(ep, queue, max_batch)
+
+    async def _batch_loop(
+        self, endpoint: str, queue: asyncio.Queue, interval: float, max_batch: int, stop: asyncio.Event
+    ):
+        """Background task that periodically drains an endpoint buffer until stopped"""
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            while not queue.empty():
+                await self._flush_batch(endpoint, queue, max_batch)
+
+    async def _flush_batch(self, endpoint: str, queue: asyncio.Queue, max_batch: int):
+        """
+        Send up to max_batch buffered messages as a single JSON-RPC batch.
+        Every dequeued message ends up DELIVERED or FAILED.
+        """
+        items = []
+        while not queue.empty() and len(items) < max_batch:
+            items.append(queue.get_nowait())
+        if not items:
+            return
+
+        delivered = False
+        if not self.session:
+            logger.error(f"Batch send to {endpoint} failed: client session is closed")
+        else:
+            try:
+                async with self.session.post(
+                    endpoint,
+                    json=[payload for payload, _ in items],
+                    headers={"Content-Type": "application/json"}
+                ) as response:
+                    delivered = response.status == 200
+                    if not delivered:
+                        logger.error(f"Batch send to {endpoint} failed: HTTP {response.status}")
+            except Exception as e:
+                logger.error(f"Batch send to {endpoint} failed: {e}")
+
+        status = MessageStatus.DELIVERED if delivered else MessageStatus.FAILED
+        for _, message in items:
+            message.status = status
             
     async def discover_agent(self, agent_url: str) -> Optional[AgentCard]:
         """Discover an agent via its Agent Card endpoint"""
         try:
             async with self.session.get(f"{agent_url}/.well-known/agent.json") as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = _json_loads(await response.read())
                     agent_card = AgentCard.from_dict(data)
                     self.discovered_agents[agent_card.agent_id] = agent_card
                     return agent_card
@@ -248,6 +353,14 @@ class A2AClient:
                     "params": message.to_dict(),
                     "id": str(uuid.uuid4())
                 }
+
+                queue = self._batched.get(endpoint)
+                if queue is not None:
+                    await queue.put((payload, message))
+                    max_batch = self._batch_limits[endpoint]
+                    if queue.qsize() >= max_batch:
+                        await self._flush_batch(endpoint, queue, max_batch)
+                    return message
                 
                 try:
                     async with self.session.post(
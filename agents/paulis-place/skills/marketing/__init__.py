@@ -1,16 +1,41 @@
 """
 Marketing Skills for Pauli's Place
+
+Skills are imported lazily (PEP 562) so that importing the package does not
+instantiate every module-level skill singleton.
 """
 
-from .ab_testing_setup import ABTestingSkill, skill as ab_testing_skill
-from .email_sequence import EmailSequenceSkill, skill as email_sequence_skill
-from .paid_ads import PaidAdsSkill, skill as paid_ads_skill
+import importlib
+
+_SKILLS = {
+    "ABTestingSkill": (".ab_testing_setup", "ABTestingSkill"),
+    "EmailSequenceSkill": (".email_sequence", "EmailSequenceSkill"),
+    "PaidAdsSkill": (".paid_ads", "PaidAdsSkill"),
+    "ab_testing_skill": (".ab_testing_setup", "skill"),
+    "email_sequence_skill": (".email_sequence", "skill"),
+    "paid_ads_skill": (".paid_ads", "skill"),
+}
+
+
+def __getattr__(name):
+    if name in _SKILLS:
+        module_name, attr = _SKILLS[name]
+        module = importlib.import_module(module_name, __name__)
+        value = getattr(module, attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SKILLS))
+
 
 __all__ = [
     "ABTestingSkill",
-    "EmailSequenceSkill", 
+    "EmailSequenceSkill",
     "PaidAdsSkill",
     "ab_testing_skill",
     "email_sequence_skill",
     "paid_ads_skill"
-]
\ No newline at end of file
+]
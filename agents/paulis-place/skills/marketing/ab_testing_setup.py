@@ -3,7 +3,9 @@ A/B Testing Setup Skill for Agent Zero
 Creates A/B test variants for marketing campaigns
 """
 
-from typing import Dict, Any, List
+import heapq
+from operator import attrgetter
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
 
@@ -18,6 +20,9 @@ class ABTestVariant:
     priority: int
 
 
+_PRIORITY = attrgetter("priority")
+
+
 class ABTestingSkill:
     """
     Skill for setting up A/B tests for marketing campaigns.
@@ -44,76 +49,90 @@ class ABTestingSkill:
     
     def create_hero_test(self, original: str, avatar: Dict[str, Any]) -> List[ABTestVariant]:
         """Create A/B test variants for hero section"""
-        variants = []
+        goal = avatar.get('goal', 'Business')
+        pain = avatar.get('pain_point', 'Manual Work')
+        identity = avatar.get('identity', 'Professionals')
         
-        # Variant A: Direct benefit focus
-        variants.append(ABTestVariant(
-            variant_id="hero_a",
-            element="hero_headline",
-            original=original,
-            variant=f"Transform Your {avatar.get('goal', 'Business')} in 30 Days",
-            hypothesis="Direct benefit messaging resonates more with action-oriented users",
-            priority=1
-        ))
+        return [
+            # Variant A: Direct benefit focus
+            ABTestVariant(
+                variant_id="hero_a",
+                element="hero_headline",
+                original=original,
+                variant=f"Transform Your {goal} in 30 Days",
+                hypothesis="Direct benefit messaging resonates more with action-oriented users",
+                priority=1
+            ),
         
-        # Variant B: Problem-solution focus
-        variants.append(ABTestVariant(
-            variant_id="hero_b",
-            element="hero_headline",
-            original=original,
-            variant=f"Stop Struggling with {avatar.get('pain_point', 'Manual Work')}. Start Winning.",
-            hypothesis="Problem-aware messaging attracts users who know their pain",
-            priority=2
-        ))
+            # Variant B: Problem-solution focus
+            ABTestVariant(
+                variant_id="hero_b",
+                element="hero_headline",
+                original=original,
+                variant=f"Stop Struggling with {pain}. Start Winning.",
+                hypothesis="Problem-aware messaging attracts users who know their pain",
+                priority=2
+            ),
         
-        # Variant C: Social proof focus
-        variants.append(ABTestVariant(
-            variant_id="hero_c",
-            element="hero_headline",
-            original=original,
-            variant=f"Join 10,000+ {avatar.get('identity', 'Professionals')} Who Transformed Their Results",
-            hypothesis="Social proof builds trust and reduces friction",
-            priority=3
-        ))
-        
-        return variants
+            # Variant C: Social proof focus
+            ABTestVariant(
+                variant_id="hero_c",
+                element="hero_headline",
+                original=original,
+                variant=f"Join 10,000+ {identity} Who Transformed Their Results",
+                hypothesis="Social proof builds trust and reduces friction",
+                priority=3
+            )
+        ]
     
     def create_cta_test(self, original: str, context: str) -> List[ABTestVariant]:
         """Create A/B test variants for CTA buttons"""
-        variants = []
+        return [
+            ABTestVariant(
+                variant_id="cta_a",
+                element="cta_button",
+                original=original,
+                variant="Start Free Trial",
+                hypothesis="Low-commitment language reduces friction",
+                priority=1
+            ),
         
-        variants.append(ABTestVariant(
-            variant_id="cta_a",
-            element="cta_button",
-            original=original,
-            variant="Start Free Trial",
-            hypothesis="Low-commitment language reduces friction",
-            priority=1
-        ))
+            ABTestVariant(
+                variant_id="cta_b",
+                element="cta_button",
+                original=original,
+                variant="Get Instant Access",
+                hypothesis="Urgency and instant gratification drive clicks",
+                priority=2
+            ),
         
-        variants.append(ABTestVariant(
-            variant_id="cta_b",
-            element="cta_button",
-            original=original,
-            variant="Get Instant Access",
-            hypothesis="Urgency and instant gratification drive clicks",
-            priority=2
-        ))
-        
-        variants.append(ABTestVariant(
-            variant_id="cta_c",
-            element="cta_button",
-            original=original,
-            variant="See It In Action",
-            hypothesis="Demonstration focus reduces perceived risk",
-            priority=3
-        ))
-        
-        return variants
+            ABTestVariant(
+                variant_id="cta_c",
+                element="cta_button",
+                original=original,
+                variant="See It In Action",
+                hypothesis="Demonstration focus reduces perceived risk",
+                priority=3
+            )
+        ]
     
-    def prioritize_tests(self, tests: List[ABTestVariant]) -> List[ABTestVariant]:
-        """Prioritize A/B tests based on expected impact"""
-        return sorted(tests, key=lambda t: t.priority)
+    def prioritize_tests(
+        self,
+        tests: List[ABTestVariant],
+        k: Optional[int] = None,
+        presorted: bool = False
+    ) -> List[ABTestVariant]:
+        """
+        Prioritize A/B tests based on expected impact.
+        
+        Pass k to get only the top-k tests, and presorted=True when the tests
+        are already in priority order (e.g. straight from create_hero_test).
+        """
+        if presorted:
+            return list(tests[:k])
+        if k is not None:
+            return heapq.nsmallest(k, tests, key=_PRIORITY)
+        return sorted(tests, key=_PRIORITY)
     
     def generate_test_report(self, tests: List[ABTestVariant]) -> str:
         """Generate a markdown report of all tests"""
@@ -54,18 +54,20 @@ class EmailSequenceSkill:
     
     def create_cold_traffic_sequence(self, avatar: Dict[str, Any], offer: str) -> List[Email]:
         """Create email sequence for cold traffic"""
-        emails = []
+        lead_magnet = avatar.get('lead_magnet', 'Free Guide')
+        case_study_name = avatar.get('case_study_name', 'Sarah')
         
-        # Email 1: Welcome + Lead Magnet Delivery
-        emails.append(Email(
-            email_id="email_1",
-            email_type=EmailType.WELCOME,
-            subject=f"Here's your {avatar.get('lead_magnet', 'Free Guide')}",
-            preview="Your download is ready...",
-            body=f"""
+        return [
+            # Email 1: Welcome + Lead Magnet Delivery
+            Email(
+                email_id="email_1",
+                email_type=EmailType.WELCOME,
+                subject=f"Here's your {lead_magnet}",
+                preview="Your download is ready...",
+                body=f"""
 Hey there,
 
-Thanks for grabbing the {avatar.get('lead_magnet', 'Free Guide')}!
+Thanks for grabbing the {lead_magnet}!
 
 Here's your download link: [DOWNLOAD LINK]
 
@@ -80,17 +82,17 @@ P.S. Quick question: What's your biggest challenge with
 {avatar.get('topic', 'this topic')} right now? Just hit reply 
 and let me know - I read every email.
 """,
-            send_delay_days=0,
-            cta="Download Now"
-        ))
+                send_delay_days=0,
+                cta="Download Now"
+            ),
         
-        # Email 2: Value Add
-        emails.append(Email(
-            email_id="email_2",
-            email_type=EmailType.VALUE,
-            subject=f"The {avatar.get('identity', 'Professional')}\'s Secret to {avatar.get('goal', 'Success')}",
-            preview="This one change changed everything...",
-            body=f"""
+            # Email 2: Value Add
+            Email(
+                email_id="email_2",
+                email_type=EmailType.VALUE,
+                subject=f"The {avatar.get('identity', 'Professional')}\'s Secret to {avatar.get('goal', 'Success')}",
+                preview="This one change changed everything...",
+                body=f"""
 Hey,
 
 Yesterday I mentioned I'd share some strategies that work.
@@ -108,22 +110,22 @@ Tomorrow I'll show you exactly how to implement this.
 
 [Your Name]
 """,
-            send_delay_days=1,
-            cta="Learn More"
-        ))
+                send_delay_days=1,
+                cta="Learn More"
+            ),
         
-        # Email 3: Case Study
-        emails.append(Email(
-            email_id="email_3",
-            email_type=EmailType.CASE_STUDY,
-            subject=f"How {avatar.get('case_study_name', 'Sarah')} went from {avatar.get('before_state', 'struggling')} to {avatar.get('after_state', 'thriving')}",
-            preview="A real story from someone like you...",
-            body=f"""
+            # Email 3: Case Study
+            Email(
+                email_id="email_3",
+                email_type=EmailType.CASE_STUDY,
+                subject=f"How {case_study_name} went from {avatar.get('before_state', 'struggling')} to {avatar.get('after_state', 'thriving')}",
+                preview="A real story from someone like you...",
+                body=f"""
 Hey,
 
 Remember the strategy I shared yesterday?
 
-Here's how it played out for {avatar.get('case_study_name', 'Sarah')}:
+Here's how it played out for {case_study_name}:
 
 **Before:**
 - {avatar.get('before_state', 'Struggling with manual processes')}
@@ -142,17 +144,17 @@ Want similar results? Here's how to get started:
 
 [Your Name]
 """,
-            send_delay_days=2,
-            cta="Get Started"
-        ))
+                send_delay_days=2,
+                cta="Get Started"
+            ),
         
-        # Email 4: Objection Handling
-        emails.append(Email(
-            email_id="email_4",
-            email_type=EmailType.OBJECTION,
-            subject="But what if it doesn't work for me?",
-            preview="I understand the hesitation...",
-            body=f"""
+            # Email 4: Objection Handling
+            Email(
+                email_id="email_4",
+                email_type=EmailType.OBJECTION,
+                subject="But what if it doesn't work for me?",
+                preview="I understand the hesitation...",
+                body=f"""
 Hey,
 
 I get it. You might be thinking:
@@ -176,17 +178,17 @@ Ready to give it a shot?
 
 [Your Name]
 """,
-            send_delay_days=3,
-            cta="Try It Risk-Free"
-        ))
+                send_delay_days=3,
+                cta="Try It Risk-Free"
+            ),
         
-        # Email 5: Urgency/Close
-        emails.append(Email(
-            email_id="email_5",
-            email_type=EmailType.URGENCY,
-            subject=f"Last chance: {offer} doors closing soon",
-            preview="Don't miss this...",
-            body=f"""
+            # Email 5: Urgency/Close
+            Email(
+                email_id="email_5",
+                email_type=EmailType.URGENCY,
+                subject=f"Last chance: {offer} doors closing soon",
+                preview="Don't miss this...",
+                body=f"""
 Hey,
 
 This is it.
@@ -211,11 +213,10 @@ See you inside,
 P.S. Don't let another opportunity pass by. 
 This is your moment.
 """,
-            send_delay_days=4,
-            cta="Join Now"
-        ))
-        
-        return emails
+                send_delay_days=4,
+                cta="Join Now"
+            )
+        ]
     
     def generate_sequence_report(self, emails: List[Email]) -> str:
         """Generate a markdown report of the email sequence"""
@@ -3,12 +3,15 @@ Paid Ads Skill for Agent Zero
 Creates and manages paid advertising campaigns
 """
 
+import copy
+import json
+from functools import lru_cache
 from typing import Dict, Any, List
 from dataclasses import dataclass
 from enum import Enum
 
 
-class AdPlatform(Enum):
+class AdPlatform(str, Enum):
     META = "meta"
     GOOGLE = "google"
     TIKTOK = "tiktok"
@@ -16,14 +19,14 @@ class AdPlatform(Enum):
     LINKEDIN = "linkedin"
 
 
-class AdFormat(Enum):
+class AdFormat(str, Enum):
     IMAGE = "image"
     VIDEO = "video"
     CAROUSEL = "carousel"
     STORY = "story"
 
 
-@dataclass
+@dataclass(slots=True)
 class AdCreative:
     """A single ad creative"""
     creative_id: str
@@ -36,7 +39,7 @@ class AdCreative:
     budget: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AdCampaign:
     """A complete ad campaign"""
     campaign_id: str
@@ -47,6 +50,91 @@ class AdCampaign:
     duration_days: int
 
 
+# Primary-text copy for the Meta creatives, kept in one place for A/B iteration
+META_PROBLEM_TEXT = """
+Are you tired of {frustration}?
+
+{identity} are discovering a better way.
+
+{benefit} with {offer_name}.
+
+Click below to learn more.
+"""
+
+META_SOLUTION_TEXT = """
+Discover how {identity} are:
+
+✅ {benefit_1}
+✅ {benefit_2}
+✅ {benefit_3}
+
+See how it works →
+"""
+
+META_TRANSFORMATION_TEXT = """
+Watch how {case_study_name} transformed her results:
+
+Before: {before_state}
+After: {after_state}
+
+The secret? {offer_name}
+
+Your transformation starts here.
+"""
+
+TARGETING_CACHE_SIZE = 256
+
+
+def _as_tuple(value: Any) -> tuple:
+    """A single value (e.g. one interest given as a string) becomes a 1-tuple"""
+    if isinstance(value, (str, bytes, dict)):
+        return (value,)
+    try:
+        return tuple(value)
+    except TypeError:
+        return (value,)
+
+
+@lru_cache(maxsize=TARGETING_CACHE_SIZE)
+def _targeting_strategy(interests: tuple, age_range: str, locations: tuple) -> Dict[str, Any]:
+    return {
+        "primary_audiences": [
+            {
+                "name": "Interest-Based",
+                "targeting": {
+                    "interests": list(interests),
+                    "behaviors": ["Engaged Shoppers"],
+                    "demographics": {
+                        "age": age_range,
+                        "locations": list(locations)
+                    }
+                }
+            },
+            {
+                "name": "Lookalike",
+                "targeting": {
+                    "lookalike_sources": ["Email List", "Purchase History"],
+                    "lookalike_size": "1-5%"
+                }
+            }
+        ],
+        "secondary_audiences": [
+            {
+                "name": "Retargeting",
+                "targeting": {
+                    "website_visitors": "7-30 days",
+                    "video_viewers": "50%+ watched",
+                    "engaged_users": "Any interaction"
+                }
+            }
+        ],
+        "excluded_audiences": [
+            "Existing Customers",
+            "Recent Purchasers (30 days)"
+        ]
+    }
+
+
 class PaidAdsSkill:
     """
     Skill for creating and managing paid ad campaigns.
@@ -67,80 +155,74 @@ class PaidAdsSkill:
     
     def create_meta_campaign(self, offer: Dict[str, Any], avatar: Dict[str, Any]) -> AdCampaign:
         """Create a Meta ads campaign"""
-        creatives = []
-        
-        # Creative 1: Problem-aware angle
-        creatives.append(AdCreative(
-            creative_id="meta_1",
-            platform=AdPlatform.META,
-            format=AdFormat.VIDEO,
-            headline=f"Stop Struggling with {avatar.get('pain_point', 'This Problem')}",
-            primary_text=f"""
-Are you tired of {avatar.get('frustration', 'dealing with this issue')}?
-
-{avatar.get('identity', 'People like you')} are discovering a better way.
-
-{offer.get('benefit', 'Transform your results')} with {offer.get('name', 'our solution')}.
-
-Click below to learn more.
-""",
-            cta="Learn More",
-            targeting={
-                "interests": avatar.get("interests", ["AI", "Technology", "Business"]),
-                "behaviors": ["Engaged Shoppers", "Small Business Owners"],
-                "age_range": avatar.get("age_range", "25-55"),
-                "locations": avatar.get("locations", ["US"])
-            },
-            budget=20.0
-        ))
+        age_range = avatar.get("age_range", "25-55")
+        before_state = avatar.get('before_state', 'Struggling')
+        after_state = avatar.get('after_state', 'Thriving')
         
-        # Creative 2: Solution-aware angle
-        creatives.append(AdCreative(
-            creative_id="meta_2",
-            platform=AdPlatform.META,
-            format=AdFormat.CAROUSEL,
-            headline=f"The {avatar.get('identity', 'Professional')}\'s Guide to {avatar.get('goal', 'Success')}",
-            primary_text=f"""
-Discover how {avatar.get('identity', 'professionals')} are:
-
-✅ {offer.get('benefit_1', 'Saving time')}
-✅ {offer.get('benefit_2', 'Getting better results')}
-✅ {offer.get('benefit_3', 'Growing faster')}
-
-See how it works →
-""",
-            cta="See How",
-            targeting={
-                "interests": avatar.get("interests", ["AI", "Technology"]),
-                "lookalike": ["Email List", "Website Visitors"],
-                "age_range": avatar.get("age_range", "25-55")
-            },
-            budget=20.0
-        ))
-        
-        # Creative 3: Transformation angle
-        creatives.append(AdCreative(
-            creative_id="meta_3",
-            platform=AdPlatform.META,
-            format=AdFormat.VIDEO,
-            headline=f"From {avatar.get('before_state', 'Struggling')} to {avatar.get('after_state', 'Thriving')} in {offer.get('timeframe', '30 Days')}",
-            primary_text=f"""
-Watch how {avatar.get('case_study_name', 'Sarah')} transformed her results:
-
-Before: {avatar.get('before_state', 'Struggling')}
-After: {avatar.get('after_state', 'Thriving')}
-
-The secret? {offer.get('name', 'Our solution')}
-
-Your transformation starts here.
-""",
-            cta="Get Started",
-            targeting={
-                "retargeting": ["Website Visitors 7 Days", "Video Viewers"],
-                "age_range": avatar.get("age_range", "25-55")
-            },
-            budget=15.0
-        ))
+        creatives = [
+            # Creative 1: Problem-aware angle
+            AdCreative(
+                creative_id="meta_1",
+                platform=AdPlatform.META,
+                format=AdFormat.VIDEO,
+                headline=f"Stop Struggling with {avatar.get('pain_point', 'This Problem')}",
+                primary_text=META_PROBLEM_TEXT.format(
+                    frustration=avatar.get('frustration', 'dealing with this issue'),
+                    identity=avatar.get('identity', 'People like you'),
+                    benefit=offer.get('benefit', 'Transform your results'),
+                    offer_name=offer.get('name', 'our solution')
+                ),
+                cta="Learn More",
+                targeting={
+                    "interests": avatar.get("interests", ["AI", "Technology", "Business"]),
+                    "behaviors": ["Engaged Shoppers", "Small Business Owners"],
+                    "age_range": age_range,
+                    "locations": avatar.get("locations", ["US"])
+                },
+                budget=20.0
+            ),
+            
+            # Creative 2: Solution-aware angle
+            AdCreative(
+                creative_id="meta_2",
+                platform=AdPlatform.META,
+                format=AdFormat.CAROUSEL,
+                headline=f"The {avatar.get('identity', 'Professional')}\'s Guide to {avatar.get('goal', 'Success')}",
+                primary_text=META_SOLUTION_TEXT.format(
+                    identity=avatar.get('identity', 'professionals'),
+                    benefit_1=offer.get('benefit_1', 'Saving time'),
+                    benefit_2=offer.get('benefit_2', 'Getting better results'),
+                    benefit_3=offer.get('benefit_3', 'Growing faster')
+                ),
+                cta="See How",
+                targeting={
+                    "interests": avatar.get("interests", ["AI", "Technology"]),
+                    "lookalike": ["Email List", "Website Visitors"],
+                    "age_range": age_range
+                },
+                budget=20.0
+            ),
+            
+            # Creative 3: Transformation angle
+            AdCreative(
+                creative_id="meta_3",
+                platform=AdPlatform.META,
+                format=AdFormat.VIDEO,
+                headline=f"From {before_state} to {after_state} in {offer.get('timeframe', '30 Days')}",
+                primary_text=META_TRANSFORMATION_TEXT.format(
+                    case_study_name=avatar.get('case_study_name', 'Sarah'),
+                    before_state=before_state,
+                    after_state=after_state,
+                    offer_name=offer.get('name', 'Our solution')
+                ),
+                cta="Get Started",
+                targeting={
+                    "retargeting": ["Website Visitors 7 Days", "Video Viewers"],
+                    "age_range": age_range
+                },
+                budget=15.0
+            )
+        ]
         
         return AdCampaign(
             campaign_id=f"campaign_{offer.get('name', 'offer').lower().replace(' ', '_')}",
@@ -152,66 +234,45 @@ Your transformation starts here.
         )
     
     def create_targeting_strategy(self, avatar: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a comprehensive targeting strategy"""
-        return {
-            "primary_audiences": [
-                {
-                    "name": "Interest-Based",
-                    "targeting": {
-                        "interests": avatar.get("interests", []),
-                        "behaviors": ["Engaged Shoppers"],
-                        "demographics": {
-                            "age": avatar.get("age_range", "25-55"),
-                            "locations": avatar.get("locations", ["US"])
-                        }
-                    }
-                },
-                {
-                    "name": "Lookalike",
-                    "targeting": {
-                        "lookalike_sources": ["Email List", "Purchase History"],
-                        "lookalike_size": "1-5%"
-                    }
-                }
-            ],
-            "secondary_audiences": [
-                {
-                    "name": "Retargeting",
-                    "targeting": {
-                        "website_visitors": "7-30 days",
-                        "video_viewers": "50%+ watched",
-                        "engaged_users": "Any interaction"
-                    }
-                }
-            ],
-            "excluded_audiences": [
-                "Existing Customers",
-                "Recent Purchasers (30 days)"
-            ]
-        }
+        """
+        Create a comprehensive targeting strategy.
+        
+        Strategies are cached per avatar fingerprint (the most recent
+        TARGETING_CACHE_SIZE); each call gets its own copy.
+        """
+        interests = _as_tuple(avatar.get("interests", []))
+        age_range = avatar.get("age_range", "25-55")
+        locations = _as_tuple(avatar.get("locations", ["US"]))
+        try:
+            strategy = _targeting_strategy(interests, age_range, locations)
+        except TypeError:  # unhashable values (e.g. dict interests) can't be cached
+            return _targeting_strategy.__wrapped__(interests, age_range, locations)
+        return copy.deepcopy(strategy)
     
     def generate_campaign_report(self, campaign: AdCampaign) -> str:
         """Generate a markdown report of the campaign"""
-        report = f"# Ad Campaign: {campaign.name}\n\n"
-        report += f"- **Campaign ID:** {campaign.campaign_id}\n"
-        report += f"- **Objective:** {campaign.objective}\n"
-        report += f"- **Budget:** ${campaign.budget}/day\n"
-        report += f"- **Duration:** {campaign.duration_days} days\n\n"
+        parts: List[str] = []
+        add = parts.append
+        add(f"# Ad Campaign: {campaign.name}\n\n")
+        add(f"- **Campaign ID:** {campaign.campaign_id}\n")
+        add(f"- **Objective:** {campaign.objective}\n")
+        add(f"- **Budget:** ${campaign.budget}/day\n")
+        add(f"- **Duration:** {campaign.duration_days} days\n\n")
         
-        report += "## Ad Creatives\n\n"
+        add("## Ad Creatives\n\n")
         
         for creative in campaign.creatives:
-            report += f"### {creative.creative_id.upper()}\n\n"
-            report += f"- **Platform:** {creative.platform.value}\n"
-            report += f"- **Format:** {creative.format.value}\n"
-            report += f"- **Headline:** {creative.headline}\n"
-            report += f"- **CTA:** {creative.cta}\n"
-            report += f"- **Budget:** ${creative.budget}/day\n\n"
-            report += f"**Primary Text:**\n```\n{creative.primary_text}\n```\n\n"
-            report += f"**Targeting:**\n```json\n{creative.targeting}\n```\n\n"
-            report += "---\n\n"
+            add(f"### {creative.creative_id.upper()}\n\n")
+            add(f"- **Platform:** {creative.platform.value}\n")
+            add(f"- **Format:** {creative.format.value}\n")
+            add(f"- **Headline:** {creative.headline}\n")
+            add(f"- **CTA:** {creative.cta}\n")
+            add(f"- **Budget:** ${creative.budget}/day\n\n")
+            add(f"**Primary Text:**\n```\n{creative.primary_text}\n```\n\n")
+            add(f"**Targeting:**\n```json\n{json.dumps(creative.targeting, indent=2)}\n```\n\n")
+            add("---\n\n")
         
-        return report
+        return "".join(parts)
 
 
 # Skill registration
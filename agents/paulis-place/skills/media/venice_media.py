@@ -4,11 +4,16 @@ Generate images and videos using Venice AI API
 """
 
 import os
-import aiohttp
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 class MediaType(Enum):
     IMAGE = "image"
@@ -28,7 +33,7 @@ class VideoModel(Enum):
     PIKA = "pika"
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaRequest:
     """A media generation request"""
     request_id: str
@@ -41,7 +46,7 @@ class MediaRequest:
     style: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaResult:
     """A generated media result"""
     request_id: str
@@ -51,6 +56,11 @@ class MediaResult:
     model: str
 
 
+def _request_id(prefix: str, prompt: str) -> str:
+    """Stable, collision-resistant request ID for a prompt"""
+    return f"{prefix}_{hashlib.blake2b(prompt.encode(), digest_size=5).hexdigest()}"
+
+
 class VeniceMediaSkill:
     """
     Skill for generating media using Venice AI.
@@ -65,9 +75,53 @@ class VeniceMediaSkill:
     name = "venice_media"
     description = "Generate images and videos using Venice AI"
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, max_concurrency: int = 8, cache_size: int = 1024):
         self.api_key = api_key or os.getenv("VENICE_AI_API_KEY")
         self.base_url = "https://api.venice.ai/api/v1"
+        self.max_concurrency = max_concurrency
+        self.cache_size = cache_size
+        self._http: Optional["aiohttp.ClientSession"] = None
+        # Exact-match LRU cache of generated media, keyed by request parameters
+        self._cache: "OrderedDict[Tuple, MediaResult]" = OrderedDict()
+    
+    async def __aenter__(self):
+        await self._session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+    
+    async def _session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first use"""
+        if self._http is None or self._http.closed:
+            import aiohttp  # deferred so importing the skill does not load aiohttp
+            
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=60),
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+    
+    def _cache_get(self, key: Tuple) -> Optional[MediaResult]:
+        """Cached result for key, as a copy the caller is free to modify"""
+        result = self._cache.get(key)
+        if result is None:
+            return None
+        self._cache.move_to_end(key)
+        return replace(result)
+    
+    def _cache_put(self, key: Tuple, result: MediaResult):
+        self._cache[key] = replace(result)  # the caller keeps (and may modify) the original
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
         
     async def generate_image(
         self,
@@ -75,12 +129,19 @@ class VeniceMediaSkill:
         model: ImageModel = ImageModel.FLUX,
         aspect_ratio: str = "16:9",
         style: str = None,
-        negative_prompt: str = None
+        negative_prompt: str = None,
+        bypass_cache: bool = False
     ) -> MediaResult:
-        """Generate an image using Venice AI"""
+        """Generate an image using Venice AI (identical requests are served from cache)"""
+        
+        cache_key = (MediaType.IMAGE, model.value, prompt, aspect_ratio, style, negative_prompt)
+        if not bypass_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
         
         request = MediaRequest(
-            request_id=f"img_{hash(prompt) % 10000}",
+            request_id=_request_id("img", prompt),
             media_type=MediaType.IMAGE,
             model=model.value,
             prompt=prompt,
@@ -89,15 +150,17 @@ class VeniceMediaSkill:
             style=style
         )
         
-        # API call would go here
+        # API call would go here, via: session = await self._session()
         # For now, return a simulated result
-        return MediaResult(
+        result = MediaResult(
             request_id=request.request_id,
             media_type=MediaType.IMAGE,
             url=f"https://venice.ai/generated/{request.request_id}.png",
             seed=12345,
             model=model.value
         )
+        self._cache_put(cache_key, result)
+        return result
     
     async def generate_video(
         self,
@@ -105,12 +168,19 @@ class VeniceMediaSkill:
         model: VideoModel = VideoModel.KLING,
         duration: int = 5,
         aspect_ratio: str = "9:16",
-        style: str = None
+        style: str = None,
+        bypass_cache: bool = False
     ) -> MediaResult:
-        """Generate a video using Venice AI"""
+        """Generate a video using Venice AI (identical requests are served from cache)"""
+        
+        cache_key = (MediaType.VIDEO, model.value, prompt, duration, aspect_ratio, style)
+        if not bypass_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
         
         request = MediaRequest(
-            request_id=f"vid_{hash(prompt) % 10000}",
+            request_id=_request_id("vid", prompt),
             media_type=MediaType.VIDEO,
             model=model.value,
             prompt=prompt,
@@ -119,14 +189,16 @@ class VeniceMediaSkill:
             style=style
         )
         
-        # API call would go here
-        return MediaResult(
+        # API call would go here, via: session = await self._session()
+        result = MediaResult(
             request_id=request.request_id,
             media_type=MediaType.VIDEO,
             url=f"https://venice.ai/generated/{request.request_id}.mp4",
             seed=67890,
             model=model.value
         )
+        self._cache_put(cache_key, result)
+        return result
     
     async def generate_ad_creative(
         self,
@@ -179,17 +251,21 @@ class VeniceMediaSkill:
         media_type: MediaType = MediaType.IMAGE,
         model: str = "flux"
     ) -> List[MediaResult]:
-        """Generate multiple media items in batch"""
-        results = []
+        """Generate multiple media items in batch (concurrently, bounded by max_concurrency)"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        for prompt in prompts:
-            if media_type == MediaType.IMAGE:
-                result = await self.generate_image(prompt=prompt, model=ImageModel(model))
-            else:
-                result = await self.generate_video(prompt=prompt, model=VideoModel(model))
-            results.append(result)
-            
-        return results
+        if media_type == MediaType.IMAGE:
+            image_model = ImageModel(model)
+            generate = lambda p: self.generate_image(prompt=p, model=image_model)
+        else:
+            video_model = VideoModel(model)
+            generate = lambda p: self.generate_video(prompt=p, model=video_model)
+        
+        async def run(prompt: str) -> MediaResult:
+            async with semaphore:
+                return await generate(prompt)
+        
+        return list(await asyncio.gather(*(run(p) for p in prompts)))
     
     def create_ad_prompt(self, concept: str, style: str = "cinematic") -> str:
         """Create a detailed prompt for ad generation"""
@@ -19,13 +19,25 @@ Note: This targets Coolify CLOUD (app.coolify.io), not self-hosted Coolify.
       Cloud manages your server remotely through its control plane.
 """
 
+import argparse
 import json
 import os
 import sys
 import time
-import urllib.request
-import urllib.error
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode()
 
 # ── Config ───────────────────────────────────────────────────
 COOLIFY_URL = "https://app.coolify.io/api/v1"   # Coolify Cloud
@@ -38,6 +50,7 @@ APP_FQDN = "http://agent-claw.31.220.58.212.sslip.io"
 EXPOSED_PORTS = "5000"
 BUILD_PACK = "dockerfile"
 DOCKERFILE_LOCATION = "/Dockerfile.agent"
+BULK_UNSUPPORTED_STATUSES = (404, 405)          # /envs/bulk missing on older Coolify
 
 # Env vars to inject into the Coolify deployment (non-secret defaults)
 DEFAULT_ENV = {
@@ -51,6 +64,9 @@ DEFAULT_ENV = {
     "DEFAULT_USER_TIMEZONE": "America/Mexico_City",
     "DEFAULT_USER_UTC_OFFSET_MINUTES": "-360",
 }
+DEFAULT_ENV_PAYLOADS = tuple(
+    {"key": key, "value": value, "is_preview": False} for key, value in DEFAULT_ENV.items()
+)
 
 # Secrets to pull from vault and inject
 VAULT_SECRETS = [
@@ -68,26 +84,61 @@ VAULT_SECRETS = [
     "NOTION_API_TOKEN",
     "STRIPE_SECRET_KEY",
 ]
+# (env key, vault key) pairs, lowercased once
+VAULT_SECRET_KEYS = tuple((key, key.lower()) for key in VAULT_SECRETS)
+
+
+def _build_session():
+    """Keep-alive HTTP session for the Coolify API (reuses the TLS connection)."""
+    session = requests.Session()
+    session.headers.update({
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "User-Agent": "AgentClaw/1.0 (deploy-script)",  # Required for Cloudflare
+    })
+    retry = Retry(total=3, backoff_factor=0.5,
+                  status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+SESSION = _build_session()
 
 
-def get_token():
+_vault_load = None
+
+
+def _load_vault_fn():
+    """Import vault_load on first use (keeps --token/--status startup light)."""
+    global _vault_load
+    if _vault_load is None:
+        sys.path.insert(0, os.path.dirname(__file__))
+        from python.helpers.vault import vault_load
+        _vault_load = vault_load
+    return _vault_load
+
+
+@lru_cache(maxsize=128)
+def _vault_cached(key):
+    """Memoized vault lookup."""
+    return _load_vault_fn()(key)
+
+
+def get_token(args):
     """Get Coolify API token from args or vault."""
     # Check command line
-    if "--token" in sys.argv:
-        idx = sys.argv.index("--token")
-        if idx + 1 < len(sys.argv):
-            return sys.argv[idx + 1]
+    if args.token:
+        return args.token
 
     # Check environment
-    if os.getenv("COOLIFY_API_TOKEN"):
-        return os.getenv("COOLIFY_API_TOKEN")
+    env_token = os.getenv("COOLIFY_API_TOKEN")
+    if env_token:
+        return env_token
 
     # Try vault
     try:
-        sys.path.insert(0, os.path.dirname(__file__))
-        from python.helpers.vault import vault_load
         for key in ["coolify_api_token", "coolify_api_token_alt", "coolify_api_token_alt2"]:
-            val = vault_load(key)
+            val = _vault_cached(key)
             if val:
                 return val
     except Exception:
@@ -99,30 +150,24 @@ def get_token():
     sys.exit(1)
 
 
-def coolify_request(method, path, token, data=None):
+def coolify_request(method, path, token, data=None, headers=None):
     """Make a Coolify API request."""
     url = f"{COOLIFY_URL}{path}"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "User-Agent": "AgentClaw/1.0 (deploy-script)",  # Required for Cloudflare
-    }
-    body = json.dumps(data).encode() if data else None
-    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    request_headers = {"Authorization": f"Bearer {token}"}
+    if headers:
+        request_headers.update(headers)
     try:
-        resp = urllib.request.urlopen(req, timeout=30)
-        raw = resp.read().decode()
-        return {"status": resp.status, "data": json.loads(raw) if raw else {}}
-    except urllib.error.HTTPError as e:
-        body_text = ""
-        try:
-            body_text = e.read().decode()
-        except Exception:
-            pass
-        return {"status": e.code, "error": e.reason, "body": body_text}
+        resp = SESSION.request(method, url, data=_json_dumps(data) if data else None,
+                               headers=request_headers, timeout=30)
     except Exception as e:
         return {"status": 0, "error": str(e)}
+    if not resp.ok:
+        return {"status": resp.status_code, "error": resp.reason, "body": resp.text}
+    try:
+        return {"status": resp.status_code, "data": _json_loads(resp.content) if resp.content else {},
+                "etag": resp.headers.get("ETag")}
+    except ValueError as e:
+        return {"status": 0, "error": str(e)}
 
 
 def check_auth(token):
@@ -229,38 +274,51 @@ def configure_app(token, app_uuid):
         print(f"[WARN] Config update: {result}")
 
 
+def _post_env_var(token, app_uuid, payload):
+    """Create a single env var on the app; returns the printable status."""
+    result = coolify_request("POST", f"/applications/{app_uuid}/envs", token, payload)
+    return "OK" if result["status"] in (200, 201) else "SKIP"
+
+
 def set_env_vars(token, app_uuid):
     """Set environment variables from defaults and vault."""
-    # Set default (non-secret) env vars
-    for key, value in DEFAULT_ENV.items():
-        result = coolify_request("POST", f"/applications/{app_uuid}/envs", token, {
-            "key": key,
-            "value": value,
-            "is_preview": False,
-        })
-        status = "OK" if result["status"] in (200, 201) else "SKIP"
-        print(f"  [{status}] {key}")
-
-    # Set secrets from vault
+    # (payload, label suffix) pairs; default (non-secret) payloads are prebuilt
+    items = [(payload, "") for payload in DEFAULT_ENV_PAYLOADS]
+    skipped = []
+
+    # Secrets from vault
     try:
-        sys.path.insert(0, os.path.dirname(__file__))
-        from python.helpers.vault import vault_load
-        for key in VAULT_SECRETS:
-            val = vault_load(key.lower())
+        for key, vault_key in VAULT_SECRET_KEYS:
+            val = _vault_cached(vault_key)
             if val:
-                result = coolify_request("POST", f"/applications/{app_uuid}/envs", token, {
-                    "key": key,
-                    "value": val,
-                    "is_preview": False,
-                })
-                status = "OK" if result["status"] in (200, 201) else "SKIP"
-                print(f"  [{status}] {key} (from vault)")
+                items.append(({"key": key, "value": val, "is_preview": False}, " (from vault)"))
             else:
-                print(f"  [SKIP] {key} (not in vault)")
+                skipped.append(key)
     except Exception as e:
         print(f"  [WARN] Could not load vault: {e}")
         print("  Set secrets manually in Coolify dashboard")
 
+    # Try a single bulk upload first; fall back to per-variable requests only
+    # when this Coolify has no bulk endpoint (auth or validation errors would
+    # just fail again for every variable)
+    bulk = coolify_request("PATCH", f"/applications/{app_uuid}/envs/bulk", token,
+                           {"data": [payload for payload, _ in items]})
+    if bulk["status"] in (200, 201):
+        statuses = ["OK"] * len(items)
+    elif bulk["status"] not in BULK_UNSUPPORTED_STATUSES:
+        print(f"  [FAIL] Bulk env upload failed: {bulk}")
+        statuses = ["FAIL"] * len(items)
+    else:
+        # Upload concurrently over the pooled session (pool_maxsize >= max_workers)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(
+                lambda item: _post_env_var(token, app_uuid, item[0]), items))
+
+    for (payload, label), status in zip(items, statuses):
+        print(f"  [{status}] {payload['key']}{label}")
+    for key in skipped:
+        print(f"  [SKIP] {key} (not in vault)")
+
 
 def deploy_app(token, app_uuid):
     """Trigger deployment via /start endpoint (Coolify Cloud)."""
@@ -283,12 +341,17 @@ def deploy_app(token, app_uuid):
 
 
 def wait_for_deployment(token, app_uuid, timeout=300):
-    """Wait for deployment to complete."""
+    """Wait for deployment to complete (exponential backoff, conditional GETs)."""
     print(f"\n[INFO] Waiting for deployment (timeout: {timeout}s)...")
     start = time.time()
+    delay = 1.0
+    etag = None
     while time.time() - start < timeout:
-        result = coolify_request("GET", f"/applications/{app_uuid}", token)
+        headers = {"If-None-Match": etag} if etag else None
+        result = coolify_request("GET", f"/applications/{app_uuid}", token, headers=headers)
+        # 304 Not Modified: status unchanged since the last poll
         if result["status"] == 200:
+            etag = result.get("etag")
             status = result["data"].get("status", "unknown")
             print(f"  Status: {status} ({int(time.time() - start)}s)")
             if "running" in status.lower():
@@ -296,7 +359,9 @@ def wait_for_deployment(token, app_uuid, timeout=300):
             if "error" in status.lower() or "exited" in status.lower():
                 print(f"[FAIL] Deployment failed with status: {status}")
                 return False
-        time.sleep(15)
+        remaining = timeout - (time.time() - start)
+        time.sleep(max(0, min(delay, remaining)))
+        delay = min(delay * 2, 15)
     print("[WARN] Deployment timed out")
     return False
 
@@ -306,11 +371,10 @@ def health_check():
     print(f"\n[INFO] Health checking {APP_FQDN}...")
     for attempt in range(5):
         try:
-            req = urllib.request.Request(f"{APP_FQDN}/health", method="GET")
-            resp = urllib.request.urlopen(req, timeout=10)
-            data = resp.read().decode()
-            print(f"[OK] Health check passed (HTTP {resp.status})")
-            print(f"  Response: {data[:200]}")
+            resp = SESSION.get(f"{APP_FQDN}/health", timeout=10)
+            resp.raise_for_status()
+            print(f"[OK] Health check passed (HTTP {resp.status_code})")
+            print(f"  Response: {resp.text[:200]}")
             return True
         except Exception as e:
             print(f"  Attempt {attempt + 1}/5: {str(e)[:60]}")
@@ -319,6 +383,14 @@ def health_check():
     return False
 
 
+def fetch_recent_logs(token, app_uuid, lines=20):
+    """Fetch the tail of the application logs from Coolify."""
+    result = coolify_request("GET", f"/applications/{app_uuid}/logs?lines={lines}", token)
+    if result["status"] == 200 and isinstance(result["data"], dict):
+        return result["data"].get("logs", "")
+    return ""
+
+
 def check_status(token):
     """Check current deployment status."""
     app_uuid = find_existing_app(token)
@@ -337,7 +409,16 @@ def check_status(token):
         print(f"Build Pack: {app.get('build_pack')}")
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Deploy Agent Claw to Coolify Cloud")
+    parser.add_argument("--token", help="Coolify API token (defaults to env/vault)")
+    parser.add_argument("--status", action="store_true", help="check deployment status only")
+    return parser.parse_args(argv)
+
+
 def main():
+    args = parse_args()
+
     print("=" * 60)
     print("Agent Claw - Coolify Deployment")
     print(f"Target: {COOLIFY_URL} (Coolify Cloud)")
@@ -345,10 +426,10 @@ def main():
     print(f"App: {APP_NAME} -> {APP_FQDN}")
     print("=" * 60)
 
-    token = get_token()
+    token = get_token(args)
 
     # Status check mode
-    if "--status" in sys.argv:
+    if args.status:
         if check_auth(token):
             check_status(token)
         return
@@ -389,7 +470,14 @@ def main():
     if deployment_uuid:
         success = wait_for_deployment(token, app_uuid, timeout=300)
         if success:
-            health_check()
+            # Probe the app and pull recent logs in parallel over the shared session
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                fut_health = executor.submit(health_check)
+                fut_logs = executor.submit(fetch_recent_logs, token, app_uuid)
+                healthy = fut_health.result()
+                logs = fut_logs.result()
+            if not healthy and logs:
+                print(f"\n--- Recent logs ---\n{logs}")
             print(f"\n{'=' * 60}")
             print(f"DEPLOYMENT COMPLETE")
             print(f"Dashboard: {APP_FQDN}")
@@ -8,10 +8,32 @@ Usage:
 
 import subprocess
 import json
+import re
+import shlex
 import sys
 import argparse
+import threading
 from pathlib import Path
 
+try:
+    import paramiko
+except ImportError:
+    paramiko = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Per remote command; the single setup script gets the budget of the four
+# commands it replaces (apt update, apt install, pip install, chromium install)
+STEP_TIMEOUT = 300  # seconds
+SETUP_TIMEOUT = 4 * STEP_TIMEOUT
+
+# The remote test script wraps its final JSON in these markers
+RESULTS_RE = re.compile(r"^---RESULTS---\n(.*?)\n---END---$", re.S | re.M)
+
 
 class HostingerDeployment:
     """Deploy Loveable test to Hostinger VPS"""
@@ -21,7 +43,19 @@ class HostingerDeployment:
         self.user = user
         self.port = port
         self.key_path = key_path
+        self.control_path = f"/tmp/cm-{self.user}-{self.host}-{self.port}"
         self.ssh_cmd = self._build_ssh_command()
+        self._ssh = None
+        self._ssh_failed = False
+        self._sftp = None
+
+    def _control_options(self) -> list:
+        """SSH options that multiplex every call over one persistent connection"""
+        return [
+            "-o", "ControlMaster=auto",
+            "-o", "ControlPersist=600s",
+            "-o", f"ControlPath={self.control_path}",
+        ]
 
     def _build_ssh_command(self) -> list:
         """Build SSH command"""
@@ -29,18 +63,79 @@ class HostingerDeployment:
         if self.key_path:
             cmd.extend(["-i", self.key_path])
         cmd.extend(["-p", str(self.port)])
+        cmd.extend(self._control_options())
         cmd.append(f"{self.user}@{self.host}")
         return cmd
 
-    def run_remote_command(self, command: str) -> tuple:
+    def _get_client(self):
+        """Open (once) a persistent Paramiko SSH client, or None if unavailable"""
+        if self._ssh is None and not self._ssh_failed and paramiko is not None:
+            try:
+                client = paramiko.SSHClient()
+                client.load_system_host_keys()
+                client.connect(self.host, port=self.port, username=self.user, key_filename=self.key_path)
+                client.get_transport().set_keepalive(30)
+                self._ssh = client
+            except Exception:
+                # e.g. unknown host key - fall back to the ssh CLI
+                self._ssh_failed = True
+        return self._ssh
+
+    def _get_sftp(self):
+        """Open (once) an SFTP session on the persistent SSH client"""
+        if self._sftp is None:
+            client = self._get_client()
+            if client is None:
+                raise ConnectionError("SSH client unavailable")
+            self._sftp = client.open_sftp()
+        return self._sftp
+
+    def close(self):
+        """Shut down the SFTP/SSH sessions and the shared SSH control connection"""
+        if self._sftp is not None:
+            self._sftp.close()
+            self._sftp = None
+        if self._ssh is not None:
+            self._ssh.close()
+            self._ssh = None
+        try:
+            subprocess.run(
+                ["ssh", "-O", "exit", "-o", f"ControlPath={self.control_path}",
+                 f"{self.user}@{self.host}"],
+                capture_output=True,
+                timeout=10
+            )
+        except Exception:
+            pass
+
+    def run_remote_command(self, command: str, timeout: int = STEP_TIMEOUT) -> tuple:
         """Run command on remote server"""
+        client = self._get_client()
+        if client is not None:
+            # New channel on the already-authenticated transport: no fork/exec, no handshake
+            try:
+                _, stdout, stderr = client.exec_command(command, timeout=timeout)
+                # Drain stderr alongside stdout: a command that fills the
+                # stderr window would otherwise stall until the timeout
+                err_chunks = []
+                err_reader = threading.Thread(
+                    target=lambda: err_chunks.append(stderr.read()), daemon=True
+                )
+                err_reader.start()
+                out = stdout.read().decode(errors="replace")
+                err_reader.join()
+                err = b"".join(err_chunks).decode(errors="replace")
+                return stdout.channel.recv_exit_status(), out, err
+            except Exception as e:
+                return 1, "", str(e)
+
         try:
-            full_cmd = self._ssh_cmd + [command]
+            full_cmd = self.ssh_cmd + [command]
             result = subprocess.run(
                 full_cmd,
                 capture_output=True,
                 text=True,
-                timeout=300
+                timeout=timeout
             )
             return result.returncode, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
@@ -48,6 +143,28 @@ class HostingerDeployment:
         except Exception as e:
             return 1, "", str(e)
 
+    def upload_files(self, files: list, remote_dir: str = "/root", timeout: int = 60) -> bool:
+        """Stream local files (sharing one parent directory) to the server as a single tar over SSH"""
+        files = [Path(f) for f in files]
+        base = files[0].parent
+        tar = subprocess.Popen(
+            ["tar", "czf", "-", "-C", str(base)] + [str(f.relative_to(base)) for f in files],
+            stdout=subprocess.PIPE
+        )
+        remote = subprocess.Popen(
+            self.ssh_cmd + [f"tar xzf - -C {shlex.quote(remote_dir)}"],
+            stdin=tar.stdout
+        )
+        tar.stdout.close()  # let tar see SIGPIPE if ssh exits early
+        try:
+            remote.wait(timeout=timeout)
+            tar.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            remote.kill()
+            tar.kill()
+            return False
+        return tar.returncode == 0 and remote.returncode == 0
+
     def deploy_test_script(self) -> bool:
         """Deploy test script to Hostinger"""
         print("[1] Copying test script to Hostinger...")
@@ -55,12 +172,9 @@ class HostingerDeployment:
         script_path = Path(__file__).parent.parent / "test_loveable_with_credentials.py"
 
         try:
-            subprocess.run(
-                ["scp", "-P", str(self.port)] +
-                (["-i", self.key_path] if self.key_path else []) +
-                [str(script_path), f"{self.user}@{self.host}:/root/"],
-                timeout=60
-            )
+            if not self.upload_files([script_path]):
+                print("❌ Failed to copy: tar/ssh transfer failed")
+                return False
             print("✅ Script copied")
             return True
         except Exception as e:
@@ -71,17 +185,23 @@ class HostingerDeployment:
         """Setup Python environment on Hostinger"""
         print("[2] Setting up Python environment...")
 
-        commands = [
-            "apt-get update -qq",
-            "apt-get install -y python3 python3-pip",
-            "pip install -q playwright requests beautifulsoup4",
-            "python3 -m playwright install chromium"
-        ]
-
-        for cmd in commands:
-            code, out, err = self.run_remote_command(cmd)
-            if code != 0 and "already" not in err.lower():
-                print(f"⚠️  Warning: {err[:100]}")
+        # apt may report already-installed packages; don't fail the chain on it.
+        # Once pip exists, the helper packages install in the background while
+        # playwright and its chromium download (which need each other) run in
+        # the foreground.
+        script = "\n".join([
+            "{ apt-get update -qq && apt-get install -y python3 python3-pip || true; }",
+            "pip install -q requests beautifulsoup4 & deps=$!",
+            "pip install -q playwright && python3 -m playwright install chromium; browser=$?",
+            "wait $deps && exit $browser"
+        ])
+
+        # One SSH round-trip for the whole setup
+        code, out, err = self.run_remote_command(
+            f"bash -lc {shlex.quote(script)}", timeout=SETUP_TIMEOUT
+        )
+        if code != 0 and "already" not in err.lower():
+            print(f"⚠️  Warning: {err[:100]}")
 
         print("✅ Environment setup complete")
         return True
@@ -95,15 +215,12 @@ class HostingerDeployment:
 
         if code == 0:
             print("✅ Test completed successfully")
-            try:
-                # Try to extract JSON from output
-                if "{" in out:
-                    json_start = out.rfind("{")
-                    json_str = out[json_start:]
-                    results = json.loads(json_str)
-                    return results
-            except:
-                pass
+            match = RESULTS_RE.search(out)
+            if match:
+                try:
+                    return _json_loads(match.group(1))
+                except ValueError:
+                    pass
         else:
             print(f"❌ Test failed: {err[:200]}")
 
@@ -113,16 +230,27 @@ class HostingerDeployment:
         """Retrieve results from Hostinger"""
         print("[4] Retrieving results...")
 
-        cmd = "cat /root/loveable_login_results.json"
-        code, out, err = self.run_remote_command(cmd)
+        remote_path = "/root/loveable_login_results.json"
+        out = None
 
-        if code == 0:
-            try:
-                results = json.loads(out)
-                print("✅ Results retrieved")
-                return results
-            except:
-                pass
+        try:
+            with self._get_sftp().open(remote_path, "r") as f:
+                f.prefetch()  # pipelined concurrent reads
+                out = f.read()
+        except Exception:
+            out = None
+
+        if out is None:
+            code, out, err = self.run_remote_command(f"cat {remote_path}")
+            if code != 0:
+                return None
+
+        try:
+            results = json.loads(out)
+            print("✅ Results retrieved")
+            return results
+        except:
+            pass
 
         return None
 
@@ -133,23 +261,26 @@ class HostingerDeployment:
         print("="*80)
         print()
 
-        if not self.deploy_test_script():
-            return {"success": False, "error": "Failed to deploy script"}
+        try:
+            if not self.deploy_test_script():
+                return {"success": False, "error": "Failed to deploy script"}
 
-        self.setup_environment()
+            self.setup_environment()
 
-        results = self.run_test()
+            results = self.run_test()
 
-        if results.get("success"):
-            print("\n" + "="*80)
-            print("✅ LOVEABLE.DEV LOGIN SUCCESSFUL!")
-            print("="*80)
-            password = results.get("successful_password", "")
-            print(f"Working password: {password[:1]}****")
-            print(f"Projects found: {len(results.get('projects_found', []))}")
-            return results
+            if results.get("success"):
+                print("\n" + "="*80)
+                print("✅ LOVEABLE.DEV LOGIN SUCCESSFUL!")
+                print("="*80)
+                password = results.get("successful_password", "")
+                print(f"Working password: {password[:1]}****")
+                print(f"Projects found: {len(results.get('projects_found', []))}")
+                return results
 
-        return results
+            return results
+        finally:
+            self.close()
 
 
 def main():
@@ -20,28 +20,45 @@ Systemd unit file: See agent-claw-live.service
 """
 
 import argparse
+import atexit
+import hashlib
+import hmac
 import json
 import logging
+import logging.handlers
 import os
 import sys
 import signal
 import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Setup logging before any imports
+os.makedirs("tmp", exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler("tmp/live_services.log", mode="a"),
+        # Bounded on disk: 10 MB per file, 5 rotated backups
+        logging.handlers.RotatingFileHandler(
+            "tmp/live_services.log", maxBytes=10_000_000, backupCount=5
+        ),
     ]
 )
 logger = logging.getLogger("agent_claw_live")
+# Per-request access lines from the HTTP stack would dominate the log
+for _noisy in ("werkzeug", "waitress", "httpx", "httpcore", "urllib3"):
+    logging.getLogger(_noisy).setLevel(logging.WARNING)
 
-# Ensure tmp directory exists
-os.makedirs("tmp", exist_ok=True)
+# Ensure tmp directories exist
 os.makedirs("tmp/voice", exist_ok=True)
 os.makedirs("tmp/telegram", exist_ok=True)
 os.makedirs("tmp/security", exist_ok=True)
@@ -55,31 +72,50 @@ class ServiceRegistry:
     def __init__(self):
         self.services = {}
         self.start_time = datetime.now(timezone.utc)
+        # Bot, webhook handlers and heartbeat monitor all update the registry
+        self._lock = threading.Lock()
     
     def register(self, name: str, status: str = "starting"):
-        self.services[name] = {
+        entry = {
             "status": status,
             "started_at": datetime.now(timezone.utc).isoformat(),
-            "last_heartbeat": datetime.now(timezone.utc).isoformat(),
+            "last_heartbeat_ns": time.monotonic_ns(),
             "errors": 0,
         }
+        with self._lock:
+            self.services[name] = entry
     
     def heartbeat(self, name: str):
-        if name in self.services:
-            self.services[name]["last_heartbeat"] = datetime.now(timezone.utc).isoformat()
-            self.services[name]["status"] = "running"
+        # Hot path: record a monotonic stamp only, formatted lazily in get_status()
+        with self._lock:
+            svc = self.services.get(name)
+            if svc is not None:
+                svc["last_heartbeat_ns"] = time.monotonic_ns()
+                svc["status"] = "running"
     
     def error(self, name: str, msg: str):
-        if name in self.services:
-            self.services[name]["errors"] += 1
-            self.services[name]["last_error"] = msg
+        with self._lock:
+            svc = self.services.get(name)
+            if svc is not None:
+                svc["errors"] += 1
+                svc["last_error"] = msg
     
     def get_status(self) -> dict:
-        uptime = (datetime.now(timezone.utc) - self.start_time).total_seconds()
+        now = datetime.now(timezone.utc)
+        now_ns = time.monotonic_ns()
+        uptime = (now - self.start_time).total_seconds()
+        with self._lock:
+            snapshot = [(name, dict(svc)) for name, svc in self.services.items()]
+        services = {}
+        for name, svc in snapshot:
+            entry = {k: v for k, v in svc.items() if k != "last_heartbeat_ns"}
+            age = timedelta(microseconds=(now_ns - svc["last_heartbeat_ns"]) // 1000)
+            entry["last_heartbeat"] = (now - age).isoformat()
+            services[name] = entry
         return {
             "uptime_seconds": int(uptime),
             "uptime_human": f"{int(uptime // 3600)}h {int((uptime % 3600) // 60)}m",
-            "services": self.services,
+            "services": services,
         }
 
 
@@ -88,13 +124,17 @@ registry = ServiceRegistry()
 
 # ─── Telegram Bot Service ───────────────────────────────────
 
+TELEGRAM_WORKERS = 16  # single-thread workers; chats are spread across them
+
+
 def run_telegram_bot():
     """Run Telegram bot in long-polling mode (blocking)."""
     registry.register("telegram_bot")
     logger.info("Starting Telegram Bot service...")
+    workers = []
     
     try:
-        from python.helpers.telegram_bot import start_bot, get_me
+        from python.helpers.telegram_bot import get_me, get_updates, process_message, send_message
         
         # Verify bot
         me = get_me()
@@ -107,14 +147,37 @@ def run_telegram_bot():
         logger.info(f"Telegram Bot: @{bot_info.get('username')} (ID: {bot_info.get('id')})")
         registry.heartbeat("telegram_bot")
         
+        # Updates are handled off the poll loop so one slow reply doesn't stall
+        # it. Each chat always goes to the same single-thread worker, so its
+        # replies keep their order while different chats run in parallel;
+        # the semaphore bounds how many can be in flight.
+        workers = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"telegram_update_{i}")
+            for i in range(TELEGRAM_WORKERS)
+        ]
+        in_flight = threading.BoundedSemaphore(32)
+        
+        def shutdown_workers():
+            for worker in workers:
+                worker.shutdown(wait=False, cancel_futures=True)
+        
+        atexit.register(shutdown_workers)
+        
+        def handle_message(message: dict):
+            try:
+                response = process_message(message)
+                if response:
+                    chat_id = message.get("chat", {}).get("id")
+                    send_message(chat_id, response)
+            except Exception as e:
+                registry.error("telegram_bot", str(e))
+                logger.error(f"Telegram update handling error: {e}")
+            finally:
+                in_flight.release()
+        
         # Run with heartbeat wrapper
         while True:
             try:
-                from python.helpers.telegram_bot import get_updates, process_message, send_message
-                from python.helpers.vault import vault_get
-                import httpx
-                
-                token = vault_get("TELEGRAM_BOT_TOKEN")
                 offset = 0
                 
                 while True:
@@ -127,10 +190,9 @@ def run_telegram_bot():
                         if not message:
                             continue
                         
-                        response = process_message(message)
-                        if response:
-                            chat_id = message.get("chat", {}).get("id")
-                            send_message(chat_id, response)
+                        chat_id = message.get("chat", {}).get("id")
+                        in_flight.acquire()
+                        workers[hash(chat_id) % TELEGRAM_WORKERS].submit(handle_message, message)
                 
             except KeyboardInterrupt:
                 raise
@@ -144,10 +206,37 @@ def run_telegram_bot():
     except Exception as e:
         logger.error(f"Telegram Bot fatal error: {e}")
         registry.error("telegram_bot", f"Fatal: {e}")
+    finally:
+        if workers:
+            shutdown_workers()
+            atexit.unregister(shutdown_workers)
 
 
 # ─── Flask Webhook Server ───────────────────────────────────
 
+AUTH_CACHE_TTL = 30  # seconds; picks up a rotated AUTH_PASSWORD without a restart
+_auth_cache = (0.0, "")  # (expires_at monotonic, expected Authorization header)
+
+
+def _expected_bearer() -> str:
+    """Expected Authorization header for protected endpoints ('' = auth disabled)."""
+    global _auth_cache
+    expires_at, expected = _auth_cache
+    now = time.monotonic()
+    if now >= expires_at:
+        from python.helpers.vault import vault_get
+        password = vault_get("AUTH_PASSWORD")
+        expected = f"Bearer {password}" if password else ""
+        _auth_cache = (now + AUTH_CACHE_TTL, expected)
+    return expected
+
+
+def _authorized(auth: str) -> bool:
+    """Constant-time check of a request's Authorization header."""
+    expected = _expected_bearer()
+    return not expected or hmac.compare_digest(auth.encode(), expected.encode())
+
+
 def create_webhook_app(port: int = 5001):
     """Create Flask app with Twilio voice webhooks and security hardening."""
     try:
@@ -176,6 +265,26 @@ def create_webhook_app(port: int = 5001):
     except Exception as e:
         logger.warning(f"Secret interceptor middleware failed: {e}")
     
+    # Bind request-path helpers once, not per request. A helper that fails
+    # to import only disables its own endpoint.
+    try:
+        from python.helpers.voice_ai import handle_inbound_call
+    except Exception as e:
+        handle_inbound_call = None
+        logger.warning(f"Voice AI unavailable: {e}")
+    
+    try:
+        from python.helpers.telegram_bot import handle_webhook
+    except Exception as e:
+        handle_webhook = None
+        logger.warning(f"Telegram webhook handler unavailable: {e}")
+    
+    try:
+        from python.helpers.vault import vault_audit
+    except Exception as e:
+        vault_audit = None
+        logger.warning(f"Vault audit unavailable: {e}")
+    
     @app.route("/health", methods=["GET"])
     def health():
         return jsonify(registry.get_status())
@@ -184,7 +293,8 @@ def create_webhook_app(port: int = 5001):
     def voice_webhook():
         """Handle incoming Twilio voice webhooks."""
         try:
-            from python.helpers.voice_ai import handle_inbound_call
+            if handle_inbound_call is None:
+                raise RuntimeError("voice AI not loaded")
             twiml = handle_inbound_call(request.form.to_dict())
             registry.heartbeat("webhook_server")
             return twiml, 200, {"Content-Type": "text/xml"}
@@ -203,8 +313,12 @@ def create_webhook_app(port: int = 5001):
     def telegram_webhook():
         """Handle Telegram webhook updates (production mode)."""
         try:
-            from python.helpers.telegram_bot import handle_webhook
-            body = request.get_json(silent=True)
+            if handle_webhook is None:
+                raise RuntimeError("Telegram handler not loaded")
+            # Decode the raw body directly; malformed JSON still gets a 200
+            # below, since Telegram retries any non-2xx delivery.
+            raw = request.get_data(cache=False)
+            body = _json_loads(raw) if raw else None
             if body:
                 handle_webhook(body)
             return "", 200
@@ -216,22 +330,17 @@ def create_webhook_app(port: int = 5001):
     def vault_audit_api():
         """Vault audit endpoint (protected)."""
         # Require auth header
-        auth = request.headers.get("Authorization", "")
-        from python.helpers.vault import vault_get
-        expected = vault_get("AUTH_PASSWORD")
-        if expected and auth != f"Bearer {expected}":
+        if not _authorized(request.headers.get("Authorization", "")):
             return jsonify({"error": "Unauthorized"}), 401
         
-        from python.helpers.vault import vault_audit
+        if vault_audit is None:
+            return jsonify({"error": "Vault audit unavailable"}), 503
         return jsonify(vault_audit())
     
     @app.route("/api/security/report", methods=["GET"])
     def security_report_api():
         """Security report endpoint (protected)."""
-        auth = request.headers.get("Authorization", "")
-        from python.helpers.vault import vault_get
-        expected = vault_get("AUTH_PASSWORD")
-        if expected and auth != f"Bearer {expected}":
+        if not _authorized(request.headers.get("Authorization", "")):
             return jsonify({"error": "Unauthorized"}), 401
         
         try:
@@ -242,6 +351,17 @@ def create_webhook_app(port: int = 5001):
     return app, port
 
 
+def serve_webhook_app(app, port: int):
+    """Serve the webhook app on a production WSGI server (threaded Flask as fallback)."""
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning("waitress not installed — falling back to threaded Flask server")
+        app.run(host="0.0.0.0", port=port, debug=False, use_reloader=False, threaded=True)
+        return
+    serve(app, host="0.0.0.0", port=port, threads=16, connection_limit=200)
+
+
 # ─── Heartbeat Monitor ──────────────────────────────────────
 
 def run_heartbeat_monitor(interval: int = 300):
@@ -251,6 +371,7 @@ def run_heartbeat_monitor(interval: int = 300):
     """
     registry.register("heartbeat_monitor")
     logger.info(f"Heartbeat monitor started (every {interval}s)")
+    last_digest = None
     
     while True:
         try:
@@ -261,9 +382,20 @@ def run_heartbeat_monitor(interval: int = 300):
             logger.info(f"Heartbeat: {status['uptime_human']} uptime, "
                        f"{len(status['services'])} services")
             
-            # Save to file
-            with open("tmp/heartbeat.json", "w") as f:
-                json.dump(status, f, indent=2)
+            # Save to file atomically, only when a service's state changed.
+            # Uptime and heartbeat times move on every loop, so the digest
+            # covers the stable fields only and the file's timestamps are
+            # those of the last change.
+            stable = sorted(
+                (name, svc.get("status"), svc.get("errors", 0), svc.get("last_error"))
+                for name, svc in status["services"].items()
+            )
+            digest = hashlib.blake2b(repr(stable).encode()).digest()
+            if digest != last_digest:
+                with open("tmp/heartbeat.json.tmp", "w") as f:
+                    f.write(json.dumps(status, separators=(",", ":")))
+                os.replace("tmp/heartbeat.json.tmp", "tmp/heartbeat.json")
+                last_digest = digest
             
             # Check for unhealthy services
             for name, svc in status["services"].items():
@@ -317,7 +449,7 @@ def main():
         if result:
             app, port = result
             logger.info(f"Webhook server starting on port {port}")
-            app.run(host="0.0.0.0", port=port, debug=False)
+            serve_webhook_app(app, port)
         return
     
     # Start all services
@@ -337,7 +469,7 @@ def main():
         app, port = result
         logger.info(f"Starting webhook server on port {port}")
         try:
-            app.run(host="0.0.0.0", port=port, debug=False, use_reloader=False)
+            serve_webhook_app(app, port)
         except KeyboardInterrupt:
             logger.info("Shutting down...")
     else:
@@ -5,7 +5,10 @@ Manage agent personas, rebranding, and team member assignments.
 Allows deploying the same agent with different names/avatars for teammates.
 """
 
-import traceback
+import logging
+from typing import Annotated, Optional
+from pydantic import BaseModel, Field
+from python.helpers.errors import dispatch_action
 from python.helpers.agent_branding import (
     get_persona,
     list_personas,
@@ -19,89 +22,102 @@ from python.helpers.agent_branding import (
     reload_config,
 )
 
+logger = logging.getLogger(__name__)
+
+NonEmpty = Annotated[str, Field(min_length=1)]
+
+
+# ── Request models ────────────────────────────────────
+class CurrentReq(BaseModel):
+    persona: Optional[str] = None
+
+
+class PersonaReq(BaseModel):
+    persona: NonEmpty
+
+
+class CreatePersonaReq(BaseModel):
+    key: NonEmpty
+    display_name: NonEmpty
+    tagline: str = ""
+    avatar: str = "⭐"
+    theme_color: str = "#00d4ff"
+    voice_persona: str = "professional"
+    elevenlabs_voice_id: str = ""
+    greeting: str = ""
+    system_style: str = ""
+
+
+class AssignReq(BaseModel):
+    member: NonEmpty
+    persona: NonEmpty
+
+
+class MemberReq(BaseModel):
+    member: NonEmpty
+
+
+# ── Get current branding (for dashboard) ─────────────
+def _current(req: CurrentReq) -> dict:
+    return {"success": True, "branding": get_branding_data(req.persona)}
+
+
+# ── List all personas ─────────────────────────────────
+def _list(req: None) -> dict:
+    return {"success": True, "personas": list_personas(), "default": get_default_persona_name()}
+
+
+# ── Get specific persona ──────────────────────────────
+def _get(req: PersonaReq) -> dict:
+    persona = get_persona(req.persona)
+    return {"success": True, "persona": persona}
+
+
+# ── Create / update persona ───────────────────────────
+def _create(req: CreatePersonaReq) -> dict:
+    return create_persona(**req.model_dump())
+
+
+# ── Assign team member ────────────────────────────────
+def _assign(req: AssignReq) -> dict:
+    return assign_team_member(req.member, req.persona)
+
+
+# ── Get team assignments ──────────────────────────────
+def _team(req: None) -> dict:
+    return {"success": True, "assignments": get_team_assignments()}
+
+
+# ── Get persona for specific team member ──────────────
+def _member_persona(req: MemberReq) -> dict:
+    persona = get_persona_for_team_member(req.member)
+    return {"success": True, "persona": persona}
+
+
+# ── Set default persona ───────────────────────────────
+def _set_default(req: PersonaReq) -> dict:
+    return set_default_persona(req.persona)
+
+
+# ── Reload config ─────────────────────────────────────
+def _reload(req: None) -> dict:
+    reload_config()
+    return {"success": True, "message": "Config reloaded"}
+
+
+ACTIONS = {
+    "current": (_current, CurrentReq),
+    "list": (_list, None),
+    "get": (_get, PersonaReq),
+    "create": (_create, CreatePersonaReq),
+    "assign": (_assign, AssignReq),
+    "team": (_team, None),
+    "member_persona": (_member_persona, MemberReq),
+    "set_default": (_set_default, PersonaReq),
+    "reload": (_reload, None),
+}
+
 
 def handle_api(request_data: dict, agent=None) -> dict:
     """Route branding actions."""
-    action = request_data.get("action", "")
-
-    try:
-        # ── Get current branding (for dashboard) ─────────────
-        if action == "current" or action == "":
-            persona_key = request_data.get("persona", None)
-            return {"success": True, "branding": get_branding_data(persona_key)}
-
-        # ── List all personas ─────────────────────────────────
-        elif action == "list":
-            return {"success": True, "personas": list_personas(), "default": get_default_persona_name()}
-
-        # ── Get specific persona ──────────────────────────────
-        elif action == "get":
-            name = request_data.get("persona", "")
-            if not name:
-                return {"error": "persona key is required"}
-            persona = get_persona(name)
-            return {"success": True, "persona": persona}
-
-        # ── Create / update persona ───────────────────────────
-        elif action == "create":
-            key = request_data.get("key", "")
-            display_name = request_data.get("display_name", "")
-            if not key or not display_name:
-                return {"error": "key and display_name are required"}
-            result = create_persona(
-                key=key,
-                display_name=display_name,
-                tagline=request_data.get("tagline", ""),
-                avatar=request_data.get("avatar", "⭐"),
-                theme_color=request_data.get("theme_color", "#00d4ff"),
-                voice_persona=request_data.get("voice_persona", "professional"),
-                elevenlabs_voice_id=request_data.get("elevenlabs_voice_id", ""),
-                greeting=request_data.get("greeting", ""),
-                system_style=request_data.get("system_style", ""),
-            )
-            return result
-
-        # ── Assign team member ────────────────────────────────
-        elif action == "assign":
-            member_id = request_data.get("member", "")
-            persona_key = request_data.get("persona", "")
-            if not member_id or not persona_key:
-                return {"error": "member and persona are required"}
-            return assign_team_member(member_id, persona_key)
-
-        # ── Get team assignments ──────────────────────────────
-        elif action == "team":
-            return {"success": True, "assignments": get_team_assignments()}
-
-        # ── Get persona for specific team member ──────────────
-        elif action == "member_persona":
-            member_id = request_data.get("member", "")
-            if not member_id:
-                return {"error": "member ID is required"}
-            persona = get_persona_for_team_member(member_id)
-            return {"success": True, "persona": persona}
-
-        # ── Set default persona ───────────────────────────────
-        elif action == "set_default":
-            persona_key = request_data.get("persona", "")
-            if not persona_key:
-                return {"error": "persona key is required"}
-            return set_default_persona(persona_key)
-
-        # ── Reload config ─────────────────────────────────────
-        elif action == "reload":
-            reload_config()
-            return {"success": True, "message": "Config reloaded"}
-
-        else:
-            return {
-                "error": f"Unknown action: {action}",
-                "available_actions": [
-                    "current", "list", "get", "create",
-                    "assign", "team", "member_persona",
-                    "set_default", "reload",
-                ],
-            }
-
-    except Exception as e:
-        return {"error": str(e), "trace": traceback.format_exc()}
+    return dispatch_action(ACTIONS, request_data, logger, "branding", default_action="current")
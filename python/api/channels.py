@@ -3,8 +3,11 @@ BFF Channel Router API — /channels endpoint
 Provides channel management, inbound message routing, and outbound formatting.
 """
 
-import json
-import traceback
+import logging
+from functools import lru_cache
+from typing import Annotated
+from pydantic import BaseModel, Field
+from python.helpers.errors import dispatch_action
 from python.helpers.bff_channel_router import (
     route_inbound,
     format_outbound,
@@ -12,55 +15,77 @@ from python.helpers.bff_channel_router import (
     CHANNEL_PRIORITIES,
 )
 
+logger = logging.getLogger(__name__)
+
+
+NonEmpty = Annotated[str, Field(min_length=1)]
+
+
+# Request models
+class InboundReq(BaseModel):
+    channel: NonEmpty
+    payload: dict = Field(default_factory=dict)
+
+
+class OutboundReq(BaseModel):
+    channel: NonEmpty
+    response_text: NonEmpty
+    conversation_id: str = ""
+    metadata: dict = Field(default_factory=dict)
+
+
+class RouteInfoReq(BaseModel):
+    channel: str = "web_chat"
+
+
+def _inbound(req: InboundReq) -> dict:
+    message = route_inbound(req.channel, req.payload)
+    if message:
+        return {"success": True, "message": message.to_dict()}
+    return {"error": f"Failed to normalize message from channel: {req.channel}"}
+
+
+def _outbound(req: OutboundReq) -> dict:
+    formatted = format_outbound(req.channel, req.response_text, req.conversation_id, req.metadata)
+    return {"success": True, "formatted": formatted}
+
+
+@lru_cache(maxsize=1)
+def _channels_response() -> dict:
+    """
+    Built once: priorities are constant and the BFF config is loaded once
+    per process. The returned dict is shared and must be treated as read-only.
+    """
+    channels = {}
+    for ch, priority in CHANNEL_PRIORITIES.items():
+        channels[ch] = {
+            "priority": priority,
+            "default_agent": get_default_agent(ch),
+        }
+    return {"success": True, "channels": channels}
+
+
+def _channels(req: None) -> dict:
+    return _channels_response()
+
+
+def _route_info(req: RouteInfoReq) -> dict:
+    return {
+        "success": True,
+        "channel": req.channel,
+        "default_agent": get_default_agent(req.channel),
+        "priority": CHANNEL_PRIORITIES.get(req.channel, 50),
+    }
+
+
+ACTIONS = {
+    "inbound": (_inbound, InboundReq),
+    "outbound": (_outbound, OutboundReq),
+    "channels": (_channels, None),
+    "route_info": (_route_info, RouteInfoReq),
+}
+
 
 def handle_api(request_data: dict, agent=None) -> dict:
     """Route BFF channel actions."""
-    action = request_data.get("action", "")
-
-    try:
-        if action == "inbound":
-            channel = request_data.get("channel", "")
-            raw_payload = request_data.get("payload", {})
-            if not channel:
-                return {"error": "channel is required"}
-            message = route_inbound(channel, raw_payload)
-            if message:
-                return {"success": True, "message": message.__dict__}
-            return {"error": f"Failed to normalize message from channel: {channel}"}
-
-        elif action == "outbound":
-            channel = request_data.get("channel", "")
-            response_text = request_data.get("response_text", "")
-            conversation_id = request_data.get("conversation_id", "")
-            metadata = request_data.get("metadata", {})
-            if not channel or not response_text:
-                return {"error": "channel and response_text are required"}
-            formatted = format_outbound(channel, response_text, conversation_id, metadata)
-            return {"success": True, "formatted": formatted}
-
-        elif action == "channels":
-            channels = {}
-            for ch, priority in CHANNEL_PRIORITIES.items():
-                channels[ch] = {
-                    "priority": priority,
-                    "default_agent": get_default_agent(ch),
-                }
-            return {"success": True, "channels": channels}
-
-        elif action == "route_info":
-            channel = request_data.get("channel", "web_chat")
-            return {
-                "success": True,
-                "channel": channel,
-                "default_agent": get_default_agent(channel),
-                "priority": CHANNEL_PRIORITIES.get(channel, 50),
-            }
-
-        else:
-            return {
-                "error": f"Unknown action: {action}",
-                "available_actions": ["inbound", "outbound", "channels", "route_info"],
-            }
-
-    except Exception as e:
-        return {"error": str(e), "trace": traceback.format_exc()}
+    return dispatch_action(ACTIONS, request_data, logger, "channels")
@@ -3,8 +3,11 @@ Content Automation API — /content endpoint
 Provides CRUD for content pieces, calendar management, and brief generation.
 """
 
-import json
-import traceback
+import logging
+from functools import lru_cache
+from typing import Annotated
+from pydantic import BaseModel, Field
+from python.helpers.errors import dispatch_action
 from python.helpers.content_automation import (
     create_content,
     update_content,
@@ -14,81 +17,99 @@ from python.helpers.content_automation import (
     CONTENT_TEMPLATES,
 )
 
+logger = logging.getLogger(__name__)
+
+
+NonEmpty = Annotated[str, Field(min_length=1)]
+
+
+# Request models
+class CreateContentReq(BaseModel):
+    content_type: str = "blog"
+    topic: NonEmpty
+    client_name: str = ""
+    notes: str = ""
+
+
+class UpdateContentReq(BaseModel):
+    content_id: NonEmpty
+    updates: dict = Field(default_factory=dict)
+
+
+class ContentIdReq(BaseModel):
+    content_id: NonEmpty
+
+
+class CalendarReq(BaseModel):
+    days: int = 30
+
+
+class BriefReq(BaseModel):
+    content_type: str = "blog"
+    topic: NonEmpty
+
+
+def _create(req: CreateContentReq) -> dict:
+    piece = create_content(
+        content_type=req.content_type,
+        topic=req.topic,
+        client_name=req.client_name,
+        notes=req.notes,
+    )
+    return {"success": True, "content": piece.to_dict()}
+
+
+def _update(req: UpdateContentReq) -> dict:
+    piece = update_content(req.content_id, req.updates)
+    if piece:
+        return {"success": True, "content": piece.to_dict()}
+    return {"error": f"Content {req.content_id} not found"}
+
+
+def _get(req: ContentIdReq) -> dict:
+    piece = get_content(req.content_id)
+    if piece:
+        return {"success": True, "content": piece.to_dict()}
+    return {"error": f"Content {req.content_id} not found"}
+
+
+def _calendar(req: CalendarReq) -> dict:
+    calendar = get_content_calendar(days=req.days)
+    return {"success": True, "calendar": calendar}
+
+
+@lru_cache(maxsize=1)
+def _templates_response() -> dict:
+    """Built once from the constant templates; shared, treat as read-only."""
+    templates = {}
+    for k, v in CONTENT_TEMPLATES.items():
+        templates[k] = {
+            "sections": v["sections"],
+            "tone": v["tone"],
+            "target_words": v["target_words"],
+        }
+    return {"success": True, "templates": templates}
+
+
+def _templates(req: None) -> dict:
+    return _templates_response()
+
+
+def _generate_brief(req: BriefReq) -> dict:
+    brief = generate_content_brief(content_type=req.content_type, topic=req.topic)
+    return {"success": True, "brief": brief}
+
+
+ACTIONS = {
+    "create": (_create, CreateContentReq),
+    "update": (_update, UpdateContentReq),
+    "get": (_get, ContentIdReq),
+    "calendar": (_calendar, CalendarReq),
+    "templates": (_templates, None),
+    "generate_brief": (_generate_brief, BriefReq),
+}
+
 
 def handle_api(request_data: dict, agent=None) -> dict:
     """Route content automation actions."""
-    action = request_data.get("action", "")
-
-    try:
-        if action == "create":
-            content_type = request_data.get("content_type", "blog")
-            topic = request_data.get("topic", "")
-            client_name = request_data.get("client_name", "")
-            notes = request_data.get("notes", "")
-            if not topic:
-                return {"error": "topic is required"}
-            piece = create_content(
-                content_type=content_type,
-                topic=topic,
-                client_name=client_name,
-                notes=notes,
-            )
-            return {"success": True, "content": piece.__dict__}
-
-        elif action == "update":
-            content_id = request_data.get("content_id", "")
-            updates = request_data.get("updates", {})
-            if not content_id:
-                return {"error": "content_id is required"}
-            piece = update_content(content_id, updates)
-            if piece:
-                return {"success": True, "content": piece.__dict__}
-            return {"error": f"Content {content_id} not found"}
-
-        elif action == "get":
-            content_id = request_data.get("content_id", "")
-            if not content_id:
-                return {"error": "content_id is required"}
-            piece = get_content(content_id)
-            if piece:
-                return {"success": True, "content": piece.__dict__}
-            return {"error": f"Content {content_id} not found"}
-
-        elif action == "calendar":
-            days = request_data.get("days", 30)
-            calendar = get_content_calendar(days=days)
-            return {"success": True, "calendar": calendar}
-
-        elif action == "templates":
-            templates = {}
-            for k, v in CONTENT_TEMPLATES.items():
-                templates[k] = {
-                    "sections": v["sections"],
-                    "tone": v["tone"],
-                    "target_words": v["target_words"],
-                }
-            return {"success": True, "templates": templates}
-
-        elif action == "generate_brief":
-            content_type = request_data.get("content_type", "blog")
-            topic = request_data.get("topic", "")
-            if not topic:
-                return {"error": "topic is required"}
-            brief = generate_content_brief(content_type=content_type, topic=topic)
-            return {"success": True, "brief": brief}
-
-        else:
-            return {
-                "error": f"Unknown action: {action}",
-                "available_actions": [
-                    "create",
-                    "update",
-                    "get",
-                    "calendar",
-                    "templates",
-                    "generate_brief",
-                ],
-            }
-
-    except Exception as e:
-        return {"error": str(e), "trace": traceback.format_exc()}
+    return dispatch_action(ACTIONS, request_data, logger, "content")
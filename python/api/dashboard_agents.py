@@ -10,11 +10,23 @@ Actions:
   - loop: Get orchestrator loop state
 """
 
+import asyncio
 import os
-import json
-from datetime import datetime, timezone
 from flask import Request
 from python.helpers.api import ApiHandler, Input, Output
+from python.helpers.json_cache import load_json_cached
+from python.helpers.swarm_index import load_index
+from python.helpers.clock import now_iso
+
+try:
+    from python.helpers.cost_tracker import CostTracker
+    _HAS_COST = True
+except ImportError:
+    _HAS_COST = False
+
+
+async def _aload(path: str):
+    return await asyncio.to_thread(load_json_cached, path)
 
 
 class DashboardAgents(ApiHandler):
@@ -42,7 +54,7 @@ class DashboardAgents(ApiHandler):
         # Load orchestration config for roster
         try:
             from python.helpers.orchestration_config import load_orchestration_config
-            config = load_orchestration_config()
+            config = await asyncio.to_thread(load_orchestration_config)
             for agent_def in config.agents:
                 agents.append({
                     "id": agent_def.id,
@@ -55,28 +67,8 @@ class DashboardAgents(ApiHandler):
         except ImportError:
             pass
 
-        # Check for active tasks per agent from swarm data
-        swarm_dir = "tmp/swarms"
-        active_tasks = {}
-        if os.path.exists(swarm_dir):
-            for fname in os.listdir(swarm_dir):
-                if fname.endswith(".json"):
-                    try:
-                        with open(os.path.join(swarm_dir, fname), "r") as f:
-                            swarm = json.load(f)
-                            for task in swarm.get("tasks", []):
-                                profile = task.get("agent_profile", "default")
-                                if profile not in active_tasks:
-                                    active_tasks[profile] = {"running": 0, "completed": 0, "failed": 0}
-                                status = task.get("status", "pending")
-                                if status == "running":
-                                    active_tasks[profile]["running"] += 1
-                                elif status == "completed":
-                                    active_tasks[profile]["completed"] += 1
-                                elif status in ("failed", "timeout"):
-                                    active_tasks[profile]["failed"] += 1
-                    except Exception:
-                        pass
+        # Active task counts per agent, pre-aggregated from swarm data
+        active_tasks = (await asyncio.to_thread(load_index))["profile_counts"]
 
         # Merge task counts into agent status
         for agent in agents:
@@ -86,7 +78,7 @@ class DashboardAgents(ApiHandler):
                 if active_tasks[agent_id]["running"] > 0:
                     agent["status"] = "active"
 
-        return {"ok": True, "agents": agents, "timestamp": datetime.now(timezone.utc).isoformat()}
+        return {"ok": True, "agents": agents, "timestamp": now_iso()}
 
     async def _health(self, input: Input) -> Output:
         """Health check for a specific agent."""
@@ -96,26 +88,22 @@ class DashboardAgents(ApiHandler):
 
         # Check cost tracker for agent spend
         spend = None
-        try:
-            from python.helpers.cost_tracker import CostTracker
-            tracker = CostTracker.get()
-            spend = tracker.get_agent_spend(agent_id)
-        except ImportError:
-            pass
+        if _HAS_COST:
+            spend = await asyncio.to_thread(CostTracker.get().get_agent_spend, agent_id)
 
         return {
             "ok": True,
             "agent_id": agent_id,
             "health": "ok",
             "spend_today": spend,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now_iso(),
         }
 
     async def _roster(self) -> Output:
         """Get full agent roster from orchestration config."""
         try:
             from python.helpers.orchestration_config import load_orchestration_config
-            config = load_orchestration_config()
+            config = await asyncio.to_thread(load_orchestration_config)
             roster = []
             for agent_def in config.agents:
                 roster.append({
@@ -132,36 +120,16 @@ class DashboardAgents(ApiHandler):
 
     async def _swarms(self) -> Output:
         """List active and recent swarm executions."""
-        swarms = []
-        swarm_dir = "tmp/swarms"
-        if os.path.exists(swarm_dir):
-            for fname in os.listdir(swarm_dir):
-                if fname.endswith(".json"):
-                    try:
-                        with open(os.path.join(swarm_dir, fname), "r") as f:
-                            data = json.load(f)
-                            swarms.append({
-                                "swarm_id": data.get("swarm_id"),
-                                "name": data.get("name"),
-                                "status": data.get("status"),
-                                "created_at": data.get("created_at"),
-                                "progress": data.get("progress", {}),
-                                "task_count": data.get("task_count", 0),
-                            })
-                    except Exception:
-                        pass
-
-        # Sort by created_at descending
-        swarms.sort(key=lambda s: s.get("created_at", ""), reverse=True)
-        return {"ok": True, "swarms": swarms[:20]}
+        # Index keeps swarms sorted by created_at descending
+        index = await asyncio.to_thread(load_index)
+        return {"ok": True, "swarms": index["swarms"][:20]}
 
     async def _loop_state(self) -> Output:
         """Get orchestrator loop state."""
         loop_state_file = "tmp/orchestrator/loop_state.json"
         if os.path.exists(loop_state_file):
             try:
-                with open(loop_state_file, "r") as f:
-                    state = json.load(f)
+                state = await _aload(loop_state_file)
                 return {"ok": True, "loop_state": state}
             except Exception:
                 return {"ok": False, "error": "Failed to read loop state"}
@@ -10,11 +10,15 @@ Actions:
   - export: Export audit data as JSON
 """
 
+import asyncio
+import heapq
 import os
-import json
 from datetime import datetime, timezone, timedelta
 from flask import Request
 from python.helpers.api import ApiHandler, Input, Output
+from python.helpers import dashboard_db, fastjson
+from python.helpers.json_cache import load_json_cached
+from python.helpers.swarm_index import load_index
 
 
 class DashboardAudit(ApiHandler):
@@ -40,121 +44,72 @@ class DashboardAudit(ApiHandler):
     async def _recent(self, input: Input) -> Output:
         """Get recent audit events from all sources."""
         limit = int(input.get("limit", 50))
+        cutoff = dashboard_db.audit_cutoff()
         events = []
 
         # Collect from orchestrator loop state
         loop_state_file = "tmp/orchestrator/loop_state.json"
         if os.path.exists(loop_state_file):
             try:
-                with open(loop_state_file, "r") as f:
-                    state = json.load(f)
-                    events.append({
-                        "type": "loop_cycle",
-                        "timestamp": state.get("last_cycle", ""),
-                        "details": f"Cycle #{state.get('cycle_number', 0)} — {state.get('actions_taken', 0)} actions, {state.get('cycle_ms', 0)}ms",
-                    })
+                state = await asyncio.to_thread(load_json_cached, loop_state_file)
+                events.append({
+                    "type": "loop_cycle",
+                    "timestamp": state.get("last_cycle", ""),
+                    "details": f"Cycle #{state.get('cycle_number', 0)} — {state.get('actions_taken', 0)} actions, {state.get('cycle_ms', 0)}ms",
+                })
             except Exception:
                 pass
 
-        # Collect from swarm executions
-        swarm_dir = "tmp/swarms"
-        if os.path.exists(swarm_dir):
-            for fname in sorted(os.listdir(swarm_dir), reverse=True)[:10]:
-                if fname.endswith(".json"):
-                    try:
-                        with open(os.path.join(swarm_dir, fname), "r") as f:
-                            swarm = json.load(f)
-                            events.append({
-                                "type": "swarm",
-                                "timestamp": swarm.get("created_at", ""),
-                                "details": f"Swarm '{swarm.get('name', '')}' [{swarm.get('status', '')}] — {swarm.get('task_count', 0)} tasks",
-                            })
-                            # Add individual task completions
-                            for task in swarm.get("tasks", []):
-                                if task.get("completed_at"):
-                                    events.append({
-                                        "type": "task_complete",
-                                        "timestamp": task.get("completed_at", ""),
-                                        "details": f"[{task.get('status', '')}] {task.get('agent_profile', '')}: {task.get('description', '')[:60]}",
-                                    })
-                    except Exception:
-                        pass
-
-        # Collect from cost tracking
-        cost_dir = "tmp/cost_tracking"
+        # Collect swarm executions from the pre-aggregated index
+        index = await asyncio.to_thread(load_index)
+        for swarm in index["swarms"][:10]:
+            if (swarm.get("created_at") or "") < cutoff:
+                break  # newest first; the rest are outside the audit window
+            events.append({
+                "type": "swarm",
+                "timestamp": swarm.get("created_at", ""),
+                "details": f"Swarm '{swarm.get('name', '')}' [{swarm.get('status', '')}] — {swarm.get('task_count', 0)} tasks",
+            })
+
+        # Individual task completions, newest first
+        completions = await asyncio.to_thread(dashboard_db.recent_task_completions, limit, cutoff)
+        for task in completions:
+            events.append({
+                "type": "task_complete",
+                "timestamp": task["completed_at"],
+                "details": f"[{task['status']}] {task['agent_profile']}: {task['description'][:60]}",
+            })
+
+        # High-cost calls from today's cost tracking
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        cost_file = os.path.join(cost_dir, f"costs_{today}.json")
-        if os.path.exists(cost_file):
-            try:
-                with open(cost_file, "r") as f:
-                    entries = json.load(f)
-                    # Only include high-cost calls
-                    for entry in entries:
-                        if entry.get("estimated_cost", 0) > 0.01:
-                            events.append({
-                                "type": "cost_event",
-                                "timestamp": entry.get("timestamp", ""),
-                                "details": f"${entry.get('estimated_cost', 0):.4f} — {entry.get('model', '')} ({entry.get('agent_id', '')})",
-                            })
-            except Exception:
-                pass
-
-        # Sort by timestamp descending
-        events.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
-        return {"ok": True, "events": events[:limit], "total": len(events)}
+        high_cost = await asyncio.to_thread(dashboard_db.high_cost_entries, today, 0.01, limit)
+        for entry in high_cost:
+            events.append({
+                "type": "cost_event",
+                "timestamp": entry["ts"],
+                "details": f"${entry['estimated_cost']:.4f} — {entry['model']} ({entry['agent_id']})",
+            })
+
+        # Newest first
+        newest = heapq.nlargest(limit, events, key=lambda e: e.get("timestamp", ""))
+        return {"ok": True, "events": newest, "total": len(events)}
 
     async def _routing(self, input: Input) -> Output:
         """Get task routing decisions log."""
         limit = int(input.get("limit", 30))
 
-        # Read from task queue for routed tasks
-        task_queue_path = "memory/agent_zero/task_queue.json"
-        routed = []
-        if os.path.exists(task_queue_path):
-            try:
-                with open(task_queue_path, "r") as f:
-                    tasks = json.load(f)
-                    for task in tasks:
-                        if task.get("status") == "routed":
-                            routed.append({
-                                "task_id": task.get("id", ""),
-                                "description": task.get("description", task.get("task", ""))[:80],
-                                "routed_to": task.get("routed_to", ""),
-                                "routed_at": task.get("routed_at", ""),
-                            })
-            except Exception:
-                pass
-
-        routed.sort(key=lambda r: r.get("routed_at", ""), reverse=True)
-        return {"ok": True, "routing_decisions": routed[:limit]}
+        # Routed tasks from the task queue, mirrored into the dashboard DB
+        routed = await asyncio.to_thread(dashboard_db.routing_decisions, limit)
+        return {"ok": True, "routing_decisions": routed}
 
     async def _errors(self, input: Input) -> Output:
         """Get recent errors."""
         limit = int(input.get("limit", 20))
-        errors = []
-
-        # Check swarm task errors
-        swarm_dir = "tmp/swarms"
-        if os.path.exists(swarm_dir):
-            for fname in os.listdir(swarm_dir):
-                if fname.endswith(".json"):
-                    try:
-                        with open(os.path.join(swarm_dir, fname), "r") as f:
-                            swarm = json.load(f)
-                            for task in swarm.get("tasks", []):
-                                if task.get("error"):
-                                    errors.append({
-                                        "timestamp": task.get("completed_at", ""),
-                                        "source": f"swarm/{swarm.get('swarm_id', '')}",
-                                        "agent": task.get("agent_profile", ""),
-                                        "error": task.get("error", ""),
-                                        "task": task.get("description", "")[:60],
-                                    })
-                    except Exception:
-                        pass
-
-        errors.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
-        return {"ok": True, "errors": errors[:limit]}
+
+        # Swarm task errors, pre-aggregated and sorted newest first
+        cutoff = dashboard_db.audit_cutoff()
+        errors = (await asyncio.to_thread(load_index))["errors"][:limit]
+        return {"ok": True, "errors": [e for e in errors if (e["timestamp"] or "") >= cutoff]}
 
     async def _recovery(self, input: Input) -> Output:
         """Get recovery actions from orchestrator."""
@@ -174,10 +129,12 @@ class DashboardAudit(ApiHandler):
         """Export audit data as JSON."""
         days = int(input.get("days", 1))
         
-        # Aggregate all audit data
-        recent = await self._recent({"limit": 500})
-        routing = await self._routing({"limit": 100})
-        errors = await self._errors({"limit": 100})
+        # Aggregate all audit data; the sources are independent, so read them concurrently
+        recent, routing, errors = await asyncio.gather(
+            self._recent({"limit": 500}),
+            self._routing({"limit": 100}),
+            self._errors({"limit": 100}),
+        )
 
         export_data = {
             "exported_at": datetime.now(timezone.utc).isoformat(),
@@ -190,8 +147,7 @@ class DashboardAudit(ApiHandler):
         # Save to tmp
         os.makedirs("tmp/audit", exist_ok=True)
         export_file = f"tmp/audit/export_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.json"
-        with open(export_file, "w") as f:
-            json.dump(export_data, f, indent=2)
+        await asyncio.to_thread(fastjson.dump_file_streaming, export_file, export_data)
 
         return {
             "ok": True,
@@ -11,11 +11,18 @@ Actions:
   - history: Get cost history for date range
 """
 
-import os
-import json
+import asyncio
 from datetime import datetime, timezone, timedelta
 from flask import Request
 from python.helpers.api import ApiHandler, Input, Output
+from python.helpers import dashboard_db
+from python.helpers.clock import now_iso
+
+try:
+    from python.helpers.cost_tracker import CostTracker
+    _HAS_COST = True
+except ImportError:
+    _HAS_COST = False
 
 
 class DashboardCost(ApiHandler):
@@ -40,120 +47,102 @@ class DashboardCost(ApiHandler):
 
     async def _summary(self) -> Output:
         """Get overall cost summary."""
-        try:
-            from python.helpers.cost_tracker import CostTracker
-            tracker = CostTracker.get()
-            return {
-                "ok": True,
-                "daily_spend": tracker.get_daily_spend(),
-                "monthly_spend": tracker.get_monthly_spend(),
-                "budget_status": tracker.get_budget_status(),
-                "model_breakdown": tracker.get_model_breakdown(),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-        except ImportError:
+        if not _HAS_COST:
             return {"ok": False, "error": "Cost tracker not available"}
+        tracker = CostTracker.get()
+        return {
+            "ok": True,
+            "daily_spend": await asyncio.to_thread(tracker.get_daily_spend),
+            "monthly_spend": await asyncio.to_thread(tracker.get_monthly_spend),
+            "budget_status": await asyncio.to_thread(tracker.get_budget_status),
+            "model_breakdown": await asyncio.to_thread(tracker.get_model_breakdown),
+            "timestamp": now_iso(),
+        }
 
     async def _daily(self) -> Output:
         """Get today's cost breakdown."""
-        try:
-            from python.helpers.cost_tracker import CostTracker
-            tracker = CostTracker.get()
-            return {
-                "ok": True,
-                "date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-                "total_spend": tracker.get_daily_spend(),
-                "breakdown": tracker.get_daily_breakdown(),
-            }
-        except ImportError:
+        if not _HAS_COST:
             return {"ok": False, "error": "Cost tracker not available"}
+        tracker = CostTracker.get()
+        return {
+            "ok": True,
+            "date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+            "total_spend": await asyncio.to_thread(tracker.get_daily_spend),
+            "breakdown": await asyncio.to_thread(tracker.get_daily_breakdown),
+        }
 
     async def _agents(self) -> Output:
         """Get per-agent cost breakdown."""
+        if not _HAS_COST:
+            return {"ok": False, "error": "Cost tracker not available"}
+        tracker = CostTracker.get()
+
+        # Get agent roster for full picture
+        agent_costs = {}
         try:
-            from python.helpers.cost_tracker import CostTracker
-            tracker = CostTracker.get()
-
-            # Get agent roster for full picture
-            agent_costs = {}
-            try:
-                from python.helpers.orchestration_config import load_orchestration_config
-                config = load_orchestration_config()
-                for agent_def in config.agents:
-                    agent_costs[agent_def.id] = {
-                        "name": agent_def.name,
-                        "spend_today": tracker.get_agent_spend(agent_def.id),
-                        "budget_exceeded": tracker.is_agent_budget_exceeded(agent_def.id),
-                    }
-            except ImportError:
-                pass
-
-            return {"ok": True, "agent_costs": agent_costs}
+            from python.helpers.orchestration_config import load_orchestration_config
+            config = await asyncio.to_thread(load_orchestration_config)
+            spend_map = await asyncio.to_thread(
+                tracker.get_all_agent_spend_map, tuple(a.id for a in config.agents)
+            )
+            for agent_def in config.agents:
+                spend, exceeded = spend_map[agent_def.id]
+                agent_costs[agent_def.id] = {
+                    "name": agent_def.name,
+                    "spend_today": spend,
+                    "budget_exceeded": exceeded,
+                }
         except ImportError:
-            return {"ok": False, "error": "Cost tracker not available"}
+            pass
+
+        return {"ok": True, "agent_costs": agent_costs}
 
     async def _models(self) -> Output:
         """Get per-model cost breakdown."""
-        try:
-            from python.helpers.cost_tracker import CostTracker
-            tracker = CostTracker.get()
-            return {
-                "ok": True,
-                "model_breakdown": tracker.get_model_breakdown(),
-            }
-        except ImportError:
+        if not _HAS_COST:
             return {"ok": False, "error": "Cost tracker not available"}
+        tracker = CostTracker.get()
+        return {
+            "ok": True,
+            "model_breakdown": await asyncio.to_thread(tracker.get_model_breakdown),
+        }
 
     async def _budget(self, input: Input) -> Output:
         """Get or set budget configuration."""
-        try:
-            from python.helpers.cost_tracker import CostTracker
-            tracker = CostTracker.get()
-
-            # SET operations
-            new_monthly_cap = input.get("monthly_cap")
-            if new_monthly_cap is not None:
-                tracker.set_monthly_cap(float(new_monthly_cap))
-
-            new_agent_cap = input.get("agent_cap")
-            agent_id = input.get("agent_id")
-            if new_agent_cap is not None and agent_id:
-                tracker.set_agent_cap(agent_id, float(new_agent_cap))
-
-            return {
-                "ok": True,
-                "budget_status": tracker.get_budget_status(),
-            }
-        except ImportError:
+        if not _HAS_COST:
             return {"ok": False, "error": "Cost tracker not available"}
+        tracker = CostTracker.get()
+
+        # SET operations
+        new_monthly_cap = input.get("monthly_cap")
+        if new_monthly_cap is not None:
+            tracker.set_monthly_cap(float(new_monthly_cap))
+
+        new_agent_cap = input.get("agent_cap")
+        agent_id = input.get("agent_id")
+        if new_agent_cap is not None and agent_id:
+            tracker.set_agent_cap(agent_id, float(new_agent_cap))
+
+        return {
+            "ok": True,
+            "budget_status": await asyncio.to_thread(tracker.get_budget_status),
+        }
 
     async def _history(self, input: Input) -> Output:
         """Get cost history for a date range."""
         days = int(input.get("days", 7))
-        cost_dir = "tmp/cost_tracking"
-        history = []
+        today = datetime.now(timezone.utc).date()
+        since = (today - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+        totals = await asyncio.to_thread(dashboard_db.daily_cost_totals, since)
 
-        if os.path.exists(cost_dir):
-            today = datetime.now(timezone.utc).date()
-            for i in range(days):
-                date = today - timedelta(days=i)
-                date_str = date.strftime("%Y-%m-%d")
-                fname = os.path.join(cost_dir, f"costs_{date_str}.json")
-                day_total = 0.0
-                call_count = 0
-                if os.path.exists(fname):
-                    try:
-                        with open(fname, "r") as f:
-                            entries = json.load(f)
-                            for entry in entries:
-                                day_total += entry.get("estimated_cost", 0)
-                                call_count += 1
-                    except Exception:
-                        pass
-                history.append({
-                    "date": date_str,
-                    "total_cost": round(day_total, 4),
-                    "call_count": call_count,
-                })
+        history = []
+        for i in range(days):
+            date_str = (today - timedelta(days=i)).strftime("%Y-%m-%d")
+            day_total, call_count = totals.get(date_str, (0.0, 0))
+            history.append({
+                "date": date_str,
+                "total_cost": round(day_total, 4),
+                "call_count": call_count,
+            })
 
         return {"ok": True, "history": history, "days": days}
@@ -10,10 +10,18 @@ Actions:
   - triples: Get knowledge graph triples for a subject
 """
 
+import asyncio
+import heapq
 import os
-import json
 from flask import Request
 from python.helpers.api import ApiHandler, Input, Output
+from python.helpers.json_cache import load_json_cached
+from python.helpers.tkgm_summary import get_summary
+from python.helpers.triples_index import find_triples
+
+
+async def _aload(path: str):
+    return await asyncio.to_thread(load_json_cached, path)
 
 
 class DashboardKnowledge(ApiHandler):
@@ -36,50 +44,21 @@ class DashboardKnowledge(ApiHandler):
 
     async def _stats(self) -> Output:
         """Get overall knowledge base statistics."""
+        summary = await asyncio.to_thread(get_summary)
         stats = {
-            "total_fragments": 0,
-            "total_triples": 0,
+            "total_fragments": summary["total_fragments"],
+            "total_triples": summary["total_triples"],
             "total_ingested_files": 0,
-            "domains": {},
-            "temporal_coverage": {"earliest": None, "latest": None},
+            "domains": {domain: d["count"] for domain, d in summary["domains"].items()},
+            "temporal_coverage": summary["temporal_coverage"],
         }
 
-        # Count TKGM triples
-        tkgm_dir = "memory"
-        if os.path.exists(tkgm_dir):
-            for root, dirs, files in os.walk(tkgm_dir):
-                for fname in files:
-                    if fname == "tkgm_triples.json":
-                        try:
-                            with open(os.path.join(root, fname), "r") as f:
-                                triples = json.load(f)
-                                stats["total_triples"] += len(triples)
-                        except Exception:
-                            pass
-                    elif fname == "tkgm_temporal.json":
-                        try:
-                            with open(os.path.join(root, fname), "r") as f:
-                                temporal = json.load(f)
-                                stats["total_fragments"] += len(temporal)
-                                for key, meta in temporal.items():
-                                    domain = meta.get("domain", "unknown")
-                                    stats["domains"][domain] = stats["domains"].get(domain, 0) + 1
-                                    created = meta.get("created_at", "")
-                                    if created:
-                                        if not stats["temporal_coverage"]["earliest"] or created < stats["temporal_coverage"]["earliest"]:
-                                            stats["temporal_coverage"]["earliest"] = created
-                                        if not stats["temporal_coverage"]["latest"] or created > stats["temporal_coverage"]["latest"]:
-                                            stats["temporal_coverage"]["latest"] = created
-                        except Exception:
-                            pass
-
         # Count ingested files
         ingestion_status = "tmp/knowledge_ingestion/status.json"
         if os.path.exists(ingestion_status):
             try:
-                with open(ingestion_status, "r") as f:
-                    records = json.load(f)
-                    stats["total_ingested_files"] = len(records)
+                records = await _aload(ingestion_status)
+                stats["total_ingested_files"] = len(records)
             except Exception:
                 pass
 
@@ -87,27 +66,8 @@ class DashboardKnowledge(ApiHandler):
 
     async def _domains(self) -> Output:
         """List all memory domains with item counts."""
-        domains = {}
-        tkgm_dir = "memory"
-        if os.path.exists(tkgm_dir):
-            for root, dirs, files in os.walk(tkgm_dir):
-                for fname in files:
-                    if fname == "tkgm_temporal.json":
-                        try:
-                            with open(os.path.join(root, fname), "r") as f:
-                                temporal = json.load(f)
-                                for key, meta in temporal.items():
-                                    domain = meta.get("domain", "unknown")
-                                    if domain not in domains:
-                                        domains[domain] = {"count": 0, "latest": ""}
-                                    domains[domain]["count"] += 1
-                                    created = meta.get("created_at", "")
-                                    if created > domains[domain]["latest"]:
-                                        domains[domain]["latest"] = created
-                        except Exception:
-                            pass
-
-        return {"ok": True, "domains": domains}
+        summary = await asyncio.to_thread(get_summary)
+        return {"ok": True, "domains": summary["domains"]}
 
     async def _recent(self, input: Input) -> Output:
         """Get recently ingested items."""
@@ -116,11 +76,9 @@ class DashboardKnowledge(ApiHandler):
         records = []
         if os.path.exists(ingestion_status):
             try:
-                with open(ingestion_status, "r") as f:
-                    all_records = json.load(f)
-                    # Sort by timestamp descending
-                    sorted_records = sorted(all_records, key=lambda r: r.get("ingested_at", ""), reverse=True)
-                    records = sorted_records[:limit]
+                all_records = await _aload(ingestion_status)
+                # Newest first
+                records = heapq.nlargest(limit, all_records, key=lambda r: r.get("ingested_at", ""))
             except Exception:
                 pass
 
@@ -148,19 +106,6 @@ class DashboardKnowledge(ApiHandler):
         if not subject:
             return {"error": "Provide 'subject' parameter"}
 
-        results = []
-        tkgm_dir = "memory"
-        if os.path.exists(tkgm_dir):
-            for root, dirs, files in os.walk(tkgm_dir):
-                for fname in files:
-                    if fname == "tkgm_triples.json":
-                        try:
-                            with open(os.path.join(root, fname), "r") as f:
-                                triples = json.load(f)
-                                for t in triples:
-                                    if subject.lower() in t.get("subject", "").lower():
-                                        results.append(t)
-                        except Exception:
-                            pass
-
-        return {"ok": True, "subject": subject, "triples": results[:50]}
+        results = await asyncio.to_thread(find_triples, subject, 50)
+
+        return {"ok": True, "subject": subject, "triples": results}
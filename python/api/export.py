@@ -8,84 +8,82 @@ Actions:
   - audit: Export audit trail
   - backup: Full platform backup
   - list: List available exports
+  - status: Poll a queued export by job_id
+
+Exports run as background jobs: the export actions answer 202 with a
+job_id right away, and the finished ExportJob appears in status's result.
+JSON knowledge exports and backups are zstd-compressed (.json.zst) unless
+the request passes "compress": false.
 """
 
 from flask import Request
+from python.helpers import background_jobs
 from python.helpers.api import ApiHandler, Input, Output
+from python.helpers.export_pipeline import (
+    export_knowledge,
+    export_costs,
+    export_audit,
+    export_full_backup,
+    list_exports,
+)
+
+
+def _run_export(export_fn, *args) -> dict:
+    return export_fn(*args).to_response_dict()
+
+
+def _queue(kind: str, export_fn, *args) -> Output:
+    job_id = background_jobs.submit("exports", kind, _run_export, export_fn, *args)
+    return background_jobs.queued_response(job_id)
 
 
 class ExportApi(ApiHandler):
 
     async def process(self, input: Input, request: Request) -> Output:
         action = input.get("action", "list")
-
-        if action == "knowledge":
-            return await self._export_knowledge(input)
-        elif action == "costs":
-            return await self._export_costs(input)
-        elif action == "audit":
-            return await self._export_audit(input)
-        elif action == "backup":
-            return await self._export_backup()
-        elif action == "list":
-            return await self._list()
-        else:
-            return {"error": f"Unknown action: {action}", "available": ["knowledge", "costs", "audit", "backup", "list"]}
+        handler = self.ACTIONS.get(action)
+        if handler is None:
+            return {"error": f"Unknown action: {action}", "available": list(self.ACTIONS)}
+        return await handler(self, input)
 
     async def _export_knowledge(self, input: Input) -> Output:
-        from python.helpers.export_pipeline import export_knowledge
         format = input.get("format", "json")
-        job = export_knowledge(format)
-        return {
-            "ok": job.status == "completed",
-            "job_id": job.job_id,
-            "status": job.status,
-            "output_path": job.output_path,
-            "record_count": job.record_count,
-            "error": job.error,
-        }
+        compress = bool(input.get("compress", True))
+        return _queue("knowledge", export_knowledge, format, compress)
 
     async def _export_costs(self, input: Input) -> Output:
-        from python.helpers.export_pipeline import export_costs
         days = int(input.get("days", 30))
         format = input.get("format", "json")
-        job = export_costs(days, format)
-        return {
-            "ok": job.status == "completed",
-            "job_id": job.job_id,
-            "status": job.status,
-            "output_path": job.output_path,
-            "record_count": job.record_count,
-            "error": job.error,
-        }
+        return _queue("costs", export_costs, days, format)
 
     async def _export_audit(self, input: Input) -> Output:
-        from python.helpers.export_pipeline import export_audit
         days = int(input.get("days", 7))
         format = input.get("format", "json")
-        job = export_audit(days, format)
-        return {
-            "ok": job.status == "completed",
-            "job_id": job.job_id,
-            "status": job.status,
-            "output_path": job.output_path,
-            "record_count": job.record_count,
-            "error": job.error,
-        }
-
-    async def _export_backup(self) -> Output:
-        from python.helpers.export_pipeline import export_full_backup
-        job = export_full_backup()
-        return {
-            "ok": job.status == "completed",
-            "job_id": job.job_id,
-            "status": job.status,
-            "output_path": job.output_path,
-            "record_count": job.record_count,
-            "error": job.error,
-        }
-
-    async def _list(self) -> Output:
-        from python.helpers.export_pipeline import list_exports
+        return _queue("audit", export_audit, days, format)
+
+    async def _export_backup(self, input: Input) -> Output:
+        compress = bool(input.get("compress", True))
+        return _queue("backup", export_full_backup, compress)
+
+    async def _status(self, input: Input) -> Output:
+        job_id = input.get("job_id", "")
+        if not job_id:
+            return {"error": "Provide 'job_id' parameter"}
+        job = background_jobs.status(job_id)
+        if job is None:
+            return {"ok": False, "error": f"Unknown job: {job_id}"}
+        return {"ok": job["state"] != "failed", **job}
+
+    async def _list(self, input: Input) -> Output:
         exports = list_exports()
         return {"ok": True, "exports": exports, "total": len(exports)}
+
+    # action -> handler
+    ACTIONS = {
+        "knowledge": _export_knowledge,
+        "costs": _export_costs,
+        "audit": _export_audit,
+        "backup": _export_backup,
+        "list": _list,
+        "status": _status,
+    }
@@ -11,14 +11,57 @@ Actions:
   - ingest_claude_export:  Ingest Claude export JSON
   - list_ingested:         List all ingestion records
   - status:                Get current pipeline status
+  - job_status:            Poll a queued ingest_file / ingest_directory job
+
+ingest_file and ingest_directory run as background jobs and answer 202
+with a job_id; the record (or directory summary) appears in job_status.
 
 Created: 2026-02-09
 """
 
+import asyncio
+import os
+from collections import Counter
+
+from python.helpers import background_jobs
 from python.helpers.api import ApiHandler, Input, Output
+from python.helpers.knowledge_ingestion import (
+    ingest_file,
+    ingest_directory,
+    get_ingestion_history,
+    get_ingestion_summary,
+)
+from python.helpers.memory import Memory
+from python.helpers.tkgm_memory import MemoryDomain
 from flask import Request
 
 
+async def _ingest_file_job(filepath, agent, source_type, area, domain) -> dict:
+    record = await ingest_file(filepath, agent, source_type, area, domain)
+    return {
+        "status": record.status,
+        "source_path": record.source_path,
+        "source_type": record.source_type,
+        "chunk_count": record.chunk_count,
+        "error": record.error,
+    }
+
+
+async def _ingest_directory_job(dirpath, agent, recursive, area, domain) -> dict:
+    records = await ingest_directory(dirpath, agent, recursive, area, domain)
+    counts = Counter(r.status for r in records)
+    return {
+        "total": len(records),
+        "completed": counts["completed"],
+        "failed": counts["failed"],
+        "skipped": counts["skipped"],
+        "total_chunks": sum(r.chunk_count for r in records),
+    }
+
+
+_AREAS = tuple(area.value for area in Memory.Area)
+
+
 class KnowledgeIngestHandler(ApiHandler):
 
     @classmethod
@@ -26,112 +69,108 @@ class KnowledgeIngestHandler(ApiHandler):
         return ["POST"]
 
     async def process(self, input: Input, request: Request) -> Output:
-        from python.helpers.knowledge_ingestion import (
-            ingest_file,
-            ingest_directory,
-            get_ingestion_history,
-            detect_source_type,
-        )
-        from python.helpers.tkgm_memory import MemoryDomain
-        from python.helpers.memory import Memory
-
         action = input.get("action", "status")
+        handler = self.ACTIONS.get(action)
+        if handler is None:
+            return {"error": f"Unknown action: {action}. Use: {', '.join(self.ACTIONS)}"}
+        return await handler(self, input)
+
+    def _area_and_domain(self, input: Input):
+        area = input.get("area", Memory.Area.MAIN.value)
+        try:
+            domain = MemoryDomain(input.get("domain", "agent_zero"))
+        except ValueError:
+            domain = MemoryDomain.AGENT_ZERO
+        return area, domain
 
-        if action == "ingest_file":
-            filepath = input.get("filepath", "")
-            source_type = input.get("source_type", "auto")
-            area = input.get("area", Memory.Area.MAIN.value)
-            domain_str = input.get("domain", "agent_zero")
-            
-            try:
-                domain = MemoryDomain(domain_str)
-            except ValueError:
-                domain = MemoryDomain.AGENT_ZERO
-            
-            if not filepath:
-                return {"error": "filepath is required"}
-            
-            # Get agent context for Memory access
-            ctx = self.use_context(input.get("ctxid", ""))
-            agent = ctx.agent0
-            
-            record = await ingest_file(filepath, agent, source_type, area, domain)
-            return {
-                "status": record.status,
-                "source_path": record.source_path,
-                "source_type": record.source_type,
-                "chunk_count": record.chunk_count,
-                "error": record.error,
-            }
+    async def _ingest_file(self, input: Input) -> Output:
+        filepath = input.get("filepath", "")
+        source_type = input.get("source_type", "auto")
+        area, domain = self._area_and_domain(input)
         
-        elif action == "ingest_directory":
-            dirpath = input.get("dirpath", "")
-            recursive = input.get("recursive", True)
-            area = input.get("area", Memory.Area.MAIN.value)
-            domain_str = input.get("domain", "agent_zero")
-            
-            try:
-                domain = MemoryDomain(domain_str)
-            except ValueError:
-                domain = MemoryDomain.AGENT_ZERO
-            
-            if not dirpath:
-                return {"error": "dirpath is required"}
-            
-            ctx = self.use_context(input.get("ctxid", ""))
-            agent = ctx.agent0
-            
-            records = await ingest_directory(dirpath, agent, recursive, area, domain)
-            return {
-                "total": len(records),
-                "completed": sum(1 for r in records if r.status == "completed"),
-                "failed": sum(1 for r in records if r.status == "failed"),
-                "skipped": sum(1 for r in records if r.status == "skipped"),
-                "total_chunks": sum(r.chunk_count for r in records),
-            }
+        # Reject bad input before resolving (or creating) an agent context
+        if not filepath:
+            return {"error": "filepath is required"}
+        if area not in _AREAS:
+            return {"error": f"Unknown area: {area}. Use: {', '.join(_AREAS)}"}
+        if not await asyncio.to_thread(os.path.isfile, filepath):
+            return {"error": f"File not found: {filepath}"}
         
-        elif action == "ingest_chatgpt_export":
-            filepath = input.get("filepath", "")
-            if not filepath:
-                return {"error": "filepath is required"}
-            
-            ctx = self.use_context(input.get("ctxid", ""))
-            agent = ctx.agent0
-            
-            record = await ingest_file(filepath, agent, "chatgpt")
-            return {
-                "status": record.status,
-                "chunk_count": record.chunk_count,
-                "error": record.error,
-            }
+        # Get agent context for Memory access
+        ctx = self.use_context(input.get("ctxid", ""))
+        agent = ctx.agent0
         
-        elif action == "ingest_claude_export":
-            filepath = input.get("filepath", "")
-            if not filepath:
-                return {"error": "filepath is required"}
-            
-            ctx = self.use_context(input.get("ctxid", ""))
-            agent = ctx.agent0
-            
-            record = await ingest_file(filepath, agent, "claude")
-            return {
-                "status": record.status,
-                "chunk_count": record.chunk_count,
-                "error": record.error,
-            }
+        job_id = background_jobs.submit(
+            "ingest", "ingest_file", _ingest_file_job, filepath, agent, source_type, area, domain
+        )
+        return background_jobs.queued_response(job_id)
+
+    async def _ingest_directory(self, input: Input) -> Output:
+        dirpath = input.get("dirpath", "")
+        recursive = input.get("recursive", True)
+        area, domain = self._area_and_domain(input)
+        
+        if not dirpath:
+            return {"error": "dirpath is required"}
+        if area not in _AREAS:
+            return {"error": f"Unknown area: {area}. Use: {', '.join(_AREAS)}"}
+        if not await asyncio.to_thread(os.path.isdir, dirpath):
+            return {"error": f"Directory not found: {dirpath}"}
+        
+        ctx = self.use_context(input.get("ctxid", ""))
+        agent = ctx.agent0
         
-        elif action == "list_ingested":
-            records = get_ingestion_history()
-            return {"records": records, "total": len(records)}
+        job_id = background_jobs.submit(
+            "ingest", "ingest_directory", _ingest_directory_job, dirpath, agent, recursive, area, domain
+        )
+        return background_jobs.queued_response(job_id)
+
+    async def _ingest_export(self, input: Input, source_type: str) -> Output:
+        filepath = input.get("filepath", "")
+        if not filepath:
+            return {"error": "filepath is required"}
+        if not await asyncio.to_thread(os.path.isfile, filepath):
+            return {"error": f"File not found: {filepath}"}
         
-        elif action == "status":
-            records = get_ingestion_history()
-            return {
-                "total_ingested": len(records),
-                "total_completed": sum(1 for r in records if r.get("status") == "completed"),
-                "total_failed": sum(1 for r in records if r.get("status") == "failed"),
-                "total_chunks": sum(r.get("chunk_count", 0) for r in records),
-            }
+        ctx = self.use_context(input.get("ctxid", ""))
+        agent = ctx.agent0
         
-        else:
-            return {"error": f"Unknown action: {action}. Use: ingest_file, ingest_directory, ingest_chatgpt_export, ingest_claude_export, list_ingested, status"}
+        record = await ingest_file(filepath, agent, source_type)
+        return {
+            "status": record.status,
+            "chunk_count": record.chunk_count,
+            "error": record.error,
+        }
+
+    async def _ingest_chatgpt_export(self, input: Input) -> Output:
+        return await self._ingest_export(input, "chatgpt")
+
+    async def _ingest_claude_export(self, input: Input) -> Output:
+        return await self._ingest_export(input, "claude")
+
+    async def _list_ingested(self, input: Input) -> Output:
+        records = get_ingestion_history()
+        return {"records": records, "total": len(records)}
+
+    async def _job_status(self, input: Input) -> Output:
+        job_id = input.get("job_id", "")
+        if not job_id:
+            return {"error": "job_id is required"}
+        job = background_jobs.status(job_id)
+        if job is None:
+            return {"error": f"Unknown job: {job_id}"}
+        return job
+
+    async def _status(self, input: Input) -> Output:
+        return get_ingestion_summary()
+
+    # action -> handler
+    ACTIONS = {
+        "ingest_file": _ingest_file,
+        "ingest_directory": _ingest_directory,
+        "ingest_chatgpt_export": _ingest_chatgpt_export,
+        "ingest_claude_export": _ingest_claude_export,
+        "list_ingested": _list_ingested,
+        "job_status": _job_status,
+        "status": _status,
+    }
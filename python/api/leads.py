@@ -9,34 +9,32 @@ Actions:
   - list: List leads with filters
   - pipeline: Get pipeline summary
   - followups: Get due follow-ups
+  - dashboard: Leads, pipeline summary and follow-ups in one response
 """
 
 from flask import Request
 from python.helpers.api import ApiHandler, Input, Output
+from python.helpers.lead_pipeline import (
+    create_lead,
+    update_lead,
+    add_note,
+    get_leads,
+    get_pipeline_summary,
+    get_followups_due,
+    get_dashboard,
+)
 
 
 class LeadsApi(ApiHandler):
 
     async def process(self, input: Input, request: Request) -> Output:
         action = input.get("action", "list")
-
-        if action == "create":
-            return await self._create(input)
-        elif action == "update":
-            return await self._update(input)
-        elif action == "note":
-            return await self._note(input)
-        elif action == "list":
-            return await self._list(input)
-        elif action == "pipeline":
-            return await self._pipeline()
-        elif action == "followups":
-            return await self._followups()
-        else:
-            return {"error": f"Unknown action: {action}", "available": ["create", "update", "note", "list", "pipeline", "followups"]}
+        handler = self.ACTIONS.get(action)
+        if handler is None:
+            return {"error": f"Unknown action: {action}", "available": list(self.ACTIONS)}
+        return await handler(self, input)
 
     async def _create(self, input: Input) -> Output:
-        from python.helpers.lead_pipeline import create_lead
         name = input.get("name", "")
         if not name:
             return {"error": "Provide 'name' parameter"}
@@ -51,7 +49,6 @@ class LeadsApi(ApiHandler):
         return {"ok": True, "lead": lead.to_dict()}
 
     async def _update(self, input: Input) -> Output:
-        from python.helpers.lead_pipeline import update_lead
         lead_id = input.get("lead_id", "")
         if not lead_id:
             return {"error": "Provide 'lead_id' parameter"}
@@ -62,7 +59,6 @@ class LeadsApi(ApiHandler):
         return {"ok": False, "error": f"Lead not found: {lead_id}"}
 
     async def _note(self, input: Input) -> Output:
-        from python.helpers.lead_pipeline import add_note
         lead_id = input.get("lead_id", "")
         note_text = input.get("note", input.get("text", ""))
         if not lead_id or not note_text:
@@ -73,7 +69,6 @@ class LeadsApi(ApiHandler):
         return {"ok": False, "error": f"Lead not found: {lead_id}"}
 
     async def _list(self, input: Input) -> Output:
-        from python.helpers.lead_pipeline import get_leads
         leads = get_leads(
             status=input.get("status", ""),
             temperature=input.get("temperature", ""),
@@ -81,11 +76,35 @@ class LeadsApi(ApiHandler):
         )
         return {"ok": True, "leads": [l.to_dict() for l in leads], "total": len(leads)}
 
-    async def _pipeline(self) -> Output:
-        from python.helpers.lead_pipeline import get_pipeline_summary
+    async def _pipeline(self, input: Input) -> Output:
         return {"ok": True, "pipeline": get_pipeline_summary()}
 
-    async def _followups(self) -> Output:
-        from python.helpers.lead_pipeline import get_followups_due
+    async def _followups(self, input: Input) -> Output:
         followups = get_followups_due()
         return {"ok": True, "followups": [l.to_dict() for l in followups], "total": len(followups)}
+
+    async def _dashboard(self, input: Input) -> Output:
+        dashboard = get_dashboard(
+            status=input.get("status", ""),
+            temperature=input.get("temperature", ""),
+            limit=int(input.get("limit", 20)),
+        )
+        leads, followups = dashboard["leads"], dashboard["followups"]
+        return {
+            "ok": True,
+            "leads": [l.to_dict() for l in leads],
+            "total": len(leads),
+            "pipeline": dashboard["pipeline"],
+            "followups": [l.to_dict() for l in followups],
+        }
+
+    # action -> handler
+    ACTIONS = {
+        "create": _create,
+        "update": _update,
+        "note": _note,
+        "list": _list,
+        "pipeline": _pipeline,
+        "followups": _followups,
+        "dashboard": _dashboard,
+    }
@@ -3,12 +3,16 @@ Vision Analyze API — /vision_analyze endpoint
 
 Accepts image uploads and optional text prompt. Sends the image to a
 vision-capable model (e.g., GPT-4o via OpenRouter) and returns the
-analysis result. Also stores the image in workspace for agent reference.
+analysis result. When the analysis is fed into an agent context, the image
+is also stored in the workspace for agent reference.
 """
 
-import base64
-import json
+import asyncio
+import atexit
 import os
+import re
+import secrets
+import threading
 import traceback
 from datetime import datetime
 
@@ -16,16 +20,142 @@ from flask import Request, Response
 from werkzeug.utils import secure_filename
 
 from python.helpers.api import ApiHandler
-from python.helpers import files, settings
+from python.helpers import fastjson, files, settings
 from python.helpers.print_style import PrintStyle
 
+try:
+    import pybase64 as base64  # SIMD-accelerated, same API as the stdlib module
+except ImportError:
+    import base64
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp", "bmp", "svg"}
 MAX_FILE_SIZE = 20 * 1024 * 1024  # 20 MB
 
 
+CHUNK_SIZE = 256 * 1024
+
+# Workspace copies of these are re-encoded as WebP (PNGs only above the size)
+WEBP_SUFFIXES = (".bmp",)
+WEBP_PNG_MIN_SIZE = 1024 * 1024
+WEBP_QUALITY = 85
+
+_client = None
+_client_lock = threading.Lock()
+
+# Stand-in for the image inside the encoded request body (random, so no
+# prompt can contain it)
+_IMAGE_PLACEHOLDER = secrets.token_hex(16)
+_BASE64 = re.compile(rb"[A-Za-z0-9+/]*={0,2}")
+
+
+_ALLOWED_SUFFIXES = tuple("." + ext for ext in ALLOWED_EXTENSIONS)
+
+
 def _allowed_file(filename: str) -> bool:
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+
+def _http():
+    """
+    Shared keep-alive HTTP client, so vision calls reuse one TLS connection
+    to the provider instead of handshaking on every request. Flask runs each
+    async view on its own event loop, which an AsyncClient's pool can't
+    outlive, so this is a thread-safe sync client driven via to_thread.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx
+                try:
+                    import h2  # noqa: F401 — httpx needs it for HTTP/2
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                _client = httpx.Client(
+                    http2=http2,
+                    timeout=httpx.Timeout(60.0),
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                )
+                atexit.register(_client.close)
+    return _client
+
+
+def _request_body(payload: dict, image_b64: bytes) -> bytes:
+    """
+    JSON-encode payload, then splice the base64 image bytes in place of the
+    placeholder in its data URL. The base64 alphabet needs no JSON escaping,
+    so the multi-megabyte image is never decoded to str, copied into an
+    f-string, or walked by the encoder. The image URL is the last string in
+    the payload, so the last occurrence is the one replaced.
+    """
+    head, _, tail = fastjson.dumps(payload).rpartition(_IMAGE_PLACEHOLDER.encode())
+    return b"".join((head, image_b64, tail))
+
+
+def _save_and_encode(stream, save_path: str | None) -> bytes | None:
+    """
+    Base64-encode an upload stream in CHUNK_SIZE pieces, copying it to
+    save_path on the way when one is given, so the image is never held whole
+    in memory as raw bytes. Returns the base64 bytes, or None (and no file)
+    when the upload exceeds MAX_FILE_SIZE. Blocking — callers run it in a
+    worker thread.
+    """
+    encoded = []
+    carry = b""  # base64 works in 3-byte groups; the remainder waits for the next chunk
+    total = 0
+    f = None
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        f = open(save_path, "wb")
+    try:
+        while chunk := stream.read(CHUNK_SIZE):
+            total += len(chunk)
+            if total > MAX_FILE_SIZE:
+                break
+            if f:
+                f.write(chunk)
+            data = carry + chunk
+            aligned = len(data) - len(data) % 3
+            encoded.append(base64.b64encode(memoryview(data)[:aligned]))
+            carry = data[aligned:]
+    finally:
+        if f:
+            f.close()
+    if total > MAX_FILE_SIZE:
+        if save_path:
+            os.remove(save_path)
+        return None
+    encoded.append(base64.b64encode(carry))
+    return b"".join(encoded)
+
+
+def _compact_copy(save_path: str) -> str:
+    """
+    Replace a saved BMP, or a PNG over WEBP_PNG_MIN_SIZE, with a WebP copy
+    and return the path actually kept. Other formats, and everything when
+    Pillow isn't installed or can't decode the file, stay as uploaded.
+    """
+    lower = save_path.lower()
+    if Image is None or not (
+        lower.endswith(WEBP_SUFFIXES)
+        or (lower.endswith(".png") and os.path.getsize(save_path) > WEBP_PNG_MIN_SIZE)
+    ):
+        return save_path
+    webp_path = os.path.splitext(save_path)[0] + ".webp"
+    try:
+        with Image.open(save_path) as img:
+            img.save(webp_path, "WEBP", quality=WEBP_QUALITY)
+    except Exception:
+        return save_path
+    os.remove(save_path)
+    return webp_path
 
 
 class VisionAnalyze(ApiHandler):
@@ -38,31 +168,33 @@ class VisionAnalyze(ApiHandler):
             mime_type = "image/png"
             prompt = "Describe what you see in this image in detail."
             context_id = ""
+            save_path = None
 
             if request.content_type and request.content_type.startswith("multipart/form-data"):
-                prompt = request.form.get("prompt", prompt)
-                context_id = request.form.get("context", "")
-                img_file = request.files.get("image")
+                # Parsing the multipart body reads (and spools) the whole upload
+                form, uploads = await asyncio.to_thread(lambda: (request.form, request.files))
+                prompt = form.get("prompt", prompt)
+                context_id = form.get("context", "")
+                img_file = uploads.get("image")
                 if not img_file or not img_file.filename:
                     return {"error": "No image file provided"}
                 if not _allowed_file(img_file.filename):
                     return {"error": f"File type not allowed. Accepted: {', '.join(ALLOWED_EXTENSIONS)}"}
 
-                # Read and encode
-                raw = img_file.read()
-                if len(raw) > MAX_FILE_SIZE:
-                    return {"error": "Image exceeds 20 MB limit"}
-                image_b64 = base64.b64encode(raw).decode("utf-8")
                 mime_type = img_file.content_type or "image/png"
 
-                # Save to workspace for agent reference
-                upload_dir = files.get_abs_path("tmp/vision")
-                os.makedirs(upload_dir, exist_ok=True)
-                ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_name = secure_filename(img_file.filename)
-                save_path = os.path.join(upload_dir, f"{ts}_{safe_name}")
-                with open(save_path, "wb") as f:
-                    f.write(raw)
+                # The workspace copy is only for the agent, so only keep one
+                # when the result goes into a context; encode on the way
+                if context_id:
+                    upload_dir = files.get_abs_path("tmp/vision")
+                    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    safe_name = secure_filename(img_file.filename)
+                    save_path = os.path.join(upload_dir, f"{ts}_{safe_name}")
+                image_b64 = await asyncio.to_thread(_save_and_encode, img_file.stream, save_path)
+                if image_b64 is None:
+                    return {"error": "Image exceeds 20 MB limit"}
+                if save_path:
+                    save_path = await asyncio.to_thread(_compact_copy, save_path)
             else:
                 # JSON with base64
                 image_b64 = input.get("image_base64", "")
@@ -71,6 +203,9 @@ class VisionAnalyze(ApiHandler):
                 context_id = input.get("context", "")
                 if not image_b64:
                     return {"error": "No image_base64 provided"}
+                image_b64 = image_b64.encode("ascii", "replace")
+                if not _BASE64.fullmatch(image_b64):
+                    return {"error": "image_base64 is not valid base64"}
 
             # ── Call vision model via OpenRouter ─────────────
             set = settings.get_settings()
@@ -86,8 +221,6 @@ class VisionAnalyze(ApiHandler):
             base_url = set.get("chat_api_url", "https://openrouter.ai/api/v1")
             model = set.get("chat_model_vision", "") or "openai/gpt-4o"
 
-            import httpx
-
             headers = {
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
@@ -106,7 +239,7 @@ class VisionAnalyze(ApiHandler):
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:{mime_type};base64,{image_b64}"
+                                    "url": f"data:{mime_type};base64,{_IMAGE_PLACEHOLDER}"
                                 },
                             },
                         ],
@@ -115,11 +248,12 @@ class VisionAnalyze(ApiHandler):
                 "max_tokens": 2048,
             }
 
-            async with httpx.AsyncClient(timeout=60) as client:
-                url = f"{base_url.rstrip('/')}/chat/completions"
-                resp = await client.post(url, json=payload, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            url = f"{base_url.rstrip('/')}/chat/completions"
+            resp = await asyncio.to_thread(
+                _http().post, url, content=_request_body(payload, image_b64), headers=headers
+            )
+            resp.raise_for_status()
+            data = fastjson.loads(resp.content)
 
             analysis = data["choices"][0]["message"]["content"]
 
@@ -127,11 +261,10 @@ class VisionAnalyze(ApiHandler):
             if context_id:
                 try:
                     ctx = self.use_context(context_id, create_if_not_exists=False)
-                    ctx.log.log(
-                        type="info",
-                        heading="Vision Analysis",
-                        content=f"**Prompt:** {prompt}\n\n**Result:**\n{analysis}",
-                    )
+                    content = f"**Prompt:** {prompt}\n\n**Result:**\n{analysis}"
+                    if save_path:
+                        content += f"\n\n**Image:** {save_path}"
+                    ctx.log.log(type="info", heading="Vision Analysis", content=content)
                 except Exception:
                     pass  # Non-critical
 
@@ -3,68 +3,90 @@ Voice AI API — /voice endpoint
 Provides outbound calling, inbound call webhook, call logs, and voice persona management.
 """
 
-import json
 import traceback
+from functools import lru_cache
 from python.helpers.voice_ai import (
     make_outbound_call,
     handle_inbound_call,
     get_call_log,
+    get_call_count,
     VOICE_PERSONAS,
 )
 
 
+def _make_call(request_data: dict) -> dict:
+    to = request_data.get("to", "")
+    message = request_data.get("message", "")
+    voice = request_data.get("voice", "professional")
+    if not to:
+        return {"error": "to (phone number) is required"}
+    if not message:
+        return {"error": "message is required"}
+    result = make_outbound_call(to=to, message=message, voice=voice)
+    return {"success": True, "call": result}
+
+
+def _inbound_webhook(request_data: dict) -> dict:
+    # Returns TwiML for Twilio to process
+    twiml = handle_inbound_call()
+    return {"success": True, "twiml": twiml, "content_type": "text/xml"}
+
+
+def _call_log(request_data: dict) -> dict:
+    limit = int(request_data.get("limit", 50))
+    offset = int(request_data.get("offset", 0))
+    calls = get_call_log(limit=limit, offset=offset)
+    return {"success": True, "calls": calls, "total": get_call_count()}
+
+
+@lru_cache(maxsize=1)
+def _personas_response() -> dict:
+    """Built once: the personas are static. Shared — treat as read-only."""
+    return {"success": True, "personas": VOICE_PERSONAS}
+
+
+_PERSONA_NAMES = tuple(VOICE_PERSONAS)
+
+
+def _personas(request_data: dict) -> dict:
+    return _personas_response()
+
+
+def _test(request_data: dict) -> dict:
+    # Dry-run test — does not actually call
+    to = request_data.get("to", "+10000000000")
+    message = request_data.get("message", "This is a test call from Agent Claw.")
+    return {
+        "success": True,
+        "dry_run": True,
+        "to": to,
+        "message": message,
+        "available_personas": _PERSONA_NAMES,
+    }
+
+
+# action -> handler
+ACTIONS = {
+    "make_call": _make_call,
+    "inbound_webhook": _inbound_webhook,
+    "call_log": _call_log,
+    "personas": _personas,
+    "test": _test,
+}
+
+
 def handle_api(request_data: dict, agent=None) -> dict:
     """Route voice AI actions."""
     action = request_data.get("action", "")
+    handler = ACTIONS.get(action)
+    if handler is None:
+        return {
+            "error": f"Unknown action: {action}",
+            "available_actions": list(ACTIONS),
+        }
 
     try:
-        if action == "make_call":
-            to = request_data.get("to", "")
-            message = request_data.get("message", "")
-            voice = request_data.get("voice", "professional")
-            if not to:
-                return {"error": "to (phone number) is required"}
-            if not message:
-                return {"error": "message is required"}
-            result = make_outbound_call(to=to, message=message, voice=voice)
-            return {"success": True, "call": result}
-
-        elif action == "inbound_webhook":
-            # Returns TwiML for Twilio to process
-            twiml = handle_inbound_call()
-            return {"success": True, "twiml": twiml, "content_type": "text/xml"}
-
-        elif action == "call_log":
-            limit = request_data.get("limit", 50)
-            log = get_call_log()
-            return {"success": True, "calls": log[-limit:], "total": len(log)}
-
-        elif action == "personas":
-            return {"success": True, "personas": VOICE_PERSONAS}
-
-        elif action == "test":
-            # Dry-run test — does not actually call
-            to = request_data.get("to", "+10000000000")
-            message = request_data.get("message", "This is a test call from Agent Claw.")
-            return {
-                "success": True,
-                "dry_run": True,
-                "to": to,
-                "message": message,
-                "available_personas": list(VOICE_PERSONAS.keys()),
-            }
-
-        else:
-            return {
-                "error": f"Unknown action: {action}",
-                "available_actions": [
-                    "make_call",
-                    "inbound_webhook",
-                    "call_log",
-                    "personas",
-                    "test",
-                ],
-            }
-
+        return handler(request_data)
     except Exception as e:
         return {"error": str(e), "trace": traceback.format_exc()}
+
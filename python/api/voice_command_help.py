@@ -1,4 +1,5 @@
 from python.helpers.api import ApiHandler, Request, Response
+from python.helpers.voice_command_router import get_router
 
 
 class VoiceCommandHelp(ApiHandler):
@@ -7,9 +8,7 @@ class VoiceCommandHelp(ApiHandler):
     """
 
     async def process(self, input: dict, request: Request) -> dict | Response:
-        from python.helpers.voice_command_router import VoiceCommandRouter
-
-        router = VoiceCommandRouter()
+        router = get_router()
         category_filter = input.get("category", None)
 
         commands = []
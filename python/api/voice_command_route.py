@@ -1,4 +1,5 @@
 from python.helpers.api import ApiHandler, Request, Response
+from python.helpers.voice_command_router import get_router
 
 
 class VoiceCommandRoute(ApiHandler):
@@ -7,13 +8,11 @@ class VoiceCommandRoute(ApiHandler):
     """
 
     async def process(self, input: dict, request: Request) -> dict | Response:
-        from python.helpers.voice_command_router import VoiceCommandRouter
-
         utterance = input.get("utterance", "").strip()
         if not utterance:
             return {"error": "No utterance provided", "matched_command": None}
 
-        router = VoiceCommandRouter()
+        router = get_router()
         match = router.match(utterance)
 
         if match is None:
@@ -13,10 +13,18 @@ Routes to the best model for each task category:
 Execution order: _20_ (runs after _10_log_for_stream)
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from python.helpers.extension import Extension
 from agent import LoopData
 
+try:
+    import ahocorasick  # pyahocorasick: multi-pattern literal matcher
+except ImportError:
+    ahocorasick = None
+
 
 # Task classification patterns
 TASK_PATTERNS = {
@@ -40,7 +48,6 @@ TASK_PATTERNS = {
     "fast": [
         r"\b(quick|fast|brief|short|simple|yes.or.no|true.or.false|one.word)\b",
         r"\b(translate|convert|format|list|name|count|define)\b",
-        r"^.{0,50}$",  # Very short prompts
     ],
     "creative": [
         r"\b(write|compose|draft|story|poem|essay|article|blog|creative|imagine|fiction)\b",
@@ -49,6 +56,95 @@ TASK_PATTERNS = {
     ],
 }
 
+_WORD_GROUP = re.compile(r"\\b\((.*)\)\\b")
+_WORD = re.compile(r"\w+")
+
+
+def _split_patterns() -> tuple[dict, dict]:
+    """
+    Split TASK_PATTERNS into plain keywords (word -> categories it scores
+    for) and, per category, one compiled alternation of whatever is left:
+    phrases like step.by.step, code fences and file extensions. Patterns are
+    lower-case and matched against the lower-cased prompt, so none of them
+    is compiled with re.IGNORECASE.
+    """
+    keywords: dict[str, tuple[str, ...]] = {}
+    residual: dict[str, re.Pattern] = {}
+    for category, patterns in TASK_PATTERNS.items():
+        rest = []
+        for pattern in patterns:
+            group = _WORD_GROUP.fullmatch(pattern)
+            if not group:
+                rest.append(pattern)
+                continue
+            phrases = []
+            for alt in group.group(1).split("|"):
+                if _WORD.fullmatch(alt):
+                    keywords[alt] = keywords.get(alt, ()) + (category,)
+                else:
+                    phrases.append(alt)
+            if phrases:
+                rest.append(rf"\b({'|'.join(phrases)})\b")
+        if rest:
+            residual[category] = re.compile("|".join(f"(?:{p})" for p in rest))
+    return keywords, residual
+
+
+_KEYWORDS, _RESIDUAL = _split_patterns()
+
+# One scan of the prompt finds every keyword: an Aho-Corasick automaton when
+# pyahocorasick is installed, otherwise a single alternation of all keywords
+_automaton = None
+_keyword_re = None
+if ahocorasick is not None:
+    _automaton = ahocorasick.Automaton()
+    for _word, _categories in _KEYWORDS.items():
+        _automaton.add_word(_word, (len(_word), _categories))
+    _automaton.make_automaton()
+else:
+    _keyword_re = re.compile(rf"\b({'|'.join(_KEYWORDS)})\b")
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _keyword_hits(text_lower: str):
+    """Yield the categories of every whole-word keyword occurrence."""
+    if _automaton is not None:
+        last = len(text_lower) - 1
+        for end, (length, categories) in _automaton.iter(text_lower):
+            start = end - length + 1
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end < last and _is_word_char(text_lower[end + 1]):
+                continue
+            yield categories
+    else:
+        for m in _keyword_re.finditer(text_lower):
+            yield _KEYWORDS[m.group(1)]
+
+# Very short prompts (single line, at most 50 characters) count as a "fast" hit;
+# anything under TRIVIAL_PROMPT_LEN is "fast" without looking further
+SHORT_PROMPT_MAX = 50
+TRIVIAL_PROMPT_LEN = 16
+
+# Prompts longer than LONG_PROMPT_LEN are classified from their first and
+# last LONG_PROMPT_EDGE characters only. The cut depends only on the text, so
+# a retried prompt is always routed the same way.
+LONG_PROMPT_LEN = 32_000
+LONG_PROMPT_EDGE = 2_000
+
+
+# Recent classifications: the agent loop re-sends the same prompt on retries
+# and tool iterations. Prompts longer than CACHE_KEY_MAX are keyed by length,
+# digest and head rather than kept whole.
+CLASSIFY_CACHE_SIZE = 1024
+CACHE_KEY_MAX = 256
+_classify_cache: OrderedDict = OrderedDict()
+_classify_lock = threading.Lock()
+
+
 # Model routing map — model strings as used by LiteLLM
 MODEL_ROUTES = {
     "code":      "moonshot/kimi-k2-turbo-preview",
@@ -62,20 +158,54 @@ MODEL_ROUTES = {
 ZHIPU_API_BASE = "https://open.bigmodel.cn/api/paas/v4"
 
 
+def _cache_key(text: str):
+    if len(text) <= CACHE_KEY_MAX:
+        return text
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return len(text), digest, text[:128]
+
+
+def clear_classify_cache():
+    with _classify_lock:
+        _classify_cache.clear()
+
+
 def classify_task(text: str) -> str:
     """Classify the task type from prompt text. Returns the highest-scoring category."""
     if not text:
         return "default"
+    n = len(text)
+    if n < TRIVIAL_PROMPT_LEN:
+        return "fast"
+    if n > LONG_PROMPT_LEN:
+        text = text[:LONG_PROMPT_EDGE] + "\n" + text[-LONG_PROMPT_EDGE:]
 
-    text_lower = text.lower()
-    scores = {}
+    key = _cache_key(text)
+    with _classify_lock:
+        task_type = _classify_cache.get(key)
+        if task_type is not None:
+            _classify_cache.move_to_end(key)
+            return task_type
 
-    for category, patterns in TASK_PATTERNS.items():
-        score = 0
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            score += len(matches)
-        scores[category] = score
+    task_type = _classify(text)
+    with _classify_lock:
+        _classify_cache[key] = task_type
+        if len(_classify_cache) > CLASSIFY_CACHE_SIZE:
+            _classify_cache.popitem(last=False)
+    return task_type
+
+
+def _classify(text: str) -> str:
+    text_lower = text.lower()
+    scores = dict.fromkeys(TASK_PATTERNS, 0)
+    for categories in _keyword_hits(text_lower):
+        for category in categories:
+            scores[category] += 1
+    for category, pattern in _RESIDUAL.items():
+        scores[category] += sum(1 for _ in pattern.finditer(text_lower))
+    body = text_lower[:-1] if text_lower.endswith("\n") else text_lower
+    if len(body) <= SHORT_PROMPT_MAX and "\n" not in body:
+        scores["fast"] += 1
 
     if not scores or max(scores.values()) == 0:
         return "default"
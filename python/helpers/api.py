@@ -1,17 +1,17 @@
 from abc import abstractmethod
-import json
 import threading
 from typing import Union, TypedDict, Dict, Any
 from attr import dataclass
 from flask import Request, Response, jsonify, Flask, session, request, send_file
 from agent import AgentContext
 from initialize import initialize_agent
+from python.helpers import fastjson
 from python.helpers.print_style import PrintStyle
 from python.helpers.errors import format_error
 from werkzeug.serving import make_server
 
 Input = dict
-Output = Union[Dict[str, Any], Response, TypedDict]  # type: ignore
+Output = Union[Dict[str, Any], Response, TypedDict, tuple]  # type: ignore
 
 
 class ApiHandler:
@@ -67,11 +67,13 @@ class ApiHandler:
             # return output based on type
             if isinstance(output, Response):
                 return output
-            else:
-                response_json = json.dumps(output)
-                return Response(
-                    response=response_json, status=200, mimetype="application/json"
-                )
+            # (body, status) tuples, as in Flask views
+            status = 200
+            if isinstance(output, tuple):
+                output, status = output
+            return Response(
+                response=fastjson.dumps(output), status=status, mimetype="application/json"
+            )
 
             # return exceptions with 500
         except Exception as e:
@@ -0,0 +1,104 @@
+"""
+Background Jobs — long-running API work off the request path
+
+Exports and knowledge ingestion can take minutes. Handlers submit the work
+here, answer straight away with a job id, and clients poll status(job_id).
+Every queue has its own worker pool, so a full backup can't hold up
+ingestion and vice versa. Jobs only live in this process: finished jobs
+are kept for JOB_TTL seconds so clients can collect the result.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from python.helpers.clock import now_iso
+from python.helpers.guids import generate_id
+
+logger = logging.getLogger(__name__)
+
+# queue name -> worker threads
+QUEUES = {"exports": 2, "ingest": 1}
+JOB_TTL = 3600.0
+
+_lock = threading.Lock()
+_executors: dict[str, ThreadPoolExecutor] = {}
+_jobs: dict[str, dict] = {}
+_finished: dict[str, float] = {}  # job id -> monotonic time it finished
+
+
+def _executor(queue: str) -> ThreadPoolExecutor:
+    executor = _executors.get(queue)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(queue)
+            if executor is None:
+                executor = _executors[queue] = ThreadPoolExecutor(
+                    max_workers=QUEUES[queue], thread_name_prefix=f"job-{queue}"
+                )
+    return executor
+
+
+def _expire(now: float):
+    for job_id, finished in list(_finished.items()):
+        if now - finished > JOB_TTL:
+            _finished.pop(job_id, None)
+            _jobs.pop(job_id, None)
+
+
+def _run(job: dict, fn: Callable[..., Any], args: tuple, kwargs: dict):
+    job["state"] = "running"
+    job["started_at"] = now_iso()
+    try:
+        result = fn(*args, **kwargs)
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+        job["result"] = result
+        job["state"] = "completed"
+    except Exception as e:
+        job["error"] = str(e)
+        job["state"] = "failed"
+        logger.exception(f"background job {job['job_id']} ({job['kind']}) failed")
+    job["finished_at"] = now_iso()
+    with _lock:
+        _finished[job["job_id"]] = time.monotonic()
+
+
+def submit(queue: str, kind: str, fn: Callable[..., Any], *args, **kwargs) -> str:
+    """
+    Queue fn(*args, **kwargs) on `queue` and return the job id. fn may be a
+    plain function or a coroutine function; its return value becomes the
+    job's result and must be JSON-serializable.
+    """
+    job_id = f"job_{generate_id(12)}"
+    job = {
+        "job_id": job_id,
+        "queue": queue,
+        "kind": kind,
+        "state": "queued",
+        "created_at": now_iso(),
+        "started_at": None,
+        "finished_at": None,
+        "result": None,
+        "error": None,
+    }
+    with _lock:
+        _expire(time.monotonic())
+        _jobs[job_id] = job
+    _executor(queue).submit(_run, job, fn, args, kwargs)
+    return job_id
+
+
+def status(job_id: str) -> dict | None:
+    """Snapshot of a job, or None if the id is unknown or has expired."""
+    job = _jobs.get(job_id)
+    return dict(job) if job is not None else None
+
+
+def queued_response(job_id: str) -> tuple[dict, int]:
+    """The 202 Accepted body handlers return right after submit()."""
+    return {"ok": True, "job_id": job_id, "status": "queued"}, 202
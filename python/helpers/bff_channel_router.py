@@ -15,11 +15,11 @@ import os
 import json
 import yaml
 from datetime import datetime, timezone
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class InboundMessage:
     """Normalized inbound message from any channel."""
     channel: str
@@ -33,10 +33,11 @@ class InboundMessage:
     priority: int = 5
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Shallow copy — the result is serialized right away, no deep copy needed
+        return {k: getattr(self, k) for k in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundResponse:
     """Normalized outbound response to any channel."""
     channel: str
@@ -47,7 +48,7 @@ class OutboundResponse:
     suggested_actions: list = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {k: getattr(self, k) for k in self.__slots__}
 
 
 # ─── Channel Priority Mapping ────────────────────────────────
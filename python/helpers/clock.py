@@ -0,0 +1,21 @@
+"""
+Clock — cached UTC timestamps for response payloads
+
+Dashboard responses stamp themselves with the current UTC time. Building a
+fresh datetime and ISO string per response is wasted work when second
+resolution is all the UI shows, so the string is rebuilt once per second.
+"""
+
+import time
+from datetime import datetime, timezone
+
+_cached: tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, at one-second resolution."""
+    global _cached
+    second = int(time.time())
+    if _cached[0] != second:
+        _cached = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+    return _cached[1]
@@ -16,13 +16,13 @@ leverages the swarm orchestrator for parallel production.
 import os
 import json
 from datetime import datetime, timezone
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional
 
 CONTENT_DIR = "tmp/content"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentPiece:
     """A generated content piece."""
     content_id: str
@@ -38,7 +38,7 @@ class ContentPiece:
     word_count: int = 0
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {k: getattr(self, k) for k in self.__slots__}
 
     @staticmethod
     def from_dict(data: dict) -> "ContentPiece":
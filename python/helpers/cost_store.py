@@ -0,0 +1,121 @@
+"""
+Cost Store — columnar storage for closed cost-tracking days
+
+The cost tracker appends today's calls to tmp/cost_tracking/costs_<day>.json.
+Once a day is over its entries never change, so compact() rewrites the day
+as costs_<day>.parquet (Snappy-compressed, one column per field) and removes
+the JSON. Totals then read only the cost_usd column instead of decoding every
+entry.
+
+pyarrow is optional: without it days simply stay JSON. Readers go through
+read_entries()/day_total(), which accept either path for a day and use
+whichever file exists.
+"""
+
+import os
+import threading
+
+from python.helpers import fastjson
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+COLUMNS = ("timestamp", "model", "agent_id", "input_tokens", "output_tokens", "cost_usd")
+
+_SCHEMA = pa.schema([
+    ("timestamp", pa.string()),
+    ("model", pa.string()),
+    ("agent_id", pa.string()),
+    ("input_tokens", pa.int64()),
+    ("output_tokens", pa.int64()),
+    ("cost_usd", pa.float64()),
+]) if pa is not None else None
+
+
+def _paths(path: str) -> tuple[str, str]:
+    """(parquet path, json path) for a day, given either one."""
+    stem = os.path.splitext(path)[0]
+    return f"{stem}.parquet", f"{stem}.json"
+
+
+def _read_json(json_path: str) -> list[dict]:
+    return fastjson.load_file(json_path)
+
+
+def read_entries(path: str, columns: list[str] | None = None) -> list[dict]:
+    """
+    All entries recorded for a day (empty if the day has no file).
+    `columns` limits the fields read from Parquet; JSON entries come back whole.
+    """
+    parquet_path, json_path = _paths(path)
+    for _ in range(2):  # the JSON may be removed by compact() between the checks
+        if pa is not None and os.path.exists(parquet_path):
+            return pq.read_table(parquet_path, columns=columns).to_pylist()
+        try:
+            return _read_json(json_path)
+        except FileNotFoundError:
+            continue
+    return []
+
+
+def day_total(path: str) -> tuple[float, int]:
+    """(total cost_usd, call count) for a day."""
+    parquet_path, _ = _paths(path)
+    if pa is not None and os.path.exists(parquet_path):
+        table = pq.read_table(parquet_path, columns=["cost_usd"])
+        return (pc.sum(table["cost_usd"]).as_py() or 0.0), table.num_rows
+    entries = read_entries(path)
+    return sum(e.get("cost_usd", 0) for e in entries), len(entries)
+
+
+def compact(path: str) -> bool:
+    """
+    Convert a closed day's JSON file to Parquet and remove the JSON.
+    Returns False (leaving the JSON in place) when pyarrow is missing or
+    there is nothing to convert.
+    """
+    if pa is None:
+        return False
+    parquet_path, json_path = _paths(path)
+    try:
+        entries = _read_json(json_path)
+    except FileNotFoundError:
+        return False
+
+    # Older entries stored the cost as estimated_cost
+    columns = {name: [] for name in COLUMNS}
+    for e in entries:
+        columns["timestamp"].append(e.get("timestamp", ""))
+        columns["model"].append(e.get("model", ""))
+        columns["agent_id"].append(e.get("agent_id", ""))
+        columns["input_tokens"].append(int(e.get("input_tokens", 0) or 0))
+        columns["output_tokens"].append(int(e.get("output_tokens", 0) or 0))
+        columns["cost_usd"].append(float(e.get("cost_usd", e.get("estimated_cost", 0)) or 0))
+
+    tmp_path = f"{parquet_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    pq.write_table(pa.table(columns, schema=_SCHEMA), tmp_path, compression="snappy")
+    os.replace(tmp_path, parquet_path)
+    os.remove(json_path)
+    return True
+
+
+def compact_before(directory: str, date_str: str) -> int:
+    """Compact every costs_<day>.json in `directory` older than `date_str`."""
+    if pa is None:
+        return 0
+    converted = 0
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return 0
+    for name in names:
+        if name.startswith("costs_") and name.endswith(".json") and name[6:-5] < date_str:
+            try:
+                converted += compact(os.path.join(directory, name))
+            except Exception:
+                pass  # unreadable day stays JSON; retried on the next rollover
+    return converted
@@ -7,6 +7,7 @@ Singleton cost tracker that:
 - Tracks per-agent and per-model spend
 - Auto-downgrades to free-tier models when budget exceeded
 - Persists to tmp/cost_tracking/ using Byte Rover atomic writes
+- Compacts closed days to Parquet via cost_store (when pyarrow is installed)
 
 Follows Ralphie loop Perception phase:
   Read cost data → assess budget remaining → inform routing decisions
@@ -15,11 +16,16 @@ Created: 2026-02-09
 """
 
 import os
+import copy
 import json
+import time
 import threading
+from functools import wraps
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 from dataclasses import dataclass, field, asdict
+from python.helpers import cost_store
+from python.helpers.json_cache import listdir_cached
 from python.helpers.print_style import PrintStyle
 from python.helpers.tkgm_memory import ByteRoverAtomic
 
@@ -32,6 +38,16 @@ COST_TRACKING_DIR = "tmp/cost_tracking"
 DEFAULT_MONTHLY_CAP = 50.0  # USD
 DEFAULT_AGENT_CAP = 20.0    # USD per agent per month
 
+# How long aggregate query results are reused before re-reading day files
+QUERY_CACHE_TTL = 2.0  # seconds
+
+# How long budget checks are reused; the model router asks before every LLM
+# call, and recording a call invalidates them straight away
+BUDGET_CACHE_TTL = 5.0  # seconds
+
+# How long the listing of days that have a cost file is reused
+PRESENT_DAYS_TTL = 10.0  # seconds
+
 # Free-tier fallback models (OpenRouter free tier)
 FREE_TIER_MODELS = [
     "openrouter/zhipu-ai/glm-4-flash",
@@ -72,6 +88,38 @@ class CostEntry:
             self.timestamp = datetime.now(timezone.utc).isoformat()
 
 
+# ─── Query Memoization ───────────────────────────────────────
+
+def _memoized(method=None, *, ttl: float = QUERY_CACHE_TTL):
+    """
+    Reuse a query method's result for `ttl` seconds per argument set.
+    Aggregates re-read up to 30 day files, and a single dashboard render or
+    routing decision asks for several of them. Writes invalidate the cache;
+    a result computed across an invalidation is returned but not kept, so
+    pre-write figures can't be stored after the write cleared them. Dicts
+    and lists are returned as copies.
+    """
+    if method is None:
+        return lambda m: _memoized(m, ttl=ttl)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._query_lock:
+            hit = self._query_cache.get(key)
+            generation = self._query_generation
+        if hit is not None and hit[0] > now:
+            value = hit[1]
+        else:
+            value = method(self, *args, **kwargs)
+            with self._query_lock:
+                if self._query_generation == generation:
+                    self._query_cache[key] = (now + ttl, value)
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+    return wrapper
+
+
 # ─── Singleton Cost Tracker ──────────────────────────────────
 
 class CostTracker:
@@ -88,6 +136,9 @@ class CostTracker:
         self.agent_caps: dict[str, float] = {}
         self._today_entries: list[dict] = []
         self._today_date = ""
+        self._query_cache: dict[tuple, tuple[float, object]] = {}
+        self._query_generation = 0  # bumped by invalidate()
+        self._query_lock = threading.Lock()
         self._load_today()
     
     @classmethod
@@ -110,6 +161,43 @@ class CostTracker:
             self._today_entries = ByteRoverAtomic.read(
                 self._day_file(today), default=[]
             )
+            threading.Thread(
+                target=cost_store.compact_before,
+                args=(COST_TRACKING_DIR, today),
+                daemon=True,
+            ).start()
+    
+    def _has_day(self, date_str: str) -> bool:
+        """
+        Whether a day has a cost file, from a cached directory listing, so
+        30-day queries skip the stat/open of every day without calls.
+        Today is always read, since its file may have just been created.
+        """
+        if date_str == self._today_date:
+            return True
+        try:
+            names = listdir_cached(COST_TRACKING_DIR, ttl=PRESENT_DAYS_TTL)
+        except FileNotFoundError:
+            return False
+        return f"costs_{date_str}.json" in names or f"costs_{date_str}.parquet" in names
+    
+    def _read_day(self, date_str: str, columns: list[str] | None = None) -> list[dict]:
+        if not self._has_day(date_str):
+            return []
+        try:
+            return cost_store.read_entries(self._day_file(date_str), columns)
+        except Exception as e:
+            PrintStyle.error(f"Cost day read failed: {e}")
+            return []
+    
+    def _day_total(self, date_str: str) -> tuple[float, int]:
+        if not self._has_day(date_str):
+            return 0.0, 0
+        try:
+            return cost_store.day_total(self._day_file(date_str))
+        except Exception as e:
+            PrintStyle.error(f"Cost day read failed: {e}")
+            return 0.0, 0
     
     def _save_today(self):
         ByteRoverAtomic.write(self._day_file(self._today_date), self._today_entries)
@@ -143,6 +231,7 @@ class CostTracker:
         with self._lock:
             self._today_entries.append(entry)
             self._save_today()
+            self.invalidate()
     
     def _estimate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """Estimate cost from known per-model rates."""
@@ -165,15 +254,15 @@ class CostTracker:
     
     # ── Queries ──────────────────────────────────────────────
     
+    @_memoized
     def get_daily_spend(self, date_str: str = "") -> float:
         """Total spend for a given day (default: today)."""
         if not date_str:
             self._load_today()
-            entries = self._today_entries
-        else:
-            entries = ByteRoverAtomic.read(self._day_file(date_str), default=[])
-        return sum(e.get("cost_usd", 0) for e in entries)
+            return sum(e.get("cost_usd", 0) for e in self._today_entries)
+        return self._day_total(date_str)[0]
     
+    @_memoized
     def get_monthly_spend(self) -> float:
         """Total spend for the current month."""
         now = datetime.now(timezone.utc)
@@ -181,11 +270,11 @@ class CostTracker:
         
         for day in range(1, now.day + 1):
             date_str = f"{now.strftime('%Y-%m')}-{day:02d}"
-            entries = ByteRoverAtomic.read(self._day_file(date_str), default=[])
-            total += sum(e.get("cost_usd", 0) for e in entries)
+            total += self._day_total(date_str)[0]
         
         return total
     
+    @_memoized
     def get_agent_spend(self, agent_id: str, days: int = 30) -> float:
         """Total spend for a specific agent over N days."""
         now = datetime.now(timezone.utc)
@@ -194,7 +283,7 @@ class CostTracker:
         for i in range(days):
             date = now - timedelta(days=i)
             date_str = date.strftime("%Y-%m-%d")
-            entries = ByteRoverAtomic.read(self._day_file(date_str), default=[])
+            entries = self._read_day(date_str, ["agent_id", "cost_usd"])
             total += sum(
                 e.get("cost_usd", 0) 
                 for e in entries 
@@ -203,6 +292,7 @@ class CostTracker:
         
         return total
     
+    @_memoized
     def get_model_breakdown(self, days: int = 30) -> dict[str, float]:
         """Cost breakdown by model over N days."""
         now = datetime.now(timezone.utc)
@@ -211,13 +301,37 @@ class CostTracker:
         for i in range(days):
             date = now - timedelta(days=i)
             date_str = date.strftime("%Y-%m-%d")
-            entries = ByteRoverAtomic.read(self._day_file(date_str), default=[])
+            entries = self._read_day(date_str, ["model", "cost_usd"])
             for e in entries:
                 model = e.get("model", "unknown")
                 breakdown[model] = breakdown.get(model, 0) + e.get("cost_usd", 0)
         
         return breakdown
     
+    @_memoized
+    def get_all_agent_spend_map(self, agent_ids: tuple[str, ...] = (), days: int = 30) -> dict[str, tuple[float, bool]]:
+        """
+        Spend over N days and budget-exceeded flag for every agent, from a
+        single pass over the day files. Agents in `agent_ids` are included
+        even when they have no recorded calls.
+        """
+        now = datetime.now(timezone.utc)
+        spend: dict[str, float] = dict.fromkeys(agent_ids, 0.0)
+        
+        for i in range(days):
+            date = now - timedelta(days=i)
+            date_str = date.strftime("%Y-%m-%d")
+            entries = self._read_day(date_str, ["agent_id", "cost_usd"])
+            for e in entries:
+                agent_id = e.get("agent_id", "unknown")
+                spend[agent_id] = spend.get(agent_id, 0.0) + e.get("cost_usd", 0)
+        
+        return {
+            agent_id: (total, total >= self.agent_caps.get(agent_id, DEFAULT_AGENT_CAP))
+            for agent_id, total in spend.items()
+        }
+    
+    @_memoized
     def get_daily_breakdown(self, days: int = 7) -> list[dict]:
         """Daily spend for the last N days."""
         now = datetime.now(timezone.utc)
@@ -226,9 +340,7 @@ class CostTracker:
         for i in range(days):
             date = now - timedelta(days=i)
             date_str = date.strftime("%Y-%m-%d")
-            entries = ByteRoverAtomic.read(self._day_file(date_str), default=[])
-            total = sum(e.get("cost_usd", 0) for e in entries)
-            calls = len(entries)
+            total, calls = self._day_total(date_str)
             result.append({
                 "date": date_str,
                 "total_cost": round(total, 4),
@@ -239,15 +351,18 @@ class CostTracker:
     
     # ── Budget Enforcement ───────────────────────────────────
     
+    @_memoized(ttl=BUDGET_CACHE_TTL)
     def is_budget_exceeded(self) -> bool:
         """Check if monthly budget cap has been exceeded."""
         return self.get_monthly_spend() >= self.monthly_cap
     
+    @_memoized(ttl=BUDGET_CACHE_TTL)
     def is_agent_budget_exceeded(self, agent_id: str) -> bool:
         """Check if an agent's budget cap has been exceeded."""
         cap = self.agent_caps.get(agent_id, DEFAULT_AGENT_CAP)
         return self.get_agent_spend(agent_id) >= cap
     
+    @_memoized
     def get_budget_status(self) -> dict:
         """Get full budget status overview."""
         monthly = self.get_monthly_spend()
@@ -276,8 +391,16 @@ class CostTracker:
     
     # ── Config ───────────────────────────────────────────────
     
+    def invalidate(self):
+        """Drop memoized query results and budget checks."""
+        with self._query_lock:
+            self._query_generation += 1
+            self._query_cache.clear()
+    
     def set_monthly_cap(self, cap: float):
         self.monthly_cap = cap
+        self.invalidate()
     
     def set_agent_cap(self, agent_id: str, cap: float):
         self.agent_caps[agent_id] = cap
+        self.invalidate()
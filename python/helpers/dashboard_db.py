@@ -0,0 +1,282 @@
+"""
+Dashboard DB — indexed SQLite mirror of swarm, cost and routing records
+
+The JSON files written by the swarm orchestrator, cost tracker and task
+queue stay the source of truth. This module mirrors their rows into
+tmp/dashboard.sqlite so dashboard queries become indexed
+`ORDER BY ... LIMIT ?` lookups instead of full scans with an in-Python
+sort. Each source file is re-imported only when its mtime changes, and a
+sync runs at most once every SYNC_INTERVAL seconds.
+
+Swarm task rows only feed the audit panel, which covers the last
+AUDIT_WINDOW_SECONDS. Swarm files not modified within that window are never
+opened (a task's completion always bumps its file's mtime).
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from python.helpers import cost_store
+from python.helpers.json_cache import load_json_cached
+from python.helpers.swarm_records import decode_swarm
+
+DB_PATH = "tmp/dashboard.sqlite"
+SWARM_DIR = "tmp/swarms"
+COST_DIR = "tmp/cost_tracking"
+TASK_QUEUE_PATH = "memory/agent_zero/task_queue.json"
+SYNC_INTERVAL = 2.0  # seconds
+AUDIT_WINDOW_SECONDS = int(os.environ.get("DASHBOARD_AUDIT_WINDOW_SECONDS", "86400"))  # 0 = unlimited
+
+_COST_FILE_RE = re.compile(r"^costs_(\d{4}-\d{2}-\d{2})\.(?:json|parquet)$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS swarm_tasks (
+    source TEXT NOT NULL,
+    swarm_id TEXT,
+    task_id TEXT,
+    agent_profile TEXT,
+    status TEXT,
+    description TEXT,
+    completed_at TEXT,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS cost_entries (
+    source TEXT NOT NULL,
+    day TEXT NOT NULL,
+    ts TEXT,
+    agent_id TEXT,
+    model TEXT,
+    estimated_cost REAL
+);
+CREATE TABLE IF NOT EXISTS routing_decisions (
+    task_id TEXT,
+    routed_to TEXT,
+    routed_at TEXT,
+    description TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_source ON swarm_tasks (source);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON swarm_tasks (completed_at DESC);
+CREATE INDEX IF NOT EXISTS idx_cost_source ON cost_entries (source);
+CREATE INDEX IF NOT EXISTS idx_cost_day ON cost_entries (day, estimated_cost);
+CREATE INDEX IF NOT EXISTS idx_cost_ts ON cost_entries (ts DESC);
+CREATE INDEX IF NOT EXISTS idx_routing_at ON routing_decisions (routed_at DESC);
+"""
+
+_local = threading.local()
+_sync_lock = threading.Lock()
+_last_sync = 0.0
+
+
+def connect() -> sqlite3.Connection:
+    """Per-thread connection to the dashboard DB (schema created on first use)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+def audit_cutoff() -> str:
+    """ISO timestamp of the start of the audit window ("" when unlimited)."""
+    if AUDIT_WINDOW_SECONDS <= 0:
+        return ""
+    return (datetime.now(timezone.utc) - timedelta(seconds=AUDIT_WINDOW_SECONDS)).isoformat()
+
+
+# ─── Sync from JSON sources ──────────────────────────────────
+
+def _scan(directory: str, match, min_mtime_ns: int = 0) -> dict[str, int]:
+    """Map of path -> mtime_ns for files in `directory` accepted by `match`."""
+    found = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if match(entry.name):
+                    try:
+                        mtime_ns = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    if mtime_ns >= min_mtime_ns:
+                        found[entry.path] = mtime_ns
+    except FileNotFoundError:
+        pass
+    return found
+
+
+def _scan_cost_days() -> dict[str, int]:
+    """Cost day files; while a day is being compacted, only its Parquet file counts."""
+    found = _scan(COST_DIR, _COST_FILE_RE.match)
+    for path in [p for p in found if p.endswith(".parquet")]:
+        found.pop(path[: -len(".parquet")] + ".json", None)
+    return found
+
+
+def _sync_files(conn: sqlite3.Connection, table: str, current: dict[str, int], like: str, load_rows):
+    """Re-import changed files in `current`, drop rows of files that disappeared."""
+    known = dict(conn.execute("SELECT path, mtime_ns FROM sources WHERE path LIKE ?", (like,)))
+    for path in known.keys() - current.keys():
+        conn.execute(f"DELETE FROM {table} WHERE source = ?", (path,))
+        conn.execute("DELETE FROM sources WHERE path = ?", (path,))
+    for path, mtime_ns in current.items():
+        if known.get(path) == mtime_ns:
+            continue
+        try:
+            rows = load_rows(path)
+        except Exception:
+            continue  # half-written or corrupt; retried on the next mtime change
+        conn.execute(f"DELETE FROM {table} WHERE source = ?", (path,))
+        if rows:
+            placeholders = ",".join("?" * len(rows[0]))
+            conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+        conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?)", (path, mtime_ns))
+
+
+def _swarm_rows(path: str) -> list[tuple]:
+    swarm = load_json_cached(path, ttl=0, decode=decode_swarm)
+    return [
+        (
+            path,
+            swarm.swarm_id,
+            task.task_id,
+            task.agent_profile,
+            task.status,
+            task.description,
+            task.completed_at or None,
+            task.error or None,
+        )
+        for task in swarm.tasks
+    ]
+
+
+def _cost_rows(path: str) -> list[tuple]:
+    day = _COST_FILE_RE.match(os.path.basename(path)).group(1)
+    return [
+        (
+            path,
+            day,
+            entry.get("timestamp", ""),
+            entry.get("agent_id", ""),
+            entry.get("model", ""),
+            # The cost tracker writes cost_usd; older entries used estimated_cost
+            entry.get("cost_usd", entry.get("estimated_cost", 0)) or 0,
+        )
+        for entry in cost_store.read_entries(path)
+    ]
+
+
+def _routing_rows(path: str) -> list[tuple]:
+    return [
+        (
+            task.get("id", ""),
+            task.get("routed_to", ""),
+            task.get("routed_at", ""),
+            str(task.get("description", task.get("task")) or "")[:80],
+        )
+        for task in load_json_cached(path, ttl=0)
+        if isinstance(task, dict) and task.get("status") == "routed"
+    ]
+
+
+def _sync_routing(conn: sqlite3.Connection):
+    try:
+        mtime_ns = os.stat(TASK_QUEUE_PATH).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    known = conn.execute("SELECT mtime_ns FROM sources WHERE path = ?", (TASK_QUEUE_PATH,)).fetchone()
+    if (known[0] if known else None) == mtime_ns:
+        return
+    rows = []
+    if mtime_ns is not None:
+        try:
+            rows = _routing_rows(TASK_QUEUE_PATH)
+        except Exception:
+            return  # half-written or corrupt; keep the previous rows until the next mtime change
+    conn.execute("DELETE FROM routing_decisions")
+    conn.executemany("INSERT INTO routing_decisions VALUES (?, ?, ?, ?)", rows)
+    if mtime_ns is None:
+        conn.execute("DELETE FROM sources WHERE path = ?", (TASK_QUEUE_PATH,))
+    else:
+        conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?)", (TASK_QUEUE_PATH, mtime_ns))
+
+
+def sync(force: bool = False):
+    """Bring the mirror up to date with the JSON sources (throttled)."""
+    global _last_sync
+    now = time.monotonic()
+    if not force and now - _last_sync < SYNC_INTERVAL:
+        return
+    with _sync_lock:
+        if not force and now - _last_sync < SYNC_INTERVAL:
+            return
+        conn = connect()
+        swarm_min_mtime_ns = (
+            time.time_ns() - AUDIT_WINDOW_SECONDS * 1_000_000_000 if AUDIT_WINDOW_SECONDS > 0 else 0
+        )
+        with conn:
+            _sync_files(
+                conn, "swarm_tasks",
+                _scan(SWARM_DIR, lambda name: name.endswith(".json"), swarm_min_mtime_ns),
+                os.path.join(SWARM_DIR, "%"), _swarm_rows,
+            )
+            _sync_files(
+                conn, "cost_entries",
+                _scan_cost_days(),
+                os.path.join(COST_DIR, "%"), _cost_rows,
+            )
+            _sync_routing(conn)
+        _last_sync = time.monotonic()
+
+
+# ─── Queries ─────────────────────────────────────────────────
+
+def _query(sql: str, params: tuple = ()) -> list[dict]:
+    sync()
+    cursor = connect().execute(sql, params)
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+def recent_task_completions(limit: int, since: str = "") -> list[dict]:
+    return _query(
+        "SELECT swarm_id, agent_profile, status, description, completed_at FROM swarm_tasks "
+        "WHERE completed_at IS NOT NULL AND completed_at >= ? ORDER BY completed_at DESC LIMIT ?",
+        (since, limit),
+    )
+
+
+def routing_decisions(limit: int) -> list[dict]:
+    return _query(
+        "SELECT task_id, description, routed_to, routed_at FROM routing_decisions "
+        "ORDER BY routed_at DESC LIMIT ?",
+        (limit,),
+    )
+
+
+def high_cost_entries(day: str, min_cost: float, limit: int) -> list[dict]:
+    return _query(
+        "SELECT ts, agent_id, model, estimated_cost FROM cost_entries "
+        "WHERE day = ? AND estimated_cost > ? ORDER BY ts DESC LIMIT ?",
+        (day, min_cost, limit),
+    )
+
+
+def daily_cost_totals(since_day: str) -> dict[str, tuple[float, int]]:
+    """day -> (total cost, call count) for every day >= since_day that has entries."""
+    rows = _query(
+        "SELECT day, SUM(estimated_cost) AS total, COUNT(*) AS calls FROM cost_entries "
+        "WHERE day >= ? GROUP BY day",
+        (since_day,),
+    )
+    return {r["day"]: (r["total"] or 0.0, r["calls"]) for r in rows}
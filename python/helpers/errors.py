@@ -1,3 +1,5 @@
+import logging
+import os
 import re
 import traceback
 import asyncio
@@ -65,6 +67,59 @@ def format_error(e: Exception, start_entries=6, end_entries=4):
     return result
 
 
+def validation_error_text(e: Exception) -> str:
+    # short client-facing message for a pydantic ValidationError (duck-typed on .errors())
+    errors = e.errors()  # type: ignore[attr-defined]
+    missing = [
+        str(err["loc"][0])
+        for err in errors
+        if err.get("loc") and err["type"] in ("missing", "string_too_short")
+    ]
+    if len(missing) == len(errors):
+        return f"{' and '.join(missing)} {'are' if len(missing) > 1 else 'is'} required"
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in errors
+    )
+
+
+def error_response(e: Exception, logger: logging.Logger, log_message: str) -> dict:
+    # client-facing {"error": ...} for an exception raised while handling a request;
+    # stack frames only go over the wire when explicitly debugging (AGENT_DEBUG),
+    # otherwise they are logged server-side
+    response = {"error": str(e)}
+    if os.environ.get("AGENT_DEBUG"):
+        response["trace"] = traceback.format_exc()
+    else:
+        logger.exception(log_message)
+    return response
+
+
+def dispatch_action(
+    actions: dict, request_data: dict, logger: logging.Logger, name: str, default_action: str = ""
+) -> dict:
+    # run request_data["action"] from an action table of
+    # name -> (handler, pydantic request model or None when the action takes no input);
+    # the request model is validated once here, before the handler runs
+    action = request_data.get("action", "") or default_action
+    entry = actions.get(action)
+    if entry is None:
+        return {
+            "error": f"Unknown action: {action}",
+            "available_actions": list(actions),
+        }
+    handler, model = entry
+
+    try:
+        req = model.model_validate(request_data) if model else None
+    except ValueError as e:  # pydantic's ValidationError is a ValueError
+        return {"error": validation_error_text(e)}
+
+    try:
+        return handler(req)
+    except Exception as e:
+        return error_response(e, logger, f"{name} API action '{action}' failed")
+
+
 class RepairableException(Exception):
     """An exception type indicating errors that can be surfaced to the LLM for potential self-repair."""
     pass
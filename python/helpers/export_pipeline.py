@@ -16,8 +16,15 @@ from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, asdict
 from typing import Optional
 
+from python.helpers import fastjson
 
-@dataclass
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+@dataclass(slots=True)
 class ExportJob:
     """Represents an export job."""
     job_id: str
@@ -30,16 +37,48 @@ class ExportJob:
     record_count: int = 0
     error: Optional[str] = None
 
+    def to_response_dict(self) -> dict:
+        """The API's view of a finished job."""
+        return {
+            "ok": self.status == "completed",
+            "job_id": self.job_id,
+            "status": self.status,
+            "output_path": self.output_path,
+            "record_count": self.record_count,
+            "error": self.error,
+        }
+
 
 EXPORT_DIR = "tmp/exports"
+ZSTD_LEVEL = 3
 
 
 def _ensure_export_dir():
     os.makedirs(EXPORT_DIR, exist_ok=True)
 
 
-def export_knowledge(format: str = "json") -> ExportJob:
-    """Export all knowledge base data (TKGM triples + temporal metadata)."""
+def _write_json(output_path: str, data, compress: bool = False) -> str:
+    """
+    Write data as indented JSON. With compress (and zstandard installed) the
+    file is zstd-compressed on the way out and written to output_path +
+    ".zst". Returns the path actually written.
+    """
+    if compress and zstandard is not None:
+        output_path += ".zst"
+        with open(output_path, "wb") as raw:
+            with zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False) as f:
+                f.write(fastjson.dumps(data, indent=True))
+        return output_path
+    with open(output_path, "w") as f:
+        json.dump(data, f, indent=2)
+    return output_path
+
+
+def export_knowledge(format: str = "json", compress: bool = False) -> ExportJob:
+    """
+    Export all knowledge base data (TKGM triples + temporal metadata).
+    compress zstd-compresses JSON output (see _write_json).
+    """
     _ensure_export_dir()
     job_id = f"exp_knowledge_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
     job = ExportJob(
@@ -102,9 +141,7 @@ def export_knowledge(format: str = "json") -> ExportJob:
         }
 
         if format == "json":
-            output_path = os.path.join(EXPORT_DIR, f"{job_id}.json")
-            with open(output_path, "w") as f:
-                json.dump(data, f, indent=2)
+            output_path = _write_json(os.path.join(EXPORT_DIR, f"{job_id}.json"), data, compress)
         elif format == "csv":
             output_path = os.path.join(EXPORT_DIR, f"{job_id}_triples.csv")
             with open(output_path, "w", newline="") as f:
@@ -129,9 +166,7 @@ def export_knowledge(format: str = "json") -> ExportJob:
                 if len(all_triples) > 100:
                     f.write(f"\n*... and {len(all_triples) - 100} more triples*\n")
         else:
-            output_path = os.path.join(EXPORT_DIR, f"{job_id}.json")
-            with open(output_path, "w") as f:
-                json.dump(data, f, indent=2)
+            output_path = _write_json(os.path.join(EXPORT_DIR, f"{job_id}.json"), data, compress)
 
         job.status = "completed"
         job.output_path = output_path
@@ -304,8 +339,12 @@ def export_audit(days: int = 7, format: str = "json") -> ExportJob:
     return job
 
 
-def export_full_backup() -> ExportJob:
-    """Export everything — full platform backup."""
+def export_full_backup(compress: bool = False) -> ExportJob:
+    """
+    Export everything — full platform backup. compress applies to the
+    knowledge export, by far the largest component; the manifest stays
+    plain JSON.
+    """
     _ensure_export_dir()
     job_id = f"exp_backup_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
     job = ExportJob(
@@ -317,7 +356,7 @@ def export_full_backup() -> ExportJob:
     )
 
     try:
-        knowledge_job = export_knowledge("json")
+        knowledge_job = export_knowledge("json", compress)
         costs_job = export_costs(90, "json")
         audit_job = export_audit(30, "json")
 
@@ -0,0 +1,69 @@
+"""
+Fast JSON — orjson when it is installed, stdlib json otherwise.
+
+Both paths work on UTF-8 bytes and produce the same compact (or
+2-space indented) output, so callers don't need to care which one ran.
+Like stdlib json, non-string dict keys (ints, floats, bools) are encoded
+as strings.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode to UTF-8 JSON bytes; indent=True gives 2-space indentation."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def load_file(path: str) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(path: str, obj: Any, indent: bool = False):
+    """Encode and write a JSON file."""
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=indent))
+
+
+def dump_file_streaming(path: str, obj: dict):
+    """
+    Write a top-level dict with each element of its list values on its own
+    line. Elements are encoded and written one at a time, so a large export
+    is never held in memory as a single encoded buffer.
+    """
+    with open(path, "wb") as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(obj.items()):
+            f.write(b"," if i else b"")
+            f.write(b"\n  " + dumps(key) + b": ")
+            if not isinstance(value, list) or not value:
+                f.write(dumps(value))
+                continue
+            f.write(b"[")
+            for j, item in enumerate(value):
+                f.write(b",\n    " if j else b"\n    ")
+                f.write(dumps(item))
+            f.write(b"\n  ]")
+        f.write(b"\n}\n")
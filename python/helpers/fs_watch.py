@@ -0,0 +1,138 @@
+"""
+FS Watch — change notifications for the dashboard data directories
+
+The dashboard caches revalidate by polling file mtimes. With watchdog
+installed, a single observer watches the directories those files live in
+and records which cached files were written, so a cache hit needs no stat
+at all until a change is reported. Without watchdog (or for paths outside
+the watched directories) every function here reports "unknown" and callers
+keep polling.
+
+Events are delivered asynchronously, so a write is only guaranteed to be
+seen a few milliseconds later — callers that must observe their own
+just-finished writes should keep revalidating by mtime.
+"""
+
+import os
+import threading
+import time
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+WATCH_DIRS = ("tmp/swarms", "tmp/cost_tracking", "tmp/orchestrator", "memory")
+RETRY_INTERVAL = 5.0  # seconds between attempts to watch directories that don't exist yet
+
+# Opening or closing a file without writing doesn't change it
+_READ_EVENTS = ("opened", "closed_no_write")
+
+_lock = threading.Lock()
+_observer = None
+_watched: dict[str, str] = {}  # absolute root -> root + os.sep
+_generations: dict[str, int] = {}  # absolute root -> number of changes seen under it
+_tracked: set[str] = set()  # absolute paths callers asked to hear about
+_dirty: set[str] = set()  # tracked paths written since they were last tracked
+_abs: dict[str, str] = {}
+_last_attempt = float("-inf")
+
+if Observer is not None:
+
+    class _Handler(FileSystemEventHandler):
+
+        def __init__(self, root: str):
+            self.root = root
+
+        def on_any_event(self, event):
+            if event.event_type in _READ_EVENTS:
+                return
+            with _lock:
+                _generations[self.root] += 1
+                for path in (event.src_path, getattr(event, "dest_path", "")):
+                    if path in _tracked:
+                        _dirty.add(path)
+
+
+def _ensure_started():
+    global _observer, _last_attempt
+    if Observer is None or len(_watched) == len(WATCH_DIRS):
+        return
+    now = time.monotonic()
+    if now - _last_attempt < RETRY_INTERVAL:
+        return
+    with _lock:
+        if now - _last_attempt < RETRY_INTERVAL:
+            return
+        _last_attempt = now
+        if _observer is None:
+            _observer = Observer()
+            _observer.daemon = True
+            _observer.start()
+        for directory in WATCH_DIRS:
+            root = os.path.abspath(directory)
+            if root in _watched or not os.path.isdir(root):
+                continue
+            try:
+                _observer.schedule(_Handler(root), root, recursive=True)
+            except OSError:
+                continue
+            _generations[root] = 0
+            _watched[root] = root + os.sep
+
+
+def _absolute(path: str) -> str:
+    absolute = _abs.get(path)
+    if absolute is None:
+        absolute = _abs[path] = os.path.abspath(path)
+    return absolute
+
+
+def _root_of(absolute: str) -> str | None:
+    for root, prefix in _watched.items():
+        if absolute == root or absolute.startswith(prefix):
+            return root
+    return None
+
+
+def track(path: str):
+    """Start (or restart) listening for writes to `path`. Call before reading it."""
+    _ensure_started()
+    absolute = _absolute(path)
+    if _root_of(absolute) is None:
+        return
+    with _lock:
+        _tracked.add(absolute)
+        _dirty.discard(absolute)
+
+
+def is_unchanged(path: str) -> bool:
+    """True only if `path` is tracked in a watched directory and no write was seen since track()."""
+    _ensure_started()
+    absolute = _absolute(path)
+    with _lock:
+        return absolute in _tracked and absolute not in _dirty and _root_of(absolute) is not None
+
+
+def generation(directory: str) -> int | None:
+    """Change counter for a watched directory tree, or None when it isn't watched."""
+    _ensure_started()
+    with _lock:
+        return _generations.get(_absolute(directory))
+
+
+def stop():
+    """Stop the observer and forget all watch state."""
+    global _observer, _last_attempt
+    with _lock:
+        observer, _observer = _observer, None
+        _watched.clear()
+        _generations.clear()
+        _tracked.clear()
+        _dirty.clear()
+        _abs.clear()
+        _last_attempt = float("-inf")
+    if observer is not None:
+        observer.stop()
+        observer.join(timeout=2)
@@ -0,0 +1,84 @@
+"""
+JSON File Cache — shared decoded-JSON cache for dashboard reads
+
+Dashboard endpoints re-read the same swarm, loop-state, cost and TKGM
+files on every request. This keeps the decoded object in memory and only
+re-reads a file when its mtime, size or inode changes (two writes within
+one timestamp tick share an mtime, and the atomic writers replace the
+inode); within `ttl` seconds of the last check the cached object is
+returned without touching the disk at all.
+For files in directories watched by fs_watch, a cache hit past the TTL
+still skips the stat as long as no write to the file has been reported.
+
+Cached objects are shared between callers — treat them as read-only.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable
+
+from python.helpers import fastjson, fs_watch
+
+# path or (path, decode) -> (checked_at, (mtime_ns, size, inode), data)
+_cache: dict[Any, tuple[float, tuple[int, int, int], Any]] = {}
+_dir_cache: dict[str, tuple[float, list[str]]] = {}  # dir -> (checked_at, names)
+_lock = threading.Lock()
+
+
+def load_json_cached(path: str, ttl: float = 2.0, decode: Callable[[bytes], Any] | None = None) -> Any:
+    """
+    Load and decode a JSON file, reusing the cached object while the file
+    is unchanged. `decode` replaces the default decoder (e.g. to build typed
+    records); each decoder gets its own cache entry. Raises like
+    open()/json.loads() when the file is missing or invalid. With ttl=0 the
+    file is always revalidated by stat, even when it is being watched.
+    """
+    key = path if decode is None else (path, decode)
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+    if entry is not None and (now - entry[0] < ttl or (ttl > 0 and fs_watch.is_unchanged(path))):
+        return entry[2]
+
+    fs_watch.track(path)  # writes from here on mark the cached copy stale
+    try:
+        st = os.stat(path)
+    except OSError:
+        with _lock:
+            _cache.pop(key, None)
+        raise
+
+    version = (st.st_mtime_ns, st.st_size, st.st_ino)
+    if entry is not None and entry[1] == version:
+        data = entry[2]
+    elif decode is None:
+        data = fastjson.load_file(path)
+    else:
+        with open(path, "rb") as f:
+            data = decode(f.read())
+
+    with _lock:
+        _cache[key] = (now, version, data)
+    return data
+
+
+def listdir_cached(path: str, ttl: float = 1.0) -> list[str]:
+    """os.listdir() with a short TTL. The returned list is shared — don't mutate it."""
+    now = time.monotonic()
+    with _lock:
+        entry = _dir_cache.get(path)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+
+    names = os.listdir(path)
+    with _lock:
+        _dir_cache[path] = (now, names)
+    return names
+
+
+def clear_cache():
+    """Drop every cached file and directory listing."""
+    with _lock:
+        _cache.clear()
+        _dir_cache.clear()
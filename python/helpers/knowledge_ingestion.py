@@ -18,13 +18,17 @@ Follows Ralphie loop pattern:
 Created: 2026-02-09
 """
 
+import asyncio
 import os
 import re
 import json
 import hashlib
+import threading
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Generator
 from dataclasses import dataclass, field
+from python.helpers.json_cache import load_json_cached
 from python.helpers.print_style import PrintStyle
 from python.helpers.memory import Memory
 from python.helpers.tkgm_memory import ByteRoverAtomic, MemoryDomain, TemporalTag
@@ -34,6 +38,12 @@ from python.helpers.tkgm_memory import ByteRoverAtomic, MemoryDomain, TemporalTa
 
 INGESTION_STATUS_FILE = "tmp/knowledge_ingestion/status.json"
 
+INGEST_CONCURRENCY = 8  # files ingested at once by ingest_directory
+
+_summary_memo: tuple[list, dict] | None = None  # (history list it was computed from, summary)
+_status_lock = threading.Lock()  # guards status.json read-modify-write and _in_flight
+_in_flight: set[str] = set()  # hashes of files currently being ingested
+
 @dataclass
 class IngestionRecord:
     source_path: str
@@ -360,6 +370,7 @@ async def ingest_file(
     4. Persist status atomically
     """
     record = IngestionRecord(source_path=filepath, source_type=source_type)
+    claimed = ""  # hash this call marked as in flight
     
     try:
         if not os.path.exists(filepath):
@@ -367,16 +378,22 @@ async def ingest_file(
             record.error = f"File not found: {filepath}"
             return record
         
-        # Check deduplication
+        # Check deduplication (including identical files being ingested concurrently)
         fhash = _file_hash(filepath)
         record.file_hash = fhash
         
-        status = _get_ingestion_status()
-        for existing in status.get("records", []):
-            if existing.get("file_hash") == fhash and existing.get("status") == "completed":
-                record.status = "skipped"
-                record.error = "Already ingested (duplicate hash)"
-                return record
+        with _status_lock:
+            duplicate = fhash in _in_flight or any(
+                existing.get("file_hash") == fhash and existing.get("status") == "completed"
+                for existing in get_ingestion_history()
+            )
+            if not duplicate:
+                _in_flight.add(fhash)
+                claimed = fhash
+        if duplicate:
+            record.status = "skipped"
+            record.error = "Already ingested (duplicate hash)"
+            return record
         
         # Auto-detect source type
         if source_type == "auto":
@@ -418,21 +435,27 @@ async def ingest_file(
         record.chunk_count = len(documents)
         record.status = "completed"
         
-        # Persist status
-        status["records"].append({
-            "source_path": record.source_path,
-            "source_type": record.source_type,
-            "chunk_count": record.chunk_count,
-            "status": record.status,
-            "file_hash": record.file_hash,
-            "ingested_at": record.ingested_at,
-        })
-        _save_ingestion_status(status)
+        # Persist status (re-read under the lock so concurrent ingests don't drop records)
+        with _status_lock:
+            status = _get_ingestion_status()
+            status["records"].append({
+                "source_path": record.source_path,
+                "source_type": record.source_type,
+                "chunk_count": record.chunk_count,
+                "status": record.status,
+                "file_hash": record.file_hash,
+                "ingested_at": record.ingested_at,
+            })
+            _save_ingestion_status(status)
         
     except Exception as e:
         record.status = "failed"
         record.error = str(e)
         PrintStyle.error(f"Ingestion failed for {filepath}: {e}")
+    finally:
+        if claimed:
+            with _status_lock:
+                _in_flight.discard(claimed)
     
     return record
 
@@ -444,28 +467,62 @@ async def ingest_directory(
     area: str = Memory.Area.MAIN.value,
     domain: MemoryDomain = MemoryDomain.AGENT_ZERO,
 ) -> list[IngestionRecord]:
-    """Ingest all supported files from a directory."""
+    """
+    Ingest all supported files from a directory, up to INGEST_CONCURRENCY
+    at a time so embedding calls overlap. Records come back in walk order.
+    """
     supported_extensions = {".json", ".md", ".mdx", ".txt", ".text", ".pdf"}
-    records = []
+    paths = []
     
     if recursive:
         for root, dirs, fnames in os.walk(dirpath):
             for fname in fnames:
                 if os.path.splitext(fname)[1].lower() in supported_extensions:
-                    fpath = os.path.join(root, fname)
-                    record = await ingest_file(fpath, agent, "auto", area, domain)
-                    records.append(record)
+                    paths.append(os.path.join(root, fname))
     else:
         for fname in os.listdir(dirpath):
             fpath = os.path.join(dirpath, fname)
             if os.path.isfile(fpath) and os.path.splitext(fname)[1].lower() in supported_extensions:
-                record = await ingest_file(fpath, agent, "auto", area, domain)
-                records.append(record)
+                paths.append(fpath)
     
-    return records
+    semaphore = asyncio.Semaphore(INGEST_CONCURRENCY)
+
+    async def ingest_one(fpath: str) -> IngestionRecord:
+        async with semaphore:
+            return await ingest_file(fpath, agent, "auto", area, domain)
+
+    return list(await asyncio.gather(*(ingest_one(fpath) for fpath in paths)))
 
 
 def get_ingestion_history() -> list[dict]:
-    """Get all ingestion records."""
-    status = _get_ingestion_status()
-    return status.get("records", [])
+    """
+    Get all ingestion records. The decoded status file is cached until its
+    mtime changes; the returned list is shared, so treat it as read-only.
+    """
+    try:
+        return load_json_cached(INGESTION_STATUS_FILE, ttl=0).get("records", [])
+    except (OSError, ValueError):
+        return []
+
+
+def get_ingestion_summary() -> dict:
+    """Record counts by status, recomputed only when the history changes."""
+    global _summary_memo
+    records = get_ingestion_history()
+    memo = _summary_memo
+    if memo is not None and memo[0] is records:
+        return memo[1]
+
+    counts = Counter()
+    total_chunks = 0
+    for r in records:
+        counts[r.get("status", "")] += 1
+        total_chunks += r.get("chunk_count", 0)
+    summary = {
+        "total_ingested": len(records),
+        "total_completed": counts["completed"],
+        "total_failed": counts["failed"],
+        "total_chunks": total_chunks,
+    }
+    _summary_memo = (records, summary)
+    return summary
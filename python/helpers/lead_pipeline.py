@@ -18,6 +18,7 @@ Scoring Model:
 
 import os
 import json
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field, asdict
 from typing import Optional
@@ -197,21 +198,16 @@ def add_note(lead_id: str, note_text: str) -> Optional[Lead]:
     return None
 
 
-def get_leads(status: str = "", temperature: str = "", limit: int = 50) -> list:
-    """Get leads filtered by status and/or temperature."""
-    leads = _load_leads()
+def _filter_leads(leads: list, status: str, temperature: str, limit: int) -> list:
     if status:
         leads = [l for l in leads if l.status == status]
     if temperature:
         leads = [l for l in leads if l.temperature == temperature]
     # Sort by score descending
-    leads.sort(key=lambda l: l.score, reverse=True)
-    return leads[:limit]
+    return sorted(leads, key=lambda l: l.score, reverse=True)[:limit]
 
 
-def get_followups_due() -> list:
-    """Get leads with followups due today or overdue."""
-    leads = _load_leads()
+def _followups_due(leads: list) -> list:
     now = datetime.now(timezone.utc).isoformat()
     return [
         l for l in leads
@@ -220,26 +216,46 @@ def get_followups_due() -> list:
     ]
 
 
+def _summarize(leads: list, followups_due: int) -> dict:
+    by_status = Counter(l.status for l in leads)
+    by_temperature = Counter({"hot": 0, "warm": 0, "cold": 0})
+    by_temperature.update(l.temperature for l in leads)
+    by_channel = Counter(l.source_channel for l in leads)
+    return {
+        "total": len(leads),
+        "by_status": dict(by_status),
+        "by_temperature": dict(by_temperature),
+        "by_channel": dict(by_channel),
+        "avg_score": round(sum(l.score for l in leads) / len(leads)) if leads else 0,
+        "followups_due": followups_due,
+    }
+
+
+def get_leads(status: str = "", temperature: str = "", limit: int = 50) -> list:
+    """Get leads filtered by status and/or temperature."""
+    return _filter_leads(_load_leads(), status, temperature, limit)
+
+
+def get_followups_due() -> list:
+    """Get leads with followups due today or overdue."""
+    return _followups_due(_load_leads())
+
+
 def get_pipeline_summary() -> dict:
     """Get pipeline summary statistics."""
     leads = _load_leads()
-    summary = {
-        "total": len(leads),
-        "by_status": {},
-        "by_temperature": {"hot": 0, "warm": 0, "cold": 0},
-        "by_channel": {},
-        "avg_score": 0,
-        "followups_due": len(get_followups_due()),
-    }
-    
-    total_score = 0
-    for lead in leads:
-        summary["by_status"][lead.status] = summary["by_status"].get(lead.status, 0) + 1
-        summary["by_temperature"][lead.temperature] = summary["by_temperature"].get(lead.temperature, 0) + 1
-        summary["by_channel"][lead.source_channel] = summary["by_channel"].get(lead.source_channel, 0) + 1
-        total_score += lead.score
+    return _summarize(leads, len(_followups_due(leads)))
 
-    if leads:
-        summary["avg_score"] = round(total_score / len(leads))
 
-    return summary
+def get_dashboard(status: str = "", temperature: str = "", limit: int = 20) -> dict:
+    """
+    Filtered leads, pipeline summary and due follow-ups from a single read
+    of the leads file — what the CRM dashboard loads in one request.
+    """
+    leads = _load_leads()
+    followups = _followups_due(leads)
+    return {
+        "leads": _filter_leads(leads, status, temperature, limit),
+        "pipeline": _summarize(leads, len(followups)),
+        "followups": followups,
+    }
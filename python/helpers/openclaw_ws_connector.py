@@ -188,7 +188,7 @@ def create_agent_zero_connector():
     async def handle_message(msg: Dict[str, Any]) -> Optional[str]:
         """Route an inbound message through Agent Zero."""
         try:
-            from python.helpers.voice_command_router import VoiceCommandRouter
+            from python.helpers.voice_command_router import get_router
 
             content = msg.get("content", "").strip()
             platform = msg.get("platform", "direct")
@@ -198,7 +198,7 @@ def create_agent_zero_connector():
                 return None
 
             # Check if it's a voice command first
-            router = VoiceCommandRouter()
+            router = get_router()
             match = router.match(content)
 
             if match and match.confidence >= 0.6:
@@ -0,0 +1,174 @@
+"""
+Swarm Index — pre-aggregated swarm summary for dashboards
+
+Dashboard panels need per-profile task counts, the swarm list and recent
+task errors, which otherwise means re-scanning every file in tmp/swarms on
+every request. The swarm orchestrator calls maybe_rebuild() whenever it
+persists a swarm, and dashboards read the single compact index instead.
+The index records the count and mtimes of the swarm files it was built
+from, so swarms written or deleted by another process (or while the server
+was down) trigger a rebuild on the next load.
+
+The index lives beside (not inside) tmp/swarms so that code scanning the
+swarm directory never mistakes it for a swarm.
+"""
+
+import heapq
+import os
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from python.helpers import fastjson, fs_watch, swarm_reader
+from python.helpers.json_cache import load_json_cached
+from python.helpers.swarm_reader import read_all_swarms
+from python.helpers.swarm_records import Swarm
+
+INDEX_PATH = "tmp/swarm_index.json"
+MAX_ERRORS = 500
+MAX_COMPLETIONS = 200
+
+# Task status -> profile_counts bucket; other statuses aren't counted
+BUCKET = {"running": "running", "completed": "completed", "failed": "failed", "timeout": "failed"}
+
+_lock = threading.Lock()
+_timer: threading.Timer | None = None
+_index_memo: tuple[int, dict] | None = None  # (fs_watch generation of the swarm dir, index)
+
+
+def _source_signature() -> list[int]:
+    """[file count, newest mtime, sum of mtimes] of the swarm files, in ns."""
+    count = newest = total = 0
+    try:
+        with os.scandir(swarm_reader.SWARM_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                count += 1
+                newest = max(newest, mtime)
+                total += mtime
+    except FileNotFoundError:
+        pass
+    return [count, newest, total]
+
+
+def build_index(swarms: list[Swarm]) -> dict:
+    """Aggregate decoded swarm records into the index shape."""
+    summaries = []
+    profile_counts: dict[str, dict[str, int]] = defaultdict(lambda: {"running": 0, "completed": 0, "failed": 0})
+    bucket_of = BUCKET.get
+    errors = []
+    completions = []
+
+    for swarm in swarms:
+        summaries.append({
+            "swarm_id": swarm.swarm_id,
+            "name": swarm.name,
+            "status": swarm.status,
+            "created_at": swarm.created_at,
+            "progress": swarm.progress,
+            "task_count": swarm.task_count,
+        })
+        source = f"swarm/{swarm.swarm_id}"
+        for task in swarm.tasks:
+            profile = task.agent_profile
+            status = task.status
+            counts = profile_counts[profile]
+            bucket = bucket_of(status)
+            if bucket:
+                counts[bucket] += 1
+
+            if task.error:
+                errors.append({
+                    "timestamp": task.completed_at or "",
+                    "source": source,
+                    "agent": profile,
+                    "error": task.error,
+                    "task": task.description[:60],
+                })
+            if task.completed_at:
+                completions.append({
+                    "swarm_id": swarm.swarm_id,
+                    "timestamp": task.completed_at,
+                    "status": status,
+                    "agent": profile,
+                    "task": task.description[:60],
+                })
+
+    summaries.sort(key=lambda s: s.get("created_at") or "", reverse=True)
+
+    return {
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "swarms": summaries,
+        "profile_counts": dict(profile_counts),
+        "errors": heapq.nlargest(MAX_ERRORS, errors, key=lambda e: e["timestamp"] or ""),
+        "recent_task_completions": heapq.nlargest(
+            MAX_COMPLETIONS, completions, key=lambda c: c["timestamp"] or ""
+        ),
+    }
+
+
+def rebuild_index(signature: list[int] | None = None) -> dict:
+    """Rebuild the index from every swarm file and write it atomically."""
+    # Taken before reading, so a swarm written mid-rebuild makes it stale
+    if signature is None:
+        signature = _source_signature()
+    index = build_index(read_all_swarms(ttl=0))
+    index["built_from"] = signature
+    os.makedirs(os.path.dirname(INDEX_PATH), exist_ok=True)
+    tmp_path = f"{INDEX_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fastjson.dump_file(tmp_path, index)
+    os.replace(tmp_path, INDEX_PATH)
+    return index
+
+
+def _run_scheduled():
+    global _timer
+    with _lock:
+        _timer = None
+    try:
+        rebuild_index()
+    except Exception:
+        pass  # next write schedules another rebuild; readers fall back to a sync build
+
+
+def maybe_rebuild(debounce: float = 2.0):
+    """
+    Schedule a rebuild `debounce` seconds from now. Writes landing while one
+    is pending are folded into it, so a burst of task updates costs one rebuild.
+    """
+    global _timer
+    with _lock:
+        if _timer is not None:
+            return
+        _timer = threading.Timer(debounce, _run_scheduled)
+        _timer.daemon = True
+        _timer.start()
+
+
+def load_index() -> dict:
+    """
+    Return the current index, rebuilding it synchronously first if it doesn't
+    exist yet or any swarm file was added, removed or modified since it was
+    built. While the swarm directory is watched by fs_watch and nothing in it
+    changed, the last index is returned without scanning the directory.
+    """
+    global _index_memo
+    generation = fs_watch.generation(swarm_reader.SWARM_DIR)
+    memo = _index_memo
+    if generation is not None and memo is not None and memo[0] == generation:
+        return memo[1]
+
+    signature = _source_signature()
+    try:
+        index = load_json_cached(INDEX_PATH)
+        if index.get("built_from") != signature:
+            index = rebuild_index(signature)
+    except (OSError, ValueError):
+        index = rebuild_index(signature)
+    _index_memo = (generation, index) if generation is not None else None
+    return index
@@ -0,0 +1,60 @@
+"""
+Swarm Reader — concurrent loading of persisted swarm state for dashboards
+
+Swarm executions are persisted one file per swarm under tmp/swarms (see
+python/tools/swarm_orchestrator.py). Dashboard panels need all of them at
+once, so reads are fanned out over a shared thread pool and go through the
+decoded-JSON cache as typed Swarm records.
+"""
+
+import heapq
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from python.helpers.json_cache import load_json_cached
+from python.helpers.swarm_records import Swarm, decode_swarm
+
+logger = logging.getLogger(__name__)
+
+SWARM_DIR = "tmp/swarms"
+
+# Shared across requests; file reads release the GIL, so threads overlap the I/O
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="swarm_reader")
+
+
+def _load(path: str, ttl: float) -> Swarm | None:
+    try:
+        return load_json_cached(path, ttl=ttl, decode=decode_swarm)
+    except FileNotFoundError:
+        return None  # deleted since the directory was listed
+    except (OSError, ValueError) as e:  # msgspec.DecodeError is a ValueError
+        logger.warning(f"Skipping unreadable swarm file {path}: {e}")
+        return None
+
+
+def _mtime_ns(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def read_all_swarms(limit: int | None = None, ttl: float = 2.0) -> list[Swarm]:
+    """
+    Load every swarm file concurrently. With `limit`, only the most recently
+    modified `limit` files are read, newest first. Unreadable files are skipped.
+    `ttl` is passed to the JSON cache; 0 always revalidates against mtime.
+    Returned records are shared with the cache — treat them as read-only.
+    """
+    try:
+        with os.scandir(SWARM_DIR) as it:
+            entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+    if limit is not None:
+        entries = heapq.nlargest(limit, entries, key=_mtime_ns)
+
+    return [s for s in _executor.map(partial(_load, ttl=ttl), [e.path for e in entries]) if s is not None]
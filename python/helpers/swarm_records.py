@@ -0,0 +1,110 @@
+"""
+Swarm Records — typed views of persisted swarm files
+
+Dashboards only need a handful of fields from each swarm file written by
+python/tools/swarm_orchestrator.py. With msgspec installed the file is
+decoded straight into slot-based Structs, skipping the intermediate dicts
+and every `.get(...)` lookup; otherwise the same classes are slotted
+dataclasses filled from a regular JSON decode. Unknown fields are ignored,
+and a file whose fields don't have the expected types (a null name, a
+numeric status, ...) is rebuilt from the plain decode with those fields
+coerced or defaulted, rather than rejected.
+"""
+
+from dataclasses import dataclass, field
+
+from python.helpers import fastjson
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class SwarmTask(msgspec.Struct):
+        task_id: str = ""
+        agent_profile: str = "default"
+        status: str = "pending"
+        description: str = ""
+        completed_at: str | None = None
+        error: str | None = None
+
+    class Swarm(msgspec.Struct):
+        swarm_id: str = ""
+        name: str = ""
+        status: str = ""
+        created_at: str = ""
+        progress: dict = {}
+        task_count: int = 0
+        tasks: list[SwarmTask] = []
+
+    _decoder = msgspec.json.Decoder(Swarm)
+
+    def decode_swarm(data: bytes) -> Swarm:
+        """Decode a swarm file's bytes."""
+        try:
+            return _decoder.decode(data)
+        except msgspec.ValidationError:
+            return _from_raw(fastjson.loads(data))
+
+else:
+
+    @dataclass(slots=True)
+    class SwarmTask:
+        task_id: str = ""
+        agent_profile: str = "default"
+        status: str = "pending"
+        description: str = ""
+        completed_at: str | None = None
+        error: str | None = None
+
+    @dataclass(slots=True)
+    class Swarm:
+        swarm_id: str = ""
+        name: str = ""
+        status: str = ""
+        created_at: str = ""
+        progress: dict = field(default_factory=dict)
+        task_count: int = 0
+        tasks: list[SwarmTask] = field(default_factory=list)
+
+    def decode_swarm(data: bytes) -> Swarm:
+        """Decode a swarm file's bytes."""
+        return _from_raw(fastjson.loads(data))
+
+
+def _text(value, default: str | None) -> str | None:
+    if value is None:
+        return default
+    return value if isinstance(value, str) else str(value)
+
+
+def _task_from_raw(raw: dict) -> SwarmTask:
+    return SwarmTask(
+        task_id=_text(raw.get("task_id"), ""),
+        agent_profile=_text(raw.get("agent_profile"), "default"),
+        status=_text(raw.get("status"), "pending"),
+        description=_text(raw.get("description"), ""),
+        completed_at=_text(raw.get("completed_at"), None),
+        error=_text(raw.get("error"), None),
+    )
+
+
+def _from_raw(raw) -> Swarm:
+    """Build a Swarm from a plain decode, coercing or defaulting mistyped fields."""
+    if not isinstance(raw, dict):
+        raise ValueError("swarm file does not hold a JSON object")
+    progress = raw.get("progress")
+    task_count = raw.get("task_count")
+    tasks = raw.get("tasks")
+    return Swarm(
+        swarm_id=_text(raw.get("swarm_id"), ""),
+        name=_text(raw.get("name"), ""),
+        status=_text(raw.get("status"), ""),
+        created_at=_text(raw.get("created_at"), ""),
+        progress=progress if isinstance(progress, dict) else {},
+        task_count=task_count if type(task_count) is int else 0,
+        tasks=[_task_from_raw(t) for t in tasks if isinstance(t, dict)] if isinstance(tasks, list) else [],
+    )
@@ -24,6 +24,7 @@ import json
 import logging
 import os
 import re
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
@@ -44,6 +45,15 @@ except ImportError:
     except ImportError:
         logger.warning("Neither httpx nor requests installed — Telegram bot unavailable")
 
+_client = None
+_client_lock = threading.Lock()
+
+# Messages are handled on several threads at once (live_services worker pool,
+# webhook requests); these serialize the read-modify-write of the JSON log
+# and the vault writes
+_log_lock = threading.Lock()
+_vault_lock = threading.Lock()
+
 # ─── Constants ───────────────────────────────────────────────
 
 BOT_NAME = "Pauli_the_paulibot"
@@ -95,23 +105,50 @@ def _api_url(method: str) -> str:
     return f"{TELEGRAM_API_BASE.format(token=_get_bot_token())}/{method}"
 
 
+def _http():
+    """
+    Shared keep-alive HTTP client, so long-polls and replies reuse one
+    TLS connection instead of handshaking on every call. Thread-safe.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if hasattr(httpx, "Client"):
+                    try:
+                        import h2  # noqa: F401 — httpx needs it for HTTP/2
+                        http2 = True
+                    except ImportError:
+                        http2 = False
+                    _client = httpx.Client(
+                        http2=http2,
+                        limits=httpx.Limits(max_keepalive_connections=16),
+                        timeout=35,
+                    )
+                else:
+                    # requests fallback
+                    _client = httpx.Session()
+    return _client
+
+
 # ─── Logging ─────────────────────────────────────────────────
 
 def _log_message(entry: dict):
     """Append to JSON log."""
     os.makedirs(LOG_DIR, exist_ok=True)
-    log = []
-    if os.path.exists(LOG_FILE):
-        try:
-            with open(LOG_FILE, "r") as f:
-                log = json.load(f)
-        except Exception:
-            log = []
-    log.append(entry)
-    # Keep last 1000 messages
-    log = log[-1000:]
-    with open(LOG_FILE, "w") as f:
-        json.dump(log, f, indent=2)
+    with _log_lock:
+        log = []
+        if os.path.exists(LOG_FILE):
+            try:
+                with open(LOG_FILE, "r") as f:
+                    log = json.load(f)
+            except Exception:
+                log = []
+        log.append(entry)
+        # Keep last 1000 messages
+        log = log[-1000:]
+        with open(LOG_FILE, "w") as f:
+            json.dump(log, f, indent=2)
 
 
 # ─── Secret Detection & Auto-Encryption ─────────────────────
@@ -140,7 +177,8 @@ def auto_encrypt_secrets(text: str, source: str = "telegram") -> list:
         # Generate a vault key name
         ts = int(time.time())
         key_name = f"auto_{source}_{secret['type'].lower().replace(' ', '_')}_{ts}"
-        vault_store(key_name, secret["value"])
+        with _vault_lock:
+            vault_store(key_name, secret["value"])
         encrypted.append({
             "type": secret["type"],
             "key_name": key_name,
@@ -182,15 +220,8 @@ def send_message(chat_id: int | str, text: str, parse_mode: str = "Markdown",
         payload["reply_to_message_id"] = reply_to
     
     try:
-        if hasattr(httpx, 'post'):
-            # requests-style
-            resp = httpx.post(_api_url("sendMessage"), json=payload, timeout=30)
-            return resp.json()
-        else:
-            # httpx async client
-            with httpx.Client(timeout=30) as client:
-                resp = client.post(_api_url("sendMessage"), json=payload)
-                return resp.json()
+        resp = _http().post(_api_url("sendMessage"), json=payload, timeout=30)
+        return resp.json()
     except Exception as e:
         logger.error(f"Telegram send failed: {e}")
         return {"ok": False, "error": str(e)}
@@ -213,13 +244,8 @@ def get_updates(offset: int = 0, timeout: int = 30) -> list:
     params = {"offset": offset, "timeout": timeout, "allowed_updates": '["message","callback_query"]'}
     
     try:
-        if hasattr(httpx, 'get'):
-            resp = httpx.get(_api_url("getUpdates"), params=params, timeout=timeout + 10)
-            data = resp.json()
-        else:
-            with httpx.Client(timeout=timeout + 10) as client:
-                resp = client.get(_api_url("getUpdates"), params=params)
-                data = resp.json()
+        resp = _http().get(_api_url("getUpdates"), params=params, timeout=timeout + 10)
+        data = resp.json()
         
         if data.get("ok"):
             return data.get("result", [])
@@ -235,13 +261,8 @@ def get_me() -> dict:
         return {"ok": False, "error": "No HTTP client"}
     
     try:
-        if hasattr(httpx, 'get'):
-            resp = httpx.get(_api_url("getMe"), timeout=10)
-            return resp.json()
-        else:
-            with httpx.Client(timeout=10) as client:
-                resp = client.get(_api_url("getMe"))
-                return resp.json()
+        resp = _http().get(_api_url("getMe"), timeout=10)
+        return resp.json()
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
@@ -503,13 +524,8 @@ def setup_webhook(url: str, secret_token: str = None) -> dict:
         payload["secret_token"] = secret_token
     
     try:
-        if hasattr(httpx, 'post'):
-            resp = httpx.post(_api_url("setWebhook"), json=payload, timeout=30)
-            return resp.json()
-        else:
-            with httpx.Client(timeout=30) as client:
-                resp = client.post(_api_url("setWebhook"), json=payload)
-                return resp.json()
+        resp = _http().post(_api_url("setWebhook"), json=payload, timeout=30)
+        return resp.json()
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
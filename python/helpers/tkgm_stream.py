@@ -0,0 +1,41 @@
+"""
+TKGM Stream — incremental reads of TKGM knowledge files
+
+tkgm_triples.json (a list of triples) and tkgm_temporal.json (a dict of
+fragment id -> metadata) grow with the knowledge base. Dashboards only count
+or filter them, so with ijson installed these helpers parse one item at a
+time instead of materializing the whole file, and callers can stop early.
+Without ijson they fall back to a full decode.
+"""
+
+from typing import Iterator
+
+from python.helpers import fastjson
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def iter_triples(path: str) -> Iterator[dict]:
+    """Yield the triples in a tkgm_triples.json file one at a time."""
+    if ijson is None:
+        yield from fastjson.load_file(path)
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
+
+
+def count_triples(path: str) -> int:
+    """Number of triples in a tkgm_triples.json file."""
+    return sum(1 for _ in iter_triples(path))
+
+
+def iter_temporal(path: str) -> Iterator[tuple[str, dict]]:
+    """Yield (fragment id, metadata) pairs from a tkgm_temporal.json file."""
+    if ijson is None:
+        yield from fastjson.load_file(path).items()
+        return
+    with open(path, "rb") as f:
+        yield from ijson.kvitems(f, "", use_float=True)
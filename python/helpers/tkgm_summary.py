@@ -0,0 +1,126 @@
+"""
+TKGM Summary — persisted knowledge-base statistics for dashboards
+
+The knowledge dashboard's stats and domains panels aggregate every
+tkgm_triples.json / tkgm_temporal.json file under memory/. The aggregate is
+written to memory/_tkgm_summary.json together with the mtime of every
+source file it was built from, and get_summary() only rebuilds when one of
+those files was added, removed or modified.
+"""
+
+import glob
+import os
+import threading
+import time
+
+from python.helpers import fastjson, fs_watch, tkgm_stream
+from python.helpers.json_cache import load_json_cached
+
+MEMORY_DIR = "memory"
+SUMMARY_PATH = "memory/_tkgm_summary.json"
+TRIPLES_FILE = "tkgm_triples.json"
+TEMPORAL_FILE = "tkgm_temporal.json"
+
+_lock = threading.Lock()
+_TKGM_PATHS_CACHE = {"t": float("-inf"), "generation": None, "triples": [], "temporal": []}
+_summary_memo: tuple[int, dict] | None = None  # (fs_watch generation of MEMORY_DIR, summary)
+
+
+def tkgm_paths(ttl: float = 5.0) -> dict[str, list[str]]:
+    """
+    Paths of every TKGM triples and temporal file under memory/, re-globbed
+    at most every `ttl` seconds, and right away once fs_watch reports a change
+    under memory/ (so a generation-keyed memo never pairs a new generation
+    with an old glob). Returns {"triples": [...], "temporal": [...]}.
+    """
+    now = time.monotonic()
+    generation = fs_watch.generation(MEMORY_DIR)
+    if now - _TKGM_PATHS_CACHE["t"] >= ttl or generation != _TKGM_PATHS_CACHE["generation"]:
+        triples, temporal = [], []
+        for path in glob.iglob(os.path.join(MEMORY_DIR, "**", "tkgm_*.json"), recursive=True):
+            name = os.path.basename(path)
+            if name == TRIPLES_FILE:
+                triples.append(path)
+            elif name == TEMPORAL_FILE:
+                temporal.append(path)
+        _TKGM_PATHS_CACHE.update(t=now, generation=generation, triples=triples, temporal=temporal)
+    return _TKGM_PATHS_CACHE
+
+
+def _source_mtimes() -> dict[str, int]:
+    paths = tkgm_paths()
+    mtimes = {}
+    for path in paths["triples"] + paths["temporal"]:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            pass
+    return mtimes
+
+
+def build_summary(mtimes: dict[str, int]) -> dict:
+    """Aggregate the given TKGM files (unreadable files are skipped)."""
+    summary = {
+        "total_triples": 0,
+        "total_fragments": 0,
+        "domains": {},
+        "temporal_coverage": {"earliest": None, "latest": None},
+        "built_from_mtimes": mtimes,
+    }
+    domains = summary["domains"]
+    coverage = summary["temporal_coverage"]
+
+    for path in mtimes:
+        try:
+            if os.path.basename(path) == TRIPLES_FILE:
+                summary["total_triples"] += tkgm_stream.count_triples(path)
+                continue
+            for key, meta in tkgm_stream.iter_temporal(path):
+                summary["total_fragments"] += 1
+                domain = meta.get("domain", "unknown")
+                if domain not in domains:
+                    domains[domain] = {"count": 0, "latest": ""}
+                domains[domain]["count"] += 1
+                created = meta.get("created_at", "")
+                if created:
+                    if created > domains[domain]["latest"]:
+                        domains[domain]["latest"] = created
+                    if not coverage["earliest"] or created < coverage["earliest"]:
+                        coverage["earliest"] = created
+                    if not coverage["latest"] or created > coverage["latest"]:
+                        coverage["latest"] = created
+        except Exception:
+            pass
+
+    return summary
+
+
+def get_summary() -> dict:
+    """
+    Return the TKGM summary, rebuilding it first if any source file changed.
+    While memory/ is watched by fs_watch and nothing under it changed, the
+    last summary is returned without globbing or stat-ing anything.
+    """
+    global _summary_memo
+    generation = fs_watch.generation(MEMORY_DIR)
+    memo = _summary_memo
+    if generation is not None and memo is not None and memo[0] == generation:
+        return memo[1]
+
+    mtimes = _source_mtimes()
+    try:
+        summary = load_json_cached(SUMMARY_PATH)
+        if summary.get("built_from_mtimes") == mtimes:
+            _summary_memo = (generation, summary) if generation is not None else None
+            return summary
+    except (OSError, ValueError):
+        pass
+
+    with _lock:
+        summary = build_summary(mtimes)
+        os.makedirs(os.path.dirname(SUMMARY_PATH), exist_ok=True)
+        tmp_path = f"{SUMMARY_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fastjson.dump_file(tmp_path, summary)
+        os.replace(tmp_path, SUMMARY_PATH)
+    _summary_memo = (generation, summary) if generation is not None else None
+    return summary
@@ -0,0 +1,124 @@
+"""
+Triples Index — trigram index over TKGM triple subjects
+
+The knowledge dashboard looks up triples whose subject contains a query
+substring. Instead of lower-casing and testing every triple in every file,
+memory/_triples_trgm.json maps each 3-gram of the distinct lower-cased
+subjects to the subjects containing it, and each subject to the (file,
+offset) positions of its triples. A query intersects the posting lists of
+its trigrams, verifies the few candidate subjects, and then reads only the
+matching triples. The index is rebuilt when a triples file changes.
+"""
+
+import os
+import threading
+
+from python.helpers import fastjson, fs_watch, tkgm_stream, tkgm_summary
+from python.helpers.json_cache import load_json_cached
+
+INDEX_PATH = "memory/_triples_trgm.json"
+
+_lock = threading.Lock()
+_index_memo: tuple[int, dict] | None = None  # (fs_watch generation of memory/, index)
+
+
+def _trigrams(s: str) -> set[str]:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+def build_index(mtimes: dict[str, int]) -> dict:
+    """Index the subjects of every triple in the given files."""
+    files = list(mtimes)
+    subject_ids: dict[str, int] = {}
+    positions: list[list[list[int]]] = []
+    grams: dict[str, list[int]] = {}
+
+    for file_idx, path in enumerate(files):
+        try:
+            for offset, triple in enumerate(tkgm_stream.iter_triples(path)):
+                subject = triple.get("subject", "").lower()
+                sid = subject_ids.get(subject)
+                if sid is None:
+                    sid = subject_ids[subject] = len(positions)
+                    positions.append([])
+                    for gram in _trigrams(subject):
+                        grams.setdefault(gram, []).append(sid)
+                positions[sid].append([file_idx, offset])
+        except Exception:
+            pass
+
+    return {
+        "files": files,
+        "subjects": list(subject_ids),
+        "positions": positions,
+        "trigrams": grams,
+        "built_from_mtimes": mtimes,
+    }
+
+
+def load_index() -> dict:
+    """Return the index, rebuilding it first if any triples file changed."""
+    global _index_memo
+    generation = fs_watch.generation(tkgm_summary.MEMORY_DIR)
+    memo = _index_memo
+    if generation is not None and memo is not None and memo[0] == generation:
+        return memo[1]
+
+    mtimes = {}
+    for path in tkgm_summary.tkgm_paths()["triples"]:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            pass
+    try:
+        index = load_json_cached(INDEX_PATH)
+        if index.get("built_from_mtimes") == mtimes:
+            _index_memo = (generation, index) if generation is not None else None
+            return index
+    except (OSError, ValueError):
+        pass
+
+    with _lock:
+        index = build_index(mtimes)
+        os.makedirs(os.path.dirname(INDEX_PATH), exist_ok=True)
+        tmp_path = f"{INDEX_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fastjson.dump_file(tmp_path, index)
+        os.replace(tmp_path, INDEX_PATH)
+    _index_memo = (generation, index) if generation is not None else None
+    return index
+
+
+def find_triples(subject: str, limit: int = 50) -> list[dict]:
+    """Triples whose subject contains `subject` (case-insensitive), in file order."""
+    index = load_index()
+    needle = subject.lower()
+    subjects = index["subjects"]
+
+    grams = _trigrams(needle)
+    if grams:
+        postings = sorted((index["trigrams"].get(g, []) for g in grams), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+    else:
+        candidates = range(len(subjects))  # too short for trigrams; check every distinct subject
+
+    wanted: dict[int, set[int]] = {}
+    for sid in candidates:
+        if needle in subjects[sid]:
+            for file_idx, offset in index["positions"][sid]:
+                wanted.setdefault(file_idx, set()).add(offset)
+
+    results = []
+    for file_idx in sorted(wanted):
+        offsets = wanted[file_idx]
+        last = max(offsets)
+        try:
+            for offset, triple in enumerate(tkgm_stream.iter_triples(index["files"][file_idx])):
+                if offset in offsets:
+                    results.append(triple)
+                    if len(results) == limit:
+                        return results
+                if offset == last:
+                    break
+        except Exception:
+            pass
+    return results
@@ -12,12 +12,17 @@ Handles:
 Uses Twilio REST API with API Key authentication (SK SID + Secret).
 """
 
+import logging
 import os
-import json
+import threading
 from datetime import datetime, timezone
 from dataclasses import dataclass, field, asdict
 from typing import Optional
 
+from python.helpers import fastjson
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CallRecord:
@@ -38,25 +43,79 @@ class CallRecord:
 
 
 CALL_LOG_DIR = "tmp/voice"
-CALL_LOG_FILE = os.path.join(CALL_LOG_DIR, "call_log.json")
+# Append-only, one JSON record per line, oldest first. Logging a call appends
+# a line, and reads of recent calls only touch the end of the file.
+CALL_LOG_FILE = os.path.join(CALL_LOG_DIR, "call_log.jsonl")
+LEGACY_CALL_LOG_FILE = os.path.join(CALL_LOG_DIR, "call_log.json")
+TAIL_BLOCK_SIZE = 64 * 1024
 
-
-def _load_call_log() -> list:
-    if os.path.exists(CALL_LOG_FILE):
-        try:
-            with open(CALL_LOG_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return []
+_log_lock = threading.Lock()
+_migrated = False
+_count_memo = (0, 0)  # (bytes of the log counted, records in those bytes)
 
 
-def _save_call_log(log: list):
-    os.makedirs(CALL_LOG_DIR, exist_ok=True)
+def _migrate_legacy_log():
+    """
+    Fold a call_log.json array written by older versions into the JSONL log,
+    once. The legacy file is only removed after its records were written; an
+    unparseable one is kept aside as call_log.json.corrupt, and a migration
+    that fails part-way is retried on the next call.
+    """
+    global _migrated
+    if _migrated:
+        return
+    if not os.path.exists(LEGACY_CALL_LOG_FILE):
+        _migrated = True
+        return
+    with open(LEGACY_CALL_LOG_FILE, "rb") as f:
+        raw = f.read()
+    try:
+        legacy = fastjson.loads(raw)
+    except ValueError:
+        legacy = None
+    if not isinstance(legacy, list):
+        corrupt = LEGACY_CALL_LOG_FILE + ".corrupt"
+        os.replace(LEGACY_CALL_LOG_FILE, corrupt)
+        logger.warning(f"Legacy call log is not a JSON array; moved it to {corrupt}")
+        _migrated = True
+        return
+    legacy = [c for c in legacy if isinstance(c, dict)]
+    legacy.sort(key=lambda c: c.get("created_at", ""))
+    lines = b"".join(fastjson.dumps(c) + b"\n" for c in legacy)
+    if os.path.exists(CALL_LOG_FILE):
+        with open(CALL_LOG_FILE, "rb") as f:
+            lines += f.read()
     tmp = CALL_LOG_FILE + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(log, f, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(lines)
     os.replace(tmp, CALL_LOG_FILE)
+    os.remove(LEGACY_CALL_LOG_FILE)
+    _migrated = True
+
+
+def _append_call(record: CallRecord):
+    with _log_lock:
+        _migrate_legacy_log()
+        os.makedirs(CALL_LOG_DIR, exist_ok=True)
+        with open(CALL_LOG_FILE, "ab") as f:
+            f.write(fastjson.dumps(record.to_dict()) + b"\n")
+
+
+def _tail_lines(path: str, n: int) -> list[bytes]:
+    """The last n lines of a file, oldest first, reading backwards in blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        # n lines need n + 1 newlines before them (the file ends with one)
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.splitlines()
+    if pos > 0:
+        lines = lines[1:]  # partial first line
+    return lines[-n:] if n else []
 
 
 def get_twilio_client():
@@ -169,9 +228,7 @@ def make_outbound_call(to_number: str, message: str, voice: str = "Polly.Joanna"
         )
 
         # Log the call
-        log = _load_call_log()
-        log.append(record.to_dict())
-        _save_call_log(log)
+        _append_call(record)
 
         return record
 
@@ -185,9 +242,7 @@ def make_outbound_call(to_number: str, message: str, voice: str = "Polly.Joanna"
             status=f"failed: {str(e)}",
             agent_response=message[:500],
         )
-        log = _load_call_log()
-        log.append(record.to_dict())
-        _save_call_log(log)
+        _append_call(record)
         return record
 
 
@@ -207,9 +262,7 @@ def handle_inbound_call(raw_webhook: dict) -> str:
         to_number=raw_webhook.get("To", ""),
         status="in-progress",
     )
-    log = _load_call_log()
-    log.append(record.to_dict())
-    _save_call_log(log)
+    _append_call(record)
 
     # Return welcome TwiML with speech gathering
     return (
@@ -230,11 +283,50 @@ def handle_inbound_call(raw_webhook: dict) -> str:
     )
 
 
-def get_call_log(limit: int = 20) -> list:
-    """Get recent call log."""
-    log = _load_call_log()
-    log.sort(key=lambda c: c.get("created_at", ""), reverse=True)
-    return log[:limit]
+def get_call_log(limit: Optional[int] = 20, offset: int = 0) -> list:
+    """
+    Recent calls, newest first: `limit` records after skipping the `offset`
+    newest ones (limit=None returns all). Only the end of the log is read.
+    """
+    with _log_lock:
+        _migrate_legacy_log()
+    if not os.path.exists(CALL_LOG_FILE):
+        return []
+    if limit is None:
+        with open(CALL_LOG_FILE, "rb") as f:
+            lines = f.read().splitlines()
+    else:
+        lines = _tail_lines(CALL_LOG_FILE, offset + limit)
+    lines.reverse()
+    calls = []
+    for line in lines[offset:]:
+        try:
+            calls.append(fastjson.loads(line))
+        except ValueError:
+            pass  # torn write from a crash mid-append
+    return calls
+
+
+def get_call_count() -> int:
+    """Number of logged calls. Only bytes appended since the last count are scanned."""
+    global _count_memo
+    with _log_lock:
+        _migrate_legacy_log()
+        try:
+            size = os.path.getsize(CALL_LOG_FILE)
+        except OSError:
+            return 0
+        counted, count = _count_memo
+        if size < counted:  # log was replaced; start over
+            counted, count = 0, 0
+        if size > counted:
+            with open(CALL_LOG_FILE, "rb") as f:
+                f.seek(counted)
+                while block := f.read(TAIL_BLOCK_SIZE):
+                    count += block.count(b"\n")
+            counted = size
+        _count_memo = (counted, count)
+        return count
 
 
 # ─── Voice Persona Configuration ─────────────────────────────
@@ -15,10 +15,16 @@ All commands are registered declaratively in COMMAND_REGISTRY.
 
 import re
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List, Callable
 from enum import Enum
 
+try:
+    import ahocorasick  # pyahocorasick: multi-pattern literal matcher
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -409,12 +415,49 @@ class VoiceCommandRouter:
         self._build_index()
 
     def _build_index(self):
-        """Pre-compute normalized triggers for fast matching."""
+        """
+        Pre-compute normalized triggers and their word sets, plus two indexes
+        that find the only triggers able to score above zero for an
+        utterance: those sharing a word with it, and those it contains.
+        With pyahocorasick installed the containment check is a single scan
+        of the utterance against an automaton of every trigger.
+        """
         self._trigger_map: List[tuple] = []
         for cmd in self.registry:
             for trigger in cmd.triggers:
                 normalized = trigger.lower().strip()
-                self._trigger_map.append((normalized, cmd))
+                self._trigger_map.append((normalized, frozenset(normalized.split()), cmd))
+
+        self._word_index: Dict[str, List[int]] = {}
+        by_text: Dict[str, List[int]] = {}
+        for i, (trigger, trigger_words, _) in enumerate(self._trigger_map):
+            for word in trigger_words:
+                self._word_index.setdefault(word, []).append(i)
+            by_text.setdefault(trigger, []).append(i)
+
+        # An empty trigger is contained in every utterance
+        self._always: List[int] = by_text.pop("", [])
+        self._automaton = None
+        if ahocorasick is not None and by_text:
+            self._automaton = ahocorasick.Automaton()
+            for text, ids in by_text.items():
+                self._automaton.add_word(text, ids)
+            self._automaton.make_automaton()
+
+    def _candidates(self, utterance_lower: str, utterance_words: set) -> List[int]:
+        """Indexes into _trigger_map of triggers that can score > 0, in registry order."""
+        found = set(self._always)
+        for word in utterance_words:
+            found.update(self._word_index.get(word, ()))
+        if self._automaton is not None:
+            for _, ids in self._automaton.iter(utterance_lower):
+                found.update(ids)
+        else:
+            found.update(
+                i for i, (trigger, _, _) in enumerate(self._trigger_map)
+                if trigger in utterance_lower
+            )
+        return sorted(found)
 
     def match(self, utterance: str) -> Optional[CommandMatch]:
         """
@@ -433,8 +476,10 @@ class VoiceCommandRouter:
 
         best_match: Optional[CommandMatch] = None
         best_score = 0.0
+        utterance_words = set(utterance_lower.split())
 
-        for trigger, cmd in self._trigger_map:
+        for i in self._candidates(utterance_lower, utterance_words):
+            trigger, trigger_words, cmd = self._trigger_map[i]
             score = 0.0
 
             # Exact match
@@ -447,8 +492,6 @@ class VoiceCommandRouter:
                 score = 0.6 + (coverage * 0.4)  # 0.6-1.0
             # Word overlap
             else:
-                trigger_words = set(trigger.split())
-                utterance_words = set(utterance_lower.split())
                 overlap = trigger_words & utterance_words
                 if overlap and len(trigger_words) > 0:
                     score = (len(overlap) / len(trigger_words)) * 0.6
@@ -527,11 +570,14 @@ class VoiceCommandRouter:
 
 # Module-level singleton
 _router: Optional[VoiceCommandRouter] = None
+_router_lock = threading.Lock()
 
 
 def get_router() -> VoiceCommandRouter:
-    """Get or create the module-level router singleton."""
+    """Get or create the module-level router singleton (built once per process)."""
     global _router
     if _router is None:
-        _router = VoiceCommandRouter()
+        with _router_lock:
+            if _router is None:
+                _router = VoiceCommandRouter()
     return _router
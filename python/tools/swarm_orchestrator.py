@@ -28,6 +28,7 @@ from typing import Optional
 from python.helpers.tool import Tool, Response
 from python.helpers.print_style import PrintStyle
 from python.helpers.tkgm_memory import ByteRoverAtomic
+from python.helpers.swarm_index import maybe_rebuild as rebuild_swarm_index
 from agent import Agent, UserMessage
 from initialize import initialize_agent
 
@@ -62,6 +63,7 @@ def _persist_swarm(swarm: "Swarm"):
         os.path.join(SWARM_DIR, f"{swarm.swarm_id}.json"),
         swarm.to_dict(include_results=True),
     )
+    rebuild_swarm_index()
 
 
 # ─── SwarmTask ───────────────────────────────────────────────
@@ -21,10 +21,10 @@ class VoiceCommand(Tool):
     """Routes voice/text commands to the correct Agent Zero tool."""
 
     async def execute(self, **kwargs):
-        from python.helpers.voice_command_router import VoiceCommandRouter, CommandCategory
+        from python.helpers.voice_command_router import get_router, CommandCategory
 
         method = self.args.get("method", "route")
-        router = VoiceCommandRouter()
+        router = get_router()
 
         # ── route: match an utterance ────────────────────────────
         if method == "route":
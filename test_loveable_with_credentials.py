@@ -221,7 +221,10 @@ async def main():
     print("\n" + "=" * 80)
     print("FINAL RESULTS")
     print("=" * 80)
+    # Markers let deploy_loveable_test.py slice the JSON out of stdout
+    print("---RESULTS---")
     print(json.dumps(results, indent=2))
+    print("---END---")
 
     # Save to file
     output_file = "/results/loveable_login_results.json"
@@ -0,0 +1,137 @@
+"""
+Test Suite — A2A Client Batching
+
+Tests for:
+  - Buffered messages sent as one JSON-RPC batch
+  - Flushing on max_batch and on disable_batching
+  - FAILED status on HTTP errors and send exceptions
+  - In-flight batches finishing when batching is disabled
+"""
+
+import asyncio
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+_A2A_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "agents", "paulis-place", "a2a", "__init__.py",
+)
+_spec = importlib.util.spec_from_file_location("paulis_place_a2a", _A2A_PATH)
+a2a = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(a2a)
+
+ENDPOINT = "https://peer.example.com/a2a"
+
+
+class _Response:
+    def __init__(self, session, status):
+        self.session = session
+        self.status = status
+
+    async def __aenter__(self):
+        if self.session.delay:
+            await asyncio.sleep(self.session.delay)
+        if self.session.error:
+            raise self.session.error
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, status=200, error=None, delay=0.0):
+        self.status = status
+        self.error = error
+        self.delay = delay
+        self.batches = []
+
+    def post(self, endpoint, json=None, headers=None):
+        self.batches.append(json)
+        return _Response(self, self.status)
+
+
+def _client(session) -> "a2a.A2AClient":
+    client = a2a.A2AClient(a2a.get_bambu_agent_card())
+    peer = a2a.get_alex_agent_card()
+    peer.endpoints["a2a"] = ENDPOINT
+    client.discovered_agents[peer.agent_id] = peer
+    client.session = session
+    return client
+
+
+async def _send(client, count):
+    return [await client.send_message("alex-metagpt", f"msg {i}") for i in range(count)]
+
+
+class TestBatching:
+
+    def test_disable_flushes_pending(self):
+        session = FakeSession()
+
+        async def run():
+            client = _client(session)
+            await client.enable_batching(ENDPOINT, interval_ms=10_000)
+            messages = await _send(client, 3)
+            assert all(m.status == a2a.MessageStatus.PENDING for m in messages)
+            await client.disable_batching()
+            return messages
+
+        messages = asyncio.run(run())
+        assert len(session.batches) == 1
+        assert [p["params"]["content"] for p in session.batches[0]] == ["msg 0", "msg 1", "msg 2"]
+        assert all(m.status == a2a.MessageStatus.DELIVERED for m in messages)
+
+    def test_max_batch_flushes_immediately(self):
+        session = FakeSession()
+
+        async def run():
+            client = _client(session)
+            await client.enable_batching(ENDPOINT, interval_ms=10_000, max_batch=2)
+            messages = await _send(client, 2)
+            sent = list(session.batches)
+            await client.disable_batching()
+            return messages, sent
+
+        messages, sent = asyncio.run(run())
+        assert len(sent) == 1 and len(sent[0]) == 2
+        assert all(m.status == a2a.MessageStatus.DELIVERED for m in messages)
+
+    def test_http_error_marks_failed(self):
+        async def run():
+            client = _client(FakeSession(status=500))
+            await client.enable_batching(ENDPOINT, interval_ms=10_000)
+            messages = await _send(client, 2)
+            await client.disable_batching()
+            return messages
+
+        assert all(m.status == a2a.MessageStatus.FAILED for m in asyncio.run(run()))
+
+    def test_exception_marks_failed(self):
+        async def run():
+            client = _client(FakeSession(error=OSError("connection refused")))
+            await client.enable_batching(ENDPOINT, interval_ms=10_000)
+            messages = await _send(client, 2)
+            await client.disable_batching()
+            return messages
+
+        assert all(m.status == a2a.MessageStatus.FAILED for m in asyncio.run(run()))
+
+    def test_disable_waits_for_in_flight_batch(self):
+        session = FakeSession(delay=0.05)
+
+        async def run():
+            client = _client(session)
+            await client.enable_batching(ENDPOINT, interval_ms=1)
+            messages = await _send(client, 3)
+            while not session.batches:  # let the loop dequeue and start posting
+                await asyncio.sleep(0.001)
+            await client.disable_batching()
+            return messages
+
+        messages = asyncio.run(run())
+        assert all(m.status == a2a.MessageStatus.DELIVERED for m in messages)
@@ -158,6 +158,39 @@ class TestVoiceCommandRouter(unittest.TestCase):
         self.assertIsNone(self.router.match(""))
         self.assertIsNone(self.router.match("   "))
 
+    def test_candidate_index_matches_full_scan(self):
+        """Matching via the trigger indexes should agree with scoring every trigger."""
+        from python.helpers import voice_command_router
+        from python.helpers.voice_command_router import VoiceCommandRouter
+        with patch.object(voice_command_router, "ahocorasick", None):
+            plain = VoiceCommandRouter()
+        phrases = [t for cmd in self.router.registry for t in cmd.triggers[:2]]
+        phrases += ["please resend messages", "display the weather", "status", "xyz"]
+        for phrase in phrases:
+            for router in (self.router, plain):
+                result = router.match(phrase)
+                self.assertEqual(
+                    (result.command.id, result.confidence) if result else None,
+                    self._match_by_full_scan(router, phrase),
+                    phrase,
+                )
+
+    @staticmethod
+    def _match_by_full_scan(router, phrase):
+        utterance = phrase.lower().strip()
+        words = set(utterance.split())
+        best, best_score = None, 0.0
+        for trigger, trigger_words, cmd in router._trigger_map:
+            if utterance == trigger:
+                score = 1.0
+            elif trigger in utterance:
+                score = 0.6 + len(trigger) / len(utterance) * 0.4
+            else:
+                score = len(trigger_words & words) / len(trigger_words) * 0.6 if trigger_words else 0.0
+            if score > best_score:
+                best, best_score = cmd, score
+        return (best.id, best_score) if best and best_score >= 0.3 else None
+
 
 class TestRateLimiter(unittest.TestCase):
     """Test rate limiting logic."""
@@ -0,0 +1,74 @@
+"""
+Test Suite — Background Jobs
+
+Tests for:
+  - Running sync and coroutine jobs to completion
+  - Recording failures
+  - Expiring finished jobs
+"""
+
+import time
+
+import pytest
+
+from python.helpers import background_jobs
+
+
+def _wait(job_id: str, timeout: float = 5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = background_jobs.status(job_id)
+        if job["state"] in ("completed", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture(autouse=True)
+def clean_jobs():
+    background_jobs._jobs.clear()
+    background_jobs._finished.clear()
+    yield
+    background_jobs._jobs.clear()
+    background_jobs._finished.clear()
+
+
+class TestBackgroundJobs:
+
+    def test_sync_job(self):
+        job_id = background_jobs.submit("exports", "add", lambda a, b: a + b, 2, 3)
+        job = _wait(job_id)
+        assert job["state"] == "completed"
+        assert job["result"] == 5
+        assert job["kind"] == "add"
+
+    def test_coroutine_job(self):
+        async def work(x):
+            return {"x": x}
+
+        job = _wait(background_jobs.submit("ingest", "work", work, 7))
+        assert job["result"] == {"x": 7}
+
+    def test_failed_job(self):
+        def boom():
+            raise ValueError("nope")
+
+        job = _wait(background_jobs.submit("exports", "boom", boom))
+        assert job["state"] == "failed"
+        assert job["error"] == "nope"
+
+    def test_unknown_job(self):
+        assert background_jobs.status("job_missing") is None
+
+    def test_queued_response(self):
+        body, status = background_jobs.queued_response("job_x")
+        assert status == 202
+        assert body == {"ok": True, "job_id": "job_x", "status": "queued"}
+
+    def test_finished_jobs_expire(self, monkeypatch):
+        job_id = background_jobs.submit("exports", "noop", lambda: None)
+        _wait(job_id)
+        monkeypatch.setattr(background_jobs, "JOB_TTL", 0.0)
+        time.sleep(0.01)
+        background_jobs.submit("exports", "noop", lambda: None)
+        assert background_jobs.status(job_id) is None
@@ -0,0 +1,68 @@
+"""
+Test Suite — Cost Store
+
+Tests for:
+  - Reading and totalling JSON day files
+  - Compacting closed days to Parquet
+  - Reading compacted days by either path
+"""
+
+import json
+
+import pytest
+
+from python.helpers import cost_store
+
+
+ENTRIES = [
+    {"timestamp": "2026-01-01T01:00:00", "model": "a", "agent_id": "x",
+     "input_tokens": 10, "output_tokens": 5, "cost_usd": 0.25},
+    {"timestamp": "2026-01-01T02:00:00", "model": "b", "agent_id": "y", "estimated_cost": 0.5},
+]
+
+
+@pytest.fixture
+def day(tmp_path):
+    path = tmp_path / "costs_2026-01-01.json"
+    path.write_text(json.dumps(ENTRIES))
+    return path
+
+
+class TestJsonDays:
+
+    def test_read_entries(self, day):
+        assert cost_store.read_entries(str(day)) == ENTRIES
+
+    def test_missing_day(self, tmp_path):
+        assert cost_store.read_entries(str(tmp_path / "costs_2026-01-02.json")) == []
+        assert cost_store.day_total(str(tmp_path / "costs_2026-01-02.json")) == (0, 0)
+
+
+class TestCompaction:
+
+    @pytest.fixture(autouse=True)
+    def _needs_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_compact_replaces_json(self, day):
+        assert cost_store.compact(str(day))
+        assert not day.exists()
+        assert day.with_suffix(".parquet").exists()
+
+    def test_compacted_day_reads_by_either_path(self, day):
+        cost_store.compact(str(day))
+        for path in (day, day.with_suffix(".parquet")):
+            entries = cost_store.read_entries(str(path), columns=["model", "cost_usd"])
+            assert entries == [{"model": "a", "cost_usd": 0.25}, {"model": "b", "cost_usd": 0.5}]
+
+    def test_day_total_from_parquet(self, day):
+        cost_store.compact(str(day))
+        assert cost_store.day_total(str(day)) == (0.75, 2)
+
+    def test_compact_before_skips_current_day(self, tmp_path, day):
+        today = tmp_path / "costs_2026-01-02.json"
+        today.write_text("[]")
+        (tmp_path / "budget_config.json").write_text("{}")
+        assert cost_store.compact_before(str(tmp_path), "2026-01-02") == 1
+        assert today.exists()
+        assert not day.exists()
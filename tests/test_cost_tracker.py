@@ -8,6 +8,9 @@ Tests for:
   - Daily/monthly spend calculation
   - Model recommendation on budget exceed
   - Thread-safe recording
+  - Query memoization and per-agent spend map
+  - Budget checks invalidated by recording and cap changes
+  - Results computed across an invalidation not memoized; copies returned
 """
 
 import os
@@ -96,6 +99,56 @@ class TestCostTracker:
         breakdown = tracker.get_model_breakdown()
         assert isinstance(breakdown, dict)
 
+    def test_queries_refresh_after_record(self):
+        from python.helpers.cost_tracker import CostTracker
+        tracker = CostTracker.get()
+        before = tracker.get_daily_spend()
+        tracker.record_call("test-model", "agent1", cost_usd=0.5)
+        assert tracker.get_daily_spend() == pytest.approx(before + 0.5)
+
+    def test_all_agent_spend_map(self):
+        from python.helpers.cost_tracker import CostTracker
+        tracker = CostTracker.get()
+        tracker.set_agent_cap("agent1", 0.0)
+        spend_map = tracker.get_all_agent_spend_map(("agent1", "idle_agent"))
+        assert spend_map["agent1"][1] is True
+        assert spend_map["idle_agent"] == (0.0, False)
+
+    def test_budget_checks_invalidated_by_writes(self):
+        from python.helpers.cost_tracker import CostTracker
+        tracker = CostTracker.get()
+        assert not tracker.is_agent_budget_exceeded("agent1")
+        tracker.set_agent_cap("agent1", 0.25)
+        tracker.record_call("test-model", "agent1", cost_usd=0.5)
+        assert tracker.is_agent_budget_exceeded("agent1")
+        assert not tracker.is_agent_budget_exceeded("idle_agent")
+        tracker.set_monthly_cap(0.0)
+        assert tracker.is_budget_exceeded()
+
+    def test_result_computed_across_invalidation_not_kept(self):
+        from python.helpers.cost_tracker import CostTracker
+        tracker = CostTracker.get()
+        calls = []
+        real_day_total = tracker._day_total
+
+        def day_total(date_str):
+            if not calls:
+                tracker.invalidate()  # a write lands while the query runs
+            calls.append(date_str)
+            return real_day_total(date_str)
+
+        tracker._day_total = day_total
+        tracker.get_monthly_spend()
+        first = len(calls)
+        tracker.get_monthly_spend()
+        assert len(calls) == 2 * first
+
+    def test_memoized_results_are_copies(self):
+        from python.helpers.cost_tracker import CostTracker
+        tracker = CostTracker.get()
+        tracker.get_daily_breakdown(days=2).clear()
+        assert len(tracker.get_daily_breakdown(days=2)) == 2
+
 
 class TestCostEstimation:
     """Test cost estimation accuracy."""
@@ -0,0 +1,143 @@
+"""
+Test Suite — Dashboard DB
+
+Tests for:
+  - Mirroring swarm task completions
+  - Cost history totals and high-cost queries
+  - Routing decisions from the task queue
+  - Re-syncing changed and removed source files
+  - Audit window for swarm files
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from python.helpers import cost_store, dashboard_db
+from python.helpers.json_cache import clear_cache
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    clear_cache()
+    (tmp_path / "swarms").mkdir()
+    (tmp_path / "cost").mkdir()
+    monkeypatch.setattr(dashboard_db, "DB_PATH", str(tmp_path / "dashboard.sqlite"))
+    monkeypatch.setattr(dashboard_db, "SWARM_DIR", str(tmp_path / "swarms"))
+    monkeypatch.setattr(dashboard_db, "COST_DIR", str(tmp_path / "cost"))
+    monkeypatch.setattr(dashboard_db, "TASK_QUEUE_PATH", str(tmp_path / "task_queue.json"))
+    monkeypatch.setattr(dashboard_db, "_local", type(dashboard_db._local)())
+    monkeypatch.setattr(dashboard_db, "SYNC_INTERVAL", 0)
+    monkeypatch.setattr(dashboard_db, "AUDIT_WINDOW_SECONDS", 0)
+    yield tmp_path
+    clear_cache()
+
+
+def _write(path, data, mtime=None):
+    path.write_text(json.dumps(data))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def _swarm(swarm_id, *completed_at):
+    return {
+        "swarm_id": swarm_id,
+        "tasks": [
+            {"agent_profile": "coder", "status": "completed", "description": f"t{i}", "completed_at": ts}
+            for i, ts in enumerate(completed_at)
+        ] + [{"agent_profile": "coder", "status": "running", "description": "pending"}],
+    }
+
+
+class TestSwarmTasks:
+
+    def test_recent_completions_newest_first(self, db):
+        _write(db / "swarms" / "a.json", _swarm("a", "2026-01-01T00:00:00", "2026-01-03T00:00:00"))
+        _write(db / "swarms" / "b.json", _swarm("b", "2026-01-02T00:00:00"))
+        rows = dashboard_db.recent_task_completions(2)
+        assert [(r["swarm_id"], r["completed_at"]) for r in rows] == [
+            ("a", "2026-01-03T00:00:00"), ("b", "2026-01-02T00:00:00"),
+        ]
+
+    def test_changed_and_removed_files_resync(self, db):
+        path = db / "swarms" / "a.json"
+        _write(path, _swarm("a", "2026-01-01T00:00:00"), mtime=1000)
+        assert len(dashboard_db.recent_task_completions(10)) == 1
+        _write(path, _swarm("a", "2026-01-01T00:00:00", "2026-01-02T00:00:00"), mtime=2000)
+        assert len(dashboard_db.recent_task_completions(10)) == 2
+        path.unlink()
+        assert dashboard_db.recent_task_completions(10) == []
+
+    def test_window_skips_cold_files(self, db, monkeypatch):
+        monkeypatch.setattr(dashboard_db, "AUDIT_WINDOW_SECONDS", 3600)
+        now = time.time()
+        _write(db / "swarms" / "cold.json", _swarm("cold", "2026-01-01T00:00:00"), mtime=now - 7200)
+        _write(db / "swarms" / "hot.json", _swarm("hot", "2026-01-02T00:00:00"), mtime=now)
+        assert [r["swarm_id"] for r in dashboard_db.recent_task_completions(10)] == ["hot"]
+
+    def test_since_filters_completions(self, db):
+        _write(db / "swarms" / "a.json", _swarm("a", "2026-01-01T00:00:00", "2026-01-03T00:00:00"))
+        rows = dashboard_db.recent_task_completions(10, since="2026-01-02")
+        assert [r["completed_at"] for r in rows] == ["2026-01-03T00:00:00"]
+
+
+class TestCostEntries:
+
+    def test_daily_totals_read_cost_usd(self, db):
+        _write(db / "cost" / "costs_2026-01-01.json", [
+            {"timestamp": "2026-01-01T01:00:00", "model": "m", "agent_id": "x", "cost_usd": 0.5},
+            {"timestamp": "2026-01-01T02:00:00", "model": "m", "agent_id": "x", "estimated_cost": 0.25},
+        ])
+        _write(db / "cost" / "costs_2025-12-01.json", [{"cost_usd": 9.0}])
+        (db / "cost" / "budget_config.json").write_text("{}")
+        assert dashboard_db.daily_cost_totals("2026-01-01") == {"2026-01-01": (0.75, 2)}
+
+    def test_compacted_day_counted_once(self, db):
+        pytest.importorskip("pyarrow")
+        path = db / "cost" / "costs_2026-01-01.json"
+        _write(path, [{"timestamp": "2026-01-01T01:00:00", "cost_usd": 0.5}])
+        assert dashboard_db.daily_cost_totals("2026-01-01") == {"2026-01-01": (0.5, 1)}
+        cost_store.compact(str(path))
+        assert dashboard_db.daily_cost_totals("2026-01-01") == {"2026-01-01": (0.5, 1)}
+
+    def test_high_cost_entries(self, db):
+        _write(db / "cost" / "costs_2026-01-01.json", [
+            {"timestamp": "2026-01-01T01:00:00", "model": "cheap", "agent_id": "x", "cost_usd": 0.001},
+            {"timestamp": "2026-01-01T02:00:00", "model": "big", "agent_id": "x", "cost_usd": 0.2},
+        ])
+        rows = dashboard_db.high_cost_entries("2026-01-01", 0.01, 10)
+        assert [r["model"] for r in rows] == ["big"]
+
+
+class TestRoutingDecisions:
+
+    def test_only_routed_tasks(self, db):
+        _write(db / "task_queue.json", [
+            {"id": "1", "status": "routed", "routed_to": "coder", "routed_at": "2026-01-01", "description": "a"},
+            {"id": "2", "status": "pending", "description": "b"},
+            {"id": "3", "status": "routed", "routed_to": "writer", "routed_at": "2026-01-02", "task": "c"},
+        ])
+        rows = dashboard_db.routing_decisions(10)
+        assert [(r["task_id"], r["description"]) for r in rows] == [("3", "c"), ("1", "a")]
+
+    def test_malformed_entries_skipped(self, db):
+        _write(db / "task_queue.json", [
+            "not a task",
+            {"id": "1", "status": "routed", "routed_to": "coder", "routed_at": "2026-01-01", "description": None},
+            {"id": "2", "status": "routed", "routed_to": "coder", "routed_at": "2026-01-02", "description": "b"},
+        ])
+        rows = dashboard_db.routing_decisions(10)
+        assert [(r["task_id"], r["description"]) for r in rows] == [("2", "b"), ("1", "")]
+
+    def test_unreadable_queue_keeps_previous_rows(self, db):
+        queue = db / "task_queue.json"
+        _write(queue, [{"id": "1", "status": "routed", "routed_at": "2026-01-01", "description": "a"}], mtime=1000)
+        assert len(dashboard_db.routing_decisions(10)) == 1
+        _write(queue, 42, mtime=2000)
+        assert [r["task_id"] for r in dashboard_db.routing_decisions(10)] == ["1"]
+        assert dashboard_db.daily_cost_totals("2026-01-01") == {}
+
+    def test_missing_queue(self, db):
+        assert dashboard_db.routing_decisions(10) == []
@@ -0,0 +1,66 @@
+"""
+Test Suite — API Action Dispatch
+
+Tests for:
+  - Routing actions through an action table, with a default action
+  - Unknown actions and request-model validation errors
+  - Handler exceptions, with and without AGENT_DEBUG
+"""
+
+import logging
+
+import pytest
+from pydantic import BaseModel
+
+from python.helpers.errors import dispatch_action
+
+logger = logging.getLogger(__name__)
+
+
+class NameReq(BaseModel):
+    name: str
+
+
+def _fail(req: None) -> dict:
+    raise RuntimeError("boom")
+
+
+ACTIONS = {
+    "hello": (lambda req: {"success": True, "name": req.name}, NameReq),
+    "ping": (lambda req: {"success": True, "req": req}, None),
+    "fail": (_fail, None),
+}
+
+
+def _dispatch(request_data, **kwargs):
+    return dispatch_action(ACTIONS, request_data, logger, "test", **kwargs)
+
+
+class TestDispatchAction:
+
+    def test_routes_validated_request(self):
+        assert _dispatch({"action": "hello", "name": "zero"}) == {"success": True, "name": "zero"}
+        assert _dispatch({"action": "ping"}) == {"success": True, "req": None}
+
+    def test_default_action(self):
+        assert _dispatch({}, default_action="ping") == {"success": True, "req": None}
+
+    def test_unknown_action(self):
+        response = _dispatch({"action": "nope"})
+        assert response["error"] == "Unknown action: nope"
+        assert response["available_actions"] == ["hello", "ping", "fail"]
+
+    def test_validation_error(self):
+        assert _dispatch({"action": "hello"}) == {"error": "name is required"}
+
+    def test_handler_error_is_logged_not_returned(self, monkeypatch, caplog):
+        monkeypatch.delenv("AGENT_DEBUG", raising=False)
+        with caplog.at_level(logging.ERROR, logger=__name__):
+            assert _dispatch({"action": "fail"}) == {"error": "boom"}
+        assert "test API action 'fail' failed" in caplog.text
+
+    def test_handler_error_trace_when_debugging(self, monkeypatch):
+        monkeypatch.setenv("AGENT_DEBUG", "1")
+        response = _dispatch({"action": "fail"})
+        assert response["error"] == "boom"
+        assert "RuntimeError: boom" in response["trace"]
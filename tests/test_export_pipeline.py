@@ -2,7 +2,7 @@
 Test Suite — Export Pipeline
 
 Tests for:
-  - Knowledge export (JSON, CSV, Markdown)
+  - Knowledge export (JSON, CSV, Markdown, zstd-compressed JSON)
   - Cost export
   - Audit export
   - Full backup
@@ -39,6 +39,16 @@ class TestExportPipeline:
         assert job.output_path is not None
         assert job.output_path.endswith(".md")
 
+    def test_knowledge_export_compressed(self):
+        zstandard = pytest.importorskip("zstandard")
+        from python.helpers.export_pipeline import export_knowledge
+        job = export_knowledge("json", compress=True)
+        assert job.status == "completed"
+        assert job.output_path.endswith(".json.zst")
+        with open(job.output_path, "rb") as f:
+            data = json.loads(zstandard.ZstdDecompressor().stream_reader(f).read())
+        assert data["summary"]["total_triples"] == len(data["triples"])
+
     def test_costs_export(self):
         from python.helpers.export_pipeline import export_costs
         job = export_costs(days=7, format="json")
@@ -80,6 +90,27 @@ class TestExportPipeline:
         assert job.job_id == "test_job"
         assert job.error is None
         assert job.record_count == 0
+        assert not hasattr(job, "__dict__")
+
+    def test_export_job_response_dict(self):
+        from python.helpers.export_pipeline import ExportJob
+        job = ExportJob(
+            job_id="test_job",
+            export_type="knowledge",
+            format="json",
+            status="completed",
+            created_at="2025-01-01T00:00:00Z",
+            output_path="tmp/exports/test_job.json",
+            record_count=3,
+        )
+        assert job.to_response_dict() == {
+            "ok": True,
+            "job_id": "test_job",
+            "status": "completed",
+            "output_path": "tmp/exports/test_job.json",
+            "record_count": 3,
+            "error": None,
+        }
 
 
 if __name__ == "__main__":
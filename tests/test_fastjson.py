@@ -0,0 +1,53 @@
+"""
+Test Suite — Fast JSON
+
+Tests for:
+  - Round-tripping through loads/dumps with and without orjson
+  - Non-string dict keys
+  - Streaming dict-of-lists writer
+"""
+
+import json
+
+import pytest
+
+from python.helpers import fastjson
+
+
+DATA = {
+    "exported_at": "2026-01-01T00:00:00+00:00",
+    "days_covered": 1,
+    "events": [{"type": "swarm", "details": "Swarm 'ä' — 2 tasks"}, {"type": "loop_cycle"}],
+    "errors": [],
+    "meta": {"nested": [1, 2]},
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(fastjson, "orjson", None)
+    elif fastjson.orjson is None:
+        pytest.skip("orjson not installed")
+
+
+class TestFastJson:
+
+    def test_round_trip(self, backend):
+        assert fastjson.loads(fastjson.dumps(DATA)) == DATA
+        assert fastjson.loads(fastjson.dumps(DATA, indent=True)) == DATA
+
+    def test_non_str_keys(self, backend):
+        assert fastjson.loads(fastjson.dumps({1: "a", 2.5: "b"})) == {"1": "a", "2.5": "b"}
+
+    def test_streaming_writer(self, backend, tmp_path):
+        path = tmp_path / "export.json"
+        fastjson.dump_file_streaming(str(path), DATA)
+        assert json.loads(path.read_text(encoding="utf-8")) == DATA
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert '    {"type":"loop_cycle"}' in lines
+
+    def test_streaming_writer_empty(self, backend, tmp_path):
+        path = tmp_path / "export.json"
+        fastjson.dump_file_streaming(str(path), {})
+        assert json.loads(path.read_text()) == {}
@@ -0,0 +1,72 @@
+"""
+Test Suite — FS Watch
+
+Tests for:
+  - Tracking writes to files in watched directories
+  - Directory change generations
+  - Cache hits without stat while a watched file is unchanged
+"""
+
+import json
+import time
+
+import pytest
+
+pytest.importorskip("watchdog")
+
+from python.helpers import fs_watch, json_cache
+
+
+@pytest.fixture
+def watched(tmp_path, monkeypatch):
+    fs_watch.stop()
+    json_cache.clear_cache()
+    monkeypatch.setattr(fs_watch, "WATCH_DIRS", (str(tmp_path),))
+    fs_watch.generation(str(tmp_path))  # start watching
+    yield tmp_path
+    fs_watch.stop()
+    json_cache.clear_cache()
+
+
+def _eventually(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestFsWatch:
+
+    def test_write_marks_tracked_file_changed(self, watched):
+        path = watched / "a.json"
+        path.write_text("1")
+        fs_watch.track(str(path))
+        assert fs_watch.is_unchanged(str(path))
+        path.write_text("2")
+        assert _eventually(lambda: not fs_watch.is_unchanged(str(path)))
+
+    def test_untracked_and_unwatched_paths(self, watched, tmp_path_factory):
+        assert not fs_watch.is_unchanged(str(watched / "never_tracked.json"))
+        outside = tmp_path_factory.mktemp("outside") / "b.json"
+        fs_watch.track(str(outside))
+        assert not fs_watch.is_unchanged(str(outside))
+        assert fs_watch.generation(str(outside.parent)) is None
+
+    def test_generation_advances(self, watched):
+        before = fs_watch.generation(str(watched))
+        (watched / "new.json").write_text("{}")
+        assert _eventually(lambda: fs_watch.generation(str(watched)) > before)
+
+
+class TestJsonCacheIntegration:
+
+    def test_reload_after_reported_write(self, watched):
+        path = watched / "state.json"
+        path.write_text(json.dumps({"n": 1}))
+        assert json_cache.load_json_cached(str(path), ttl=0.01) == {"n": 1}
+        time.sleep(0.02)
+        assert json_cache.load_json_cached(str(path), ttl=0.01) == {"n": 1}
+        path.write_text(json.dumps({"n": 2}))
+        assert _eventually(lambda: json_cache.load_json_cached(str(path), ttl=0.01) == {"n": 2})
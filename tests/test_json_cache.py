@@ -0,0 +1,106 @@
+"""
+Test Suite — JSON File Cache
+
+Tests for:
+  - Cache hits within the TTL
+  - Reload when the file's mtime changes
+  - Reload when a same-mtime write changes the size or replaces the file
+  - Custom decoders
+  - Missing-file errors and eviction
+  - Cached directory listings
+"""
+
+import json
+import os
+
+import pytest
+
+from python.helpers.json_cache import clear_cache, listdir_cached, load_json_cached
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def _write(path, data, mtime_ns=None):
+    with open(path, "w") as f:
+        json.dump(data, f)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadJsonCached:
+
+    def test_same_mtime_different_size_reloads(self, tmp_path):
+        path = str(tmp_path / "a.json")
+        _write(path, {"x": 1}, mtime_ns=1_000_000_000)
+        assert load_json_cached(path, ttl=0) == {"x": 1}
+        _write(path, {"x": 12}, mtime_ns=1_000_000_000)
+        assert load_json_cached(path, ttl=0) == {"x": 12}
+
+    def test_same_mtime_replaced_file_reloads(self, tmp_path):
+        path = str(tmp_path / "a.json")
+        _write(path, {"x": 1}, mtime_ns=1_000_000_000)
+        assert load_json_cached(path, ttl=0) == {"x": 1}
+        tmp = str(tmp_path / "a.json.tmp")
+        _write(tmp, {"x": 2}, mtime_ns=1_000_000_000)
+        os.replace(tmp, path)
+        assert load_json_cached(path, ttl=0) == {"x": 2}
+
+    def test_returns_decoded_json(self, tmp_path):
+        path = str(tmp_path / "a.json")
+        _write(path, {"x": 1})
+        assert load_json_cached(path) == {"x": 1}
+
+    def test_same_object_within_ttl(self, tmp_path):
+        path = str(tmp_path / "a.json")
+        _write(path, [1, 2, 3])
+        assert load_json_cached(path) is load_json_cached(path)
+
+    def test_unchanged_mtime_reuses_object_after_ttl(self, tmp_path):
+        path = str(tmp_path / "a.json")
+        _write(path, [1], mtime_ns=1_000_000_000)
+        first = load_json_cached(path, ttl=0)
+        assert load_json_cached(path, ttl=0) is first
+
+    def test_reloads_when_mtime_changes(self, tmp_path):
+        path = str(tmp_path / "a.json")
+        _write(path, {"v": 1}, mtime_ns=1_000_000_000)
+        assert load_json_cached(path, ttl=0) == {"v": 1}
+        _write(path, {"v": 2}, mtime_ns=2_000_000_000)
+        assert load_json_cached(path, ttl=0) == {"v": 2}
+
+    def test_custom_decoder_cached_separately(self, tmp_path):
+        path = str(tmp_path / "a.json")
+        _write(path, {"x": 1})
+        assert load_json_cached(path) == {"x": 1}
+        assert load_json_cached(path, decode=len) == len(b'{"x": 1}')
+        assert load_json_cached(path) == {"x": 1}
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_json_cached(str(tmp_path / "missing.json"))
+
+    def test_deleted_file_raises_after_ttl(self, tmp_path):
+        path = str(tmp_path / "a.json")
+        _write(path, {})
+        load_json_cached(path, ttl=0)
+        os.remove(path)
+        with pytest.raises(FileNotFoundError):
+            load_json_cached(path, ttl=0)
+
+
+class TestListdirCached:
+
+    def test_lists_directory(self, tmp_path):
+        _write(str(tmp_path / "a.json"), {})
+        assert listdir_cached(str(tmp_path)) == ["a.json"]
+
+    def test_cached_within_ttl(self, tmp_path):
+        listdir_cached(str(tmp_path), ttl=60)
+        _write(str(tmp_path / "b.json"), {})
+        assert listdir_cached(str(tmp_path), ttl=60) == []
+        assert listdir_cached(str(tmp_path), ttl=0) == ["b.json"]
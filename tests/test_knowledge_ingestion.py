@@ -8,7 +8,7 @@ Tests for:
   - Claude export parsing
   - Text file parsing
   - Ingestion deduplication
-  - Ingestion history
+  - Ingestion history and status summary
 """
 
 import os
@@ -95,6 +95,24 @@ class TestIngestionHistory:
         history = get_ingestion_history()
         assert isinstance(history, list)
 
+    def test_summary_counts(self, tmp_path, monkeypatch):
+        from python.helpers import knowledge_ingestion
+        status_file = tmp_path / "status.json"
+        status_file.write_text(json.dumps({"records": [
+            {"status": "completed", "chunk_count": 3},
+            {"status": "completed", "chunk_count": 2},
+            {"status": "failed", "chunk_count": 0},
+        ]}))
+        monkeypatch.setattr(knowledge_ingestion, "INGESTION_STATUS_FILE", str(status_file))
+        summary = knowledge_ingestion.get_ingestion_summary()
+        assert summary == {
+            "total_ingested": 3,
+            "total_completed": 2,
+            "total_failed": 1,
+            "total_chunks": 5,
+        }
+        assert knowledge_ingestion.get_ingestion_summary() is summary
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,47 @@
+"""
+Test Suite — Lead Pipeline
+
+Tests for:
+  - Pipeline summary counts
+  - The combined dashboard read matching the individual queries
+"""
+
+import pytest
+
+from python.helpers import lead_pipeline
+
+
+@pytest.fixture
+def leads_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(lead_pipeline, "LEADS_DIR", str(tmp_path))
+    monkeypatch.setattr(lead_pipeline, "LEADS_FILE", str(tmp_path / "leads.json"))
+    return tmp_path
+
+
+class TestPipeline:
+
+    def test_empty_summary(self, leads_dir):
+        summary = lead_pipeline.get_pipeline_summary()
+        assert summary["total"] == 0
+        assert summary["avg_score"] == 0
+        assert summary["by_temperature"] == {"hot": 0, "warm": 0, "cold": 0}
+
+    def test_summary_counts(self, leads_dir):
+        a = lead_pipeline.create_lead("A", channel="telegram")
+        lead_pipeline.create_lead("B", channel="telegram")
+        lead_pipeline.create_lead("C", channel="voice")
+        lead_pipeline.update_lead(a.lead_id, status="contacted", next_followup="2000-01-01T00:00:00+00:00")
+        summary = lead_pipeline.get_pipeline_summary()
+        assert summary["total"] == 3
+        assert summary["by_status"] == {"contacted": 1, "new": 2}
+        assert summary["by_channel"] == {"telegram": 2, "voice": 1}
+        assert summary["followups_due"] == 1
+
+    def test_dashboard_matches_individual_queries(self, leads_dir):
+        for i in range(5):
+            lead = lead_pipeline.create_lead(f"L{i}", email=f"l{i}@example.com")
+        lead_pipeline.update_lead(lead.lead_id, next_followup="2000-01-01T00:00:00+00:00")
+        dashboard = lead_pipeline.get_dashboard(limit=3)
+        assert [l.lead_id for l in dashboard["leads"]] == [l.lead_id for l in lead_pipeline.get_leads(limit=3)]
+        assert dashboard["pipeline"] == lead_pipeline.get_pipeline_summary()
+        assert [l.lead_id for l in dashboard["followups"]] == [lead.lead_id]
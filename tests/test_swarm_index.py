@@ -0,0 +1,132 @@
+"""
+Test Suite — Swarm Index
+
+Tests for:
+  - Aggregating swarms into the index shape
+  - Rebuilding and loading the on-disk index
+  - Rebuilding a stale index when swarm files change behind its back
+  - Decoding swarm files with mistyped fields
+"""
+
+import json
+
+import pytest
+
+from python.helpers import swarm_index, swarm_reader
+from python.helpers.json_cache import clear_cache
+from python.helpers.swarm_records import decode_swarm
+
+
+SWARMS = [
+    {
+        "swarm_id": "sw_old", "name": "old", "status": "completed",
+        "created_at": "2026-01-01T00:00:00", "task_count": 2,
+        "tasks": [
+            {"agent_profile": "coder", "status": "completed", "completed_at": "2026-01-01T00:05:00", "description": "a"},
+            {"agent_profile": "coder", "status": "failed", "completed_at": "2026-01-01T00:06:00",
+             "error": "boom", "description": "b"},
+        ],
+    },
+    {
+        "swarm_id": "sw_new", "name": "new", "status": "running",
+        "created_at": "2026-02-01T00:00:00", "task_count": 1,
+        "tasks": [{"agent_profile": "writer", "status": "running", "description": "c"}],
+    },
+]
+
+RECORDS = [decode_swarm(json.dumps(s).encode()) for s in SWARMS]
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    clear_cache()
+    swarm_dir = tmp_path / "swarms"
+    swarm_dir.mkdir()
+    monkeypatch.setattr(swarm_reader, "SWARM_DIR", str(swarm_dir))
+    monkeypatch.setattr(swarm_index, "INDEX_PATH", str(tmp_path / "swarm_index.json"))
+    monkeypatch.setattr(swarm_index, "_index_memo", None)
+    yield swarm_dir
+    clear_cache()
+
+
+class TestBuildIndex:
+
+    def test_profile_counts(self):
+        index = swarm_index.build_index(RECORDS)
+        assert index["profile_counts"] == {
+            "coder": {"running": 0, "completed": 1, "failed": 1},
+            "writer": {"running": 1, "completed": 0, "failed": 0},
+        }
+
+    def test_swarms_sorted_newest_first(self):
+        index = swarm_index.build_index(RECORDS)
+        assert [s["swarm_id"] for s in index["swarms"]] == ["sw_new", "sw_old"]
+        assert "tasks" not in index["swarms"][0]
+
+    def test_errors_and_completions(self):
+        index = swarm_index.build_index(RECORDS)
+        assert index["errors"] == [{
+            "timestamp": "2026-01-01T00:06:00", "source": "swarm/sw_old",
+            "agent": "coder", "error": "boom", "task": "b",
+        }]
+        assert [c["task"] for c in index["recent_task_completions"]] == ["b", "a"]
+
+
+class TestRebuildIndex:
+
+    def test_load_builds_missing_index(self, paths):
+        for swarm in SWARMS:
+            (paths / f"{swarm['swarm_id']}.json").write_text(json.dumps(swarm))
+        index = swarm_index.load_index()
+        assert len(index["swarms"]) == 2
+        with open(swarm_index.INDEX_PATH) as f:
+            assert json.load(f)["profile_counts"] == index["profile_counts"]
+
+    def test_rebuild_picks_up_new_swarm(self, paths):
+        (paths / "sw_old.json").write_text(json.dumps(SWARMS[0]))
+        assert len(swarm_index.rebuild_index()["swarms"]) == 1
+        (paths / "sw_new.json").write_text(json.dumps(SWARMS[1]))
+        assert len(swarm_index.rebuild_index()["swarms"]) == 2
+
+    def test_load_rebuilds_stale_index(self, paths):
+        (paths / "sw_old.json").write_text(json.dumps(SWARMS[0]))
+        assert len(swarm_index.load_index()["swarms"]) == 1
+        # Another process adds a swarm without going through maybe_rebuild()
+        (paths / "sw_new.json").write_text(json.dumps(SWARMS[1]))
+        assert len(swarm_index.load_index()["swarms"]) == 2
+        (paths / "sw_old.json").unlink()
+        assert [s["swarm_id"] for s in swarm_index.load_index()["swarms"]] == ["sw_new"]
+
+    def test_load_reuses_current_index(self, paths, monkeypatch):
+        (paths / "sw_old.json").write_text(json.dumps(SWARMS[0]))
+        swarm_index.load_index()
+        monkeypatch.setattr(swarm_index, "build_index", lambda swarms: pytest.fail("rebuilt"))
+        assert len(swarm_index.load_index()["swarms"]) == 1
+
+
+class TestSwarmRecords:
+
+    def test_defaults_and_unknown_fields(self):
+        swarm = decode_swarm(b'{"swarm_id": "s", "objective": "x", "tasks": [{"status": "running", "retries": 1}]}')
+        assert swarm.swarm_id == "s"
+        assert swarm.tasks[0].agent_profile == "default"
+        assert swarm.tasks[0].error is None
+
+    def test_mistyped_fields_are_tolerated(self):
+        swarm = decode_swarm(
+            b'{"swarm_id": "s", "name": null, "task_count": "3", "progress": [],'
+            b' "tasks": [{"status": "failed", "error": {"code": 1}, "completed_at": null}, 7]}'
+        )
+        assert swarm.swarm_id == "s"
+        assert swarm.name == ""
+        assert swarm.task_count == 0
+        assert swarm.progress == {}
+        assert len(swarm.tasks) == 1
+        assert swarm.tasks[0].status == "failed"
+        assert swarm.tasks[0].error == "{'code': 1}"
+        assert swarm.tasks[0].completed_at is None
+
+    def test_mistyped_swarm_still_listed(self, paths):
+        (paths / "sw_odd.json").write_text('{"swarm_id": "sw_odd", "name": null, "tasks": []}')
+        (paths / "sw_bad.json").write_text("{not json")
+        assert [s.swarm_id for s in swarm_reader.read_all_swarms(ttl=0)] == ["sw_odd"]
@@ -0,0 +1,55 @@
+"""
+Test Suite — Swarm Reader
+
+Tests for:
+  - Loading every swarm file
+  - Most-recent limit
+  - Skipping unreadable files and missing directories
+"""
+
+import json
+import os
+
+import pytest
+
+from python.helpers import swarm_reader
+from python.helpers.json_cache import clear_cache
+
+
+@pytest.fixture
+def swarm_dir(tmp_path, monkeypatch):
+    clear_cache()
+    monkeypatch.setattr(swarm_reader, "SWARM_DIR", str(tmp_path))
+    yield tmp_path
+    clear_cache()
+
+
+def _write_swarm(directory, swarm_id, mtime):
+    path = directory / f"{swarm_id}.json"
+    path.write_text(json.dumps({"swarm_id": swarm_id, "tasks": []}))
+    os.utime(path, (mtime, mtime))
+
+
+class TestReadAllSwarms:
+
+    def test_reads_every_swarm(self, swarm_dir):
+        for i in range(5):
+            _write_swarm(swarm_dir, f"sw_{i}", 1000 + i)
+        ids = {s.swarm_id for s in swarm_reader.read_all_swarms()}
+        assert ids == {f"sw_{i}" for i in range(5)}
+
+    def test_limit_keeps_most_recent(self, swarm_dir):
+        for i in range(5):
+            _write_swarm(swarm_dir, f"sw_{i}", 1000 + i)
+        swarms = swarm_reader.read_all_swarms(limit=2)
+        assert [s.swarm_id for s in swarms] == ["sw_4", "sw_3"]
+
+    def test_skips_unreadable_and_non_json(self, swarm_dir):
+        _write_swarm(swarm_dir, "sw_ok", 1000)
+        (swarm_dir / "broken.json").write_text("{")
+        (swarm_dir / "notes.txt").write_text("ignored")
+        assert [s.swarm_id for s in swarm_reader.read_all_swarms()] == ["sw_ok"]
+
+    def test_missing_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(swarm_reader, "SWARM_DIR", str(tmp_path / "absent"))
+        assert swarm_reader.read_all_swarms() == []
@@ -0,0 +1,53 @@
+"""
+Test Suite — TKGM Stream
+
+Tests for:
+  - Iterating and counting triples
+  - Iterating temporal metadata
+  - Full-decode fallback without ijson
+"""
+
+import json
+
+import pytest
+
+from python.helpers import tkgm_stream
+
+
+TRIPLES = [
+    {"subject": "Agent Zero", "predicate": "uses", "object": "TKGM", "confidence": 0.5},
+    {"subject": "TKGM", "predicate": "stores", "object": "triples"},
+]
+TEMPORAL = {
+    "f1": {"domain": "code", "created_at": "2026-01-01"},
+    "f2": {"domain": "ops", "created_at": "2026-01-02"},
+}
+
+
+@pytest.fixture
+def files(tmp_path):
+    triples = tmp_path / "tkgm_triples.json"
+    temporal = tmp_path / "tkgm_temporal.json"
+    triples.write_text(json.dumps(TRIPLES))
+    temporal.write_text(json.dumps(TEMPORAL))
+    return str(triples), str(temporal)
+
+
+@pytest.fixture(params=["ijson", "fallback"])
+def backend(request, monkeypatch):
+    if request.param == "fallback":
+        monkeypatch.setattr(tkgm_stream, "ijson", None)
+    elif tkgm_stream.ijson is None:
+        pytest.skip("ijson not installed")
+
+
+class TestTkgmStream:
+
+    def test_iter_triples(self, files, backend):
+        assert list(tkgm_stream.iter_triples(files[0])) == TRIPLES
+
+    def test_count_triples(self, files, backend):
+        assert tkgm_stream.count_triples(files[0]) == 2
+
+    def test_iter_temporal(self, files, backend):
+        assert dict(tkgm_stream.iter_temporal(files[1])) == TEMPORAL
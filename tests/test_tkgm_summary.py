@@ -0,0 +1,85 @@
+"""
+Test Suite — TKGM Summary
+
+Tests for:
+  - Aggregating triples and temporal files across memory subdirectories
+  - Reusing the persisted summary while sources are unchanged
+  - Rebuilding when a source file changes
+  - Caching the TKGM file glob
+  - Picking up new TKGM files in a watched memory directory
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from python.helpers import fs_watch, tkgm_summary
+from python.helpers.json_cache import clear_cache
+
+
+@pytest.fixture
+def memory(tmp_path, monkeypatch):
+    clear_cache()
+    monkeypatch.setattr(tkgm_summary, "MEMORY_DIR", str(tmp_path))
+    monkeypatch.setattr(tkgm_summary, "SUMMARY_PATH", str(tmp_path / "_tkgm_summary.json"))
+    monkeypatch.setattr(tkgm_summary, "_TKGM_PATHS_CACHE", {"t": float("-inf"), "generation": None, "triples": [], "temporal": []})
+    for sub, domain, created in (("a", "code", "2026-01-01"), ("b/c", "ops", "2026-02-01")):
+        directory = tmp_path / sub
+        directory.mkdir(parents=True)
+        (directory / "tkgm_triples.json").write_text(json.dumps([{"subject": "s"}] * 2))
+        (directory / "tkgm_temporal.json").write_text(json.dumps({f"{sub}1": {"domain": domain, "created_at": created}}))
+    yield tmp_path
+    clear_cache()
+
+
+class TestTkgmSummary:
+
+    def test_aggregates_all_files(self, memory):
+        summary = tkgm_summary.get_summary()
+        assert summary["total_triples"] == 4
+        assert summary["total_fragments"] == 2
+        assert summary["domains"] == {
+            "code": {"count": 1, "latest": "2026-01-01"},
+            "ops": {"count": 1, "latest": "2026-02-01"},
+        }
+        assert summary["temporal_coverage"] == {"earliest": "2026-01-01", "latest": "2026-02-01"}
+        assert os.path.exists(tkgm_summary.SUMMARY_PATH)
+
+    def test_reuses_summary_when_unchanged(self, memory, monkeypatch):
+        tkgm_summary.get_summary()
+        monkeypatch.setattr(tkgm_summary, "build_summary", lambda mtimes: pytest.fail("rebuilt"))
+        assert tkgm_summary.get_summary()["total_triples"] == 4
+
+    def test_paths_cached(self, memory):
+        assert len(tkgm_summary.tkgm_paths()["triples"]) == 2
+        (memory / "d").mkdir()
+        (memory / "d" / "tkgm_triples.json").write_text("[]")
+        assert len(tkgm_summary.tkgm_paths()["triples"]) == 2
+        assert len(tkgm_summary.tkgm_paths(ttl=0)["triples"]) == 3
+
+    def test_rebuilds_on_change(self, memory):
+        tkgm_summary.get_summary()
+        path = memory / "a" / "tkgm_triples.json"
+        path.write_text(json.dumps([{"subject": "s"}] * 5))
+        os.utime(path, ns=(1, 1))
+        assert tkgm_summary.get_summary()["total_triples"] == 7
+
+    def test_new_file_in_watched_dir(self, memory, monkeypatch):
+        pytest.importorskip("watchdog")
+        fs_watch.stop()
+        monkeypatch.setattr(fs_watch, "WATCH_DIRS", (str(memory),))
+        monkeypatch.setattr(tkgm_summary, "_summary_memo", None)
+        try:
+            assert fs_watch.generation(str(memory)) is not None
+            assert tkgm_summary.get_summary()["total_fragments"] == 2
+            before = fs_watch.generation(str(memory))
+            (memory / "d").mkdir()
+            (memory / "d" / "tkgm_temporal.json").write_text(json.dumps({"d1": {"domain": "new"}}))
+            deadline = time.monotonic() + 3.0
+            while fs_watch.generation(str(memory)) == before and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert tkgm_summary.get_summary()["total_fragments"] == 3
+        finally:
+            fs_watch.stop()
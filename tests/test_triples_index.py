@@ -0,0 +1,86 @@
+"""
+Test Suite — Triples Index
+
+Tests for:
+  - Substring subject lookup through the trigram index
+  - Short queries and result limits
+  - Rebuilding when a triples file changes
+  - Picking up new triples files in a watched memory directory
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from python.helpers import fs_watch, tkgm_summary, triples_index
+from python.helpers.json_cache import clear_cache
+
+
+A = [
+    {"subject": "Agent Zero", "predicate": "uses", "object": "TKGM"},
+    {"subject": "Telegram Bot", "predicate": "serves", "object": "users"},
+    {"subject": "agent zero", "predicate": "runs", "object": "swarms"},
+]
+B = [
+    {"subject": "Cost Tracker", "predicate": "logs", "object": "spend"},
+    {"subject": "Swarm Agent", "predicate": "reports", "object": "status"},
+]
+
+
+@pytest.fixture
+def memory(tmp_path, monkeypatch):
+    clear_cache()
+    monkeypatch.setattr(tkgm_summary, "MEMORY_DIR", str(tmp_path))
+    monkeypatch.setattr(tkgm_summary, "_TKGM_PATHS_CACHE", {"t": float("-inf"), "generation": None, "triples": [], "temporal": []})
+    monkeypatch.setattr(triples_index, "INDEX_PATH", str(tmp_path / "_triples_trgm.json"))
+    for sub, triples in (("a", A), ("b", B)):
+        (tmp_path / sub).mkdir()
+        (tmp_path / sub / "tkgm_triples.json").write_text(json.dumps(triples))
+    yield tmp_path
+    clear_cache()
+
+
+def _subjects(triples):
+    return sorted(t["subject"] for t in triples)
+
+
+class TestFindTriples:
+
+    def test_substring_case_insensitive(self, memory):
+        assert _subjects(triples_index.find_triples("AGENT")) == ["Agent Zero", "Swarm Agent", "agent zero"]
+
+    def test_no_match(self, memory):
+        assert triples_index.find_triples("nothing here") == []
+
+    def test_short_query(self, memory):
+        assert _subjects(triples_index.find_triples("ot")) == ["Telegram Bot"]
+
+    def test_limit(self, memory):
+        assert len(triples_index.find_triples("a", limit=2)) == 2
+
+    def test_rebuilds_on_change(self, memory):
+        triples_index.find_triples("agent")
+        path = memory / "b" / "tkgm_triples.json"
+        path.write_text(json.dumps(B + [{"subject": "New Agent"}]))
+        os.utime(path, ns=(1, 1))
+        assert "New Agent" in _subjects(triples_index.find_triples("agent"))
+
+    def test_new_file_in_watched_dir(self, memory, monkeypatch):
+        pytest.importorskip("watchdog")
+        fs_watch.stop()
+        monkeypatch.setattr(fs_watch, "WATCH_DIRS", (str(memory),))
+        monkeypatch.setattr(triples_index, "_index_memo", None)
+        try:
+            assert fs_watch.generation(str(memory)) is not None
+            assert "New Agent" not in _subjects(triples_index.find_triples("agent"))
+            before = fs_watch.generation(str(memory))
+            (memory / "c").mkdir()
+            (memory / "c" / "tkgm_triples.json").write_text(json.dumps([{"subject": "New Agent"}]))
+            deadline = time.monotonic() + 3.0
+            while fs_watch.generation(str(memory)) == before and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert "New Agent" in _subjects(triples_index.find_triples("agent"))
+        finally:
+            fs_watch.stop()
@@ -0,0 +1,91 @@
+"""
+Test Suite — Voice AI Call Log
+
+Tests for:
+  - Appending calls and reading the newest first, with limit/offset
+  - Counting calls incrementally
+  - Migrating a legacy call_log.json array
+  - Keeping an unreadable legacy log aside and retrying failed migrations
+"""
+
+import json
+
+import pytest
+
+from python.helpers import voice_ai
+from python.helpers.voice_ai import CallRecord
+
+
+@pytest.fixture
+def call_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(voice_ai, "CALL_LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(voice_ai, "CALL_LOG_FILE", str(tmp_path / "call_log.jsonl"))
+    monkeypatch.setattr(voice_ai, "LEGACY_CALL_LOG_FILE", str(tmp_path / "call_log.json"))
+    monkeypatch.setattr(voice_ai, "TAIL_BLOCK_SIZE", 64)  # force multi-block tail reads
+    monkeypatch.setattr(voice_ai, "_migrated", False)
+    monkeypatch.setattr(voice_ai, "_count_memo", (0, 0))
+    return tmp_path
+
+
+def _record(i: int) -> CallRecord:
+    return CallRecord(
+        call_sid=f"CA{i}",
+        direction="inbound",
+        from_number="+15550000000",
+        to_number="+15551111111",
+        status="completed",
+        created_at=f"2026-01-01T00:00:{i:02d}+00:00",
+    )
+
+
+class TestCallLog:
+
+    def test_empty(self, call_log):
+        assert voice_ai.get_call_log() == []
+        assert voice_ai.get_call_count() == 0
+
+    def test_newest_first_with_limit_and_offset(self, call_log):
+        for i in range(30):
+            voice_ai._append_call(_record(i))
+        assert [c["call_sid"] for c in voice_ai.get_call_log(limit=3)] == ["CA29", "CA28", "CA27"]
+        assert [c["call_sid"] for c in voice_ai.get_call_log(limit=2, offset=5)] == ["CA24", "CA23"]
+        assert len(voice_ai.get_call_log(limit=100)) == 30
+        assert len(voice_ai.get_call_log(limit=None)) == 30
+
+    def test_count_is_incremental(self, call_log):
+        for i in range(5):
+            voice_ai._append_call(_record(i))
+        assert voice_ai.get_call_count() == 5
+        voice_ai._append_call(_record(5))
+        assert voice_ai.get_call_count() == 6
+
+    def test_migrates_legacy_log(self, call_log):
+        legacy = [_record(2).to_dict(), _record(1).to_dict()]
+        (call_log / "call_log.json").write_text(json.dumps(legacy))
+        voice_ai._append_call(_record(3))
+        assert [c["call_sid"] for c in voice_ai.get_call_log()] == ["CA3", "CA2", "CA1"]
+        assert not (call_log / "call_log.json").exists()
+        assert voice_ai.get_call_count() == 3
+
+    @pytest.mark.parametrize("content", ["{not json", '{"calls": []}'])
+    def test_unreadable_legacy_log_is_kept_aside(self, call_log, content):
+        (call_log / "call_log.json").write_text(content)
+        voice_ai._append_call(_record(1))
+        assert (call_log / "call_log.json.corrupt").read_text() == content
+        assert not (call_log / "call_log.json").exists()
+        assert [c["call_sid"] for c in voice_ai.get_call_log()] == ["CA1"]
+
+    def test_failed_migration_is_retried(self, call_log, monkeypatch):
+        (call_log / "call_log.json").write_text(json.dumps([_record(1).to_dict()]))
+        real_replace = voice_ai.os.replace
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(voice_ai.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            voice_ai.get_call_log()
+        assert (call_log / "call_log.json").exists()
+        monkeypatch.setattr(voice_ai.os, "replace", real_replace)
+        assert [c["call_sid"] for c in voice_ai.get_call_log()] == ["CA1"]
+        assert not (call_log / "call_log.json").exists()